@@ -9,17 +9,40 @@ import csv
 import locale
 import os
 import platform
+import argparse
+import sys
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict
 import unicodedata
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import json
 from selenium.common.exceptions import NoSuchElementException
 from credentials_loader import load_credentials
+from film_store import FilmStore, store_path_for
+from deferred_workbook import DeferredWorkbook, flush_all
+from tmdb_cache import TmdbCache
+from film_page_fetcher import FilmPageFetcher
+from browser_pool import BrowserPool, BrowserWorker
+from listing_prefetch import ListingPrefetcher
+from rate_limiter import get_rate_limiter
+from browser_profile import FILM_PAGE_MARKERS, apply_fast_profile, enable_resource_blocking, wait_for_markers
+from scrape_checkpoint import ScrapeCheckpoint
+from film_page_cache import FilmPageCache
+from file_lock import FileLock
+from film_stats import FilmStatsTable, write_top_values
+from run_state import RunState
+from stage_timer import StageTimer
+from output_log import DEBUG, INFO, flush_output_logs, output_log
+from site_urls import canonical_url, site_url
+from taxonomy import (
+    CONTINENTS_COUNTRIES, MPAA_RATINGS, OFFICIAL_RUNTIME_CATEGORIES, RUNTIME_CATEGORIES,
+    continents_for_countries, film_categories, first_mpaa_rating, looks_like_genre, runtime_categories,
+)
 
 # Silence undetected_chromedriver's noisy __del__ that logs WinError 6 on shutdown
 try:
@@ -56,14 +79,18 @@ LIST_DIR = paths['base_dir']
 # Leave None to use a fresh profile each run. Close any open Chrome using that profile before running.
 CHROME_USER_DATA_DIR = None  # e.g. r'C:\Users\bigba\AppData\Local\Google\Chrome\User Data'
 CHROME_PROFILE_DIR = None    # e.g. 'Default' or 'Profile 1'
+FAST_BROWSER_PROFILE = True  # Eager page loads with posters, fonts and ad/analytics scripts blocked (browser_profile.py)
+
+# Set in pass worker processes (PARALLEL_PASSES): shared workbooks merge on flush, logs go to a per-pass file
+IS_PASS_WORKER = False
+OUTPUT_LOG_NAME = 'All_Outputs.csv'  # Pass workers log to their own file, merged in afterwards
+LOG_PREFIX = ''  # Terminal prefix naming the pass a worker process is running
+LOG_LEVEL = 'INFO'  # 'DEBUG' also logs the per-film debug and skip lines
 
 # Define a custom print function
-def print_to_csv(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+def print_to_csv(message: str, level: int = INFO):
+    """Prints a message to the terminal and appends it to All_Outputs.csv (written by a background thread)."""
+    output_log(os.path.join(output_dir, OUTPUT_LOG_NAME), level=LOG_LEVEL).emit(message, level, prefix=LOG_PREFIX)
 
 def calculate_retry_delay(attempt: int, base_delay: float = 5, max_delay: float = 300) -> float:
     """Calculate exponential backoff delay with jitter."""
@@ -100,12 +127,20 @@ MIN_RUNTIME = 40
 EXPECTED_LISTING_POSTERS_PER_PAGE = 72
 CHUNK_SIZE = 1900
 
-# Human-like delays to reduce bot detection (set to (0, 0) to disable for speed)
-HUMAN_DELAY_BETWEEN_FILMS = (0,0)  # seconds between visiting each film page
-HUMAN_DELAY_BETWEEN_PAGES = (0,0)  # seconds between listing pages
+# Per-host request pacing shared with the other scrapers (limits in rate_limiter.DEFAULT_LIMITS)
+RATE_LIMITER = get_rate_limiter(log=print_to_csv)
+
+# Wall-clock time per pipeline stage for the current pass, reported next to Output_Ceilings.txt when it ends
+STAGE_TIMER = StageTimer()
+
+# Fetch film pages with plain HTTP first; the browser is only used on a challenge or missing markers
+USE_HTTP_FILM_FETCH = True
+FILM_WORKERS = 4  # Parallel browser workers for film pages (1 = load them one by one on the main driver)
+LISTING_LOOKAHEAD = 2  # Listing pages fetched ahead on their own browser (0 = load each page when it is needed)
 
 # Run both popular and rating scraping (config)
 scrape_types = ["popular", "rating"]
+PARALLEL_PASSES = True  # Run the scrape_types passes at the same time, one process (and browser pool) each
 # scrape_types = ["rating"]
 # scrape_types = ["popular"]
 
@@ -129,8 +164,15 @@ MAX_MOVIES_SOUTH_AMERICA_RATING = 250
 # File paths
 BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
 WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
+WHITELIST_DB_PATH = store_path_for(WHITELIST_PATH)  # Indexed SQLite copy of the whitelist
 OFFICIAL_WHITELIST_PATH = os.path.join(LIST_DIR, 'Official Whitelist.xlsx')
 ZERO_REVIEWS_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.xlsx')  # Add new path
+TMDB_CACHE_PATH = os.path.join(LIST_DIR, 'tmdb_cache.sqlite3')  # Shared TMDB keyword/genre cache
+TMDB_CACHE_TTL_DAYS = 30  # Re-fetch cached TMDB details after this many days
+CHECKPOINT_PATH_TEMPLATE = os.path.join(LIST_DIR, '5000_checkpoint_{}.json')  # Per-pass scrape state for --resume
+FILM_PAGE_CACHE_PATH = os.path.join(LIST_DIR, 'film_page_cache.sqlite3')  # Parsed film pages shared by both passes
+FILM_PAGE_CACHE_TTL_DAYS = 2  # Backstop only; main() empties the cache at the start of every new run
+CHECKPOINT_EVERY_PAGES = 1  # Listing pages between checkpoints
 
 # Load credentials
 credentials = load_credentials()
@@ -145,129 +187,23 @@ FILTER_KEYWORDS = {
 
 FILTER_GENRES = {'Documentary'}
 
-# Add new constants for MPAA ratings
-MPAA_RATINGS = ['G', 'PG', 'PG-13', 'R', 'NC-17']
-mpaa_stats = {rating: {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                       'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                       'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                       'country_counts': defaultdict(int)} for rating in MPAA_RATINGS}  # Each entry will have Title, Year, tmdbID, and URL fields
-
-# Add new constants for runtime categories
-RUNTIME_CATEGORIES = {
-    '90_Minutes_or_Less': [],
-    '2_Hours_or_Less': [],
-    '3_Hours_or_Greater': [],
-    '4_Hours_or_Greater': [],
-    '100_Minutes_or_Less': [],
-    '150_Minutes_or_More': []
-}
+# Per-list film data for the current pass (each entry has Title, Year, tmdbID and Link), indexed on Link;
+# the rating, runtime and continent names themselves live in taxonomy.py
+run_state = RunState(MPAA_RATINGS, RUNTIME_CATEGORIES, CONTINENTS_COUNTRIES.keys())
+max_movies_5000_stats = run_state.max_movies_5000
+mpaa_stats = run_state.mpaa
+runtime_stats = run_state.runtime
+continent_stats = run_state.continent
+unmapped_countries = run_state.unmapped_countries
 
-# Official runtime lists: use MAX_MOVIES_RUNTIME_OFFICIAL, no stats tracked
-OFFICIAL_RUNTIME_CATEGORIES = {'100_Minutes_or_Less', '150_Minutes_or_More'}
-
-runtime_stats = {
-    '90_Minutes_or_Less': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                     'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                     'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                     'country_counts': defaultdict(int)},  # Each entry will have Title, Year, tmdbID, and URL fields
-    '2_Hours_or_Less': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                      'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                      'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                      'country_counts': defaultdict(int)},  # Each entry will have Title, Year, tmdbID, and URL fields
-    '3_Hours_or_Greater': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                         'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                         'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                         'country_counts': defaultdict(int)},  # Each entry will have Title, Year, tmdbID, and URL fields
-    '4_Hours_or_Greater': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                         'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                         'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                         'country_counts': defaultdict(int)},  # Each entry will have Title, Year, tmdbID, and URL fields
-    '100_Minutes_or_Less': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                         'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                         'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                         'country_counts': defaultdict(int)},
-    '150_Minutes_or_More': {'film_data': [], 'director_counts': defaultdict(int), 'actor_counts': defaultdict(int), 
-                         'decade_counts': defaultdict(int), 'genre_counts': defaultdict(int), 
-                         'studio_counts': defaultdict(int), 'language_counts': defaultdict(int), 
-                         'country_counts': defaultdict(int)}
-}
-
-# Define continents and their associated countries in a case-insensitive manner
-CONTINENTS_COUNTRIES = {
-    'Africa': ['Ivory Coast', 'Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi', 'Cabo Verde', 'Cameroon', 'Central African Republic', 'Chad', 'Comoros', 'Congo, Democratic Republic of the', 'Congo, Republic of the', 'Djibouti', 'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia', 'Gabon', 'Gambia', 'Ghana', 'Guinea', 'Guinea-Bissau', 'Kenya', 'Lesotho', 'Liberia', 'Libya', 'Madagascar', 'Malawi', 'Mali', 'Mauritania', 'Mauritius', 'Morocco', 'Mozambique', 'Namibia', 'Niger', 'Nigeria', 'Rwanda', 'Sao Tome and Principe', 'Senegal', 'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan', 'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe', 'Congo'],
-    'Asia': ['State of Palestine', 'Hong Kong', 'Afghanistan', 'Armenia', 'Azerbaijan', 'Bahrain', 'Bangladesh', 'Bhutan', 'Brunei', 'Cambodia', 'China', 'Cyprus', 'Georgia', 'India', 'Indonesia', 'Iran', 'Iraq', 'Israel', 'Japan', 'Jordan', 'Kazakhstan', 'Kuwait', 'Kyrgyzstan', 'Laos', 'Lebanon', 'Malaysia', 'Maldives', 'Mongolia', 'Myanmar', 'Nepal', 'North Korea', 'Oman', 'Pakistan', 'Palestine', 'Philippines', 'Qatar', 'Russia', 'Saudi Arabia', 'Singapore', 'South Korea', 'Sri Lanka', 'Syrian Arab Republic', 'Taiwan', 'Tajikistan', 'Thailand', 'Timor-Leste', 'Turkey', 'Turkmenistan', 'United Arab Emirates', 'Uzbekistan', 'Vietnam', 'Yemen', 'Syria'],
-    'Europe': ['East Germany', 'North Macedonia', 'Yugoslavia', 'Serbia and Montenegro', 'Czechoslovakia', 'Czechia', 'USSR', 'Albania', 'Latvia', 'Andorra', 'Liechtenstein', 'Armenia', 'Lithuania', 'Austria', 'Luxembourg', 'Azerbaijan', 'Malta', 'Belarus', 'Moldova', 'Belgium', 'Monaco', 'Bosnia and Herzegovina', 'Montenegro', 'Bulgaria', 'Netherlands', 'Croatia', 'Norway', 'Cyprus', 'Poland', 'Czech Republic', 'Portugal', 'Denmark', 'Romania', 'Estonia', 'Russia', 'Finland', 'San Marino', 'Former Yugoslav Republic of Macedonia', 'Serbia', 'France', 'Slovakia', 'Georgia', 'Slovenia', 'Germany', 'Spain', 'Greece', 'Sweden', 'Hungary', 'Switzerland', 'Iceland', 'Ireland', 'Turkey', 'Italy', 'Ukraine', 'Kosovo', 'UK'],
-    'North America': ['Bahamas', 'Guadeloupe', 'Cuba', 'The Bahamas', 'Bermuda', 'Canada', 'The Caribbean', 'Clipperton Island', 'Greenland', 'Mexico', 'Saint Pierre and Miquelon', 'Turks and Caicos Islands', 'USA', 'United States', 'Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama', 'Dominican Republic', 'Haiti', 'Jamaica', 'Martinique', 'Netherlands Antilles', 'Puerto Rico'],
-    'Oceania': ['Australia', 'Fiji', 'Kiribati', 'Marshall Islands', 'Micronesia', 'Nauru', 'New Zealand', 'Palau', 'Papua New Guinea', 'Samoa', 'Solomon Islands', 'Tonga', 'Tuvalu', 'Vanuatu', 'French Polynesia'],
-    'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Bolivarian Republic of Venezuela', 'The Falkland Islands', 'South Georgia and the South Sandwich Islands', 'French Guiana', 'Venezuela'],
-}
-
-# Initialize continent stats with additional counts
-continent_stats = {
-    continent: {
-        'film_data': [],  # Each entry will have Title, Year, tmdbID, and URL fields
-        'country_counts': defaultdict(int),
-        'director_counts': defaultdict(int),
-        'actor_counts': defaultdict(int),
-        'decade_counts': defaultdict(int),
-        'genre_counts': defaultdict(int),
-        'studio_counts': defaultdict(int),
-        'language_counts': defaultdict(int)
-    } for continent in CONTINENTS_COUNTRIES.keys()
-}
-
-# Track unmapped countries
-unmapped_countries = set()
+# Directors, actors, decade, genres, studios, languages and countries of every accepted film, one row per value;
+# the top-10 sections of all stats files are counted from it at save time
+film_stats = FilmStatsTable()
 
 def clear_all_data_structures(processor=None):
     """Clear all global data structures to ensure clean separation between popular and rating runs."""
-    global mpaa_stats, runtime_stats, continent_stats, unmapped_countries, max_movies_5000_stats
-    
-    # Clear MPAA stats
-    for rating in MPAA_RATINGS:
-        mpaa_stats[rating]['film_data'] = []
-        mpaa_stats[rating]['director_counts'] = defaultdict(int)
-        mpaa_stats[rating]['actor_counts'] = defaultdict(int)
-        mpaa_stats[rating]['decade_counts'] = defaultdict(int)
-        mpaa_stats[rating]['genre_counts'] = defaultdict(int)
-        mpaa_stats[rating]['studio_counts'] = defaultdict(int)
-        mpaa_stats[rating]['language_counts'] = defaultdict(int)
-        mpaa_stats[rating]['country_counts'] = defaultdict(int)
-    
-    # Clear runtime stats
-    for category in RUNTIME_CATEGORIES.keys():
-        runtime_stats[category]['film_data'] = []
-        runtime_stats[category]['director_counts'] = defaultdict(int)
-        runtime_stats[category]['actor_counts'] = defaultdict(int)
-        runtime_stats[category]['decade_counts'] = defaultdict(int)
-        runtime_stats[category]['genre_counts'] = defaultdict(int)
-        runtime_stats[category]['studio_counts'] = defaultdict(int)
-        runtime_stats[category]['language_counts'] = defaultdict(int)
-        runtime_stats[category]['country_counts'] = defaultdict(int)
-    
-    # Clear continent stats
-    for continent in CONTINENTS_COUNTRIES.keys():
-        continent_stats[continent]['film_data'] = []
-        continent_stats[continent]['country_counts'] = defaultdict(int)
-        continent_stats[continent]['director_counts'] = defaultdict(int)
-        continent_stats[continent]['actor_counts'] = defaultdict(int)
-        continent_stats[continent]['decade_counts'] = defaultdict(int)
-        continent_stats[continent]['genre_counts'] = defaultdict(int)
-        continent_stats[continent]['studio_counts'] = defaultdict(int)
-        continent_stats[continent]['language_counts'] = defaultdict(int)
-    
-    # Clear unmapped countries
-    unmapped_countries.clear()
-    
-    # Clear max_movies_5000_stats
-    max_movies_5000_stats['film_data'] = []
-    max_movies_5000_stats['director_counts'] = defaultdict(int)
-    max_movies_5000_stats['actor_counts'] = defaultdict(int)
-    max_movies_5000_stats['decade_counts'] = defaultdict(int)
-    max_movies_5000_stats['genre_counts'] = defaultdict(int)
-    max_movies_5000_stats['studio_counts'] = defaultdict(int)
-    max_movies_5000_stats['language_counts'] = defaultdict(int)
-    max_movies_5000_stats['country_counts'] = defaultdict(int)
+    run_state.clear()
+    film_stats.clear()
     
     # Clear processor data if provided
     if processor:
@@ -275,6 +211,14 @@ def clear_all_data_structures(processor=None):
     
     print_to_csv("🧹 Cleared all data structures for clean separation between runs.")
 
+def stats_checkpoint_state() -> Dict:
+    """The global per-category film lists, for a checkpoint."""
+    return run_state.checkpoint_state()
+
+def restore_stats_checkpoint(state: Dict):
+    """Load checkpointed category lists back into the global structures (in place)."""
+    run_state.restore(state)
+
 class RequestsSession:
     def __init__(self):
         self.session = requests.Session()
@@ -289,7 +233,7 @@ class RequestsSession:
         self.session.mount("http://", adapter)
 
     def get(self, url: str, **kwargs) -> requests.Response:
-        return self.session.get(url, **kwargs)
+        return self.session.get(site_url(url), **kwargs)
 
 def normalize_text(text):
     return unicodedata.normalize('NFKC', str(text)).strip()
@@ -316,6 +260,7 @@ def masthead_title_from_driver(driver) -> Optional[str]:
         return None
 
 
+@STAGE_TIMER.timed('rating_count_regex')
 def extract_rating_count_from_film_page(driver) -> Optional[int]:
     """
     Read Letterboxd rating count from the already-loaded film page HTML only (no masthead, no tabs, no full JS extract).
@@ -333,7 +278,8 @@ def extract_rating_count_from_film_page(driver) -> Optional[int]:
 class MovieProcessor:
     def __init__(self):
         self.session = RequestsSession()
-        self.whitelist = None
+        self.tmdb_cache = TmdbCache(TMDB_CACHE_PATH, ttl_days=TMDB_CACHE_TTL_DAYS)
+        self.film_store = None
         self.whitelist_lookup = {}
         self.zero_reviews = None
         self.zero_reviews_lookup = {}
@@ -355,6 +301,8 @@ class MovieProcessor:
         for idx, row in self.blacklist.iterrows():
             if row['Link']:  # Only store entries with URLs
                 self.blacklist_lookup[row['Link']] = True
+        # Additions are buffered and written to blacklist.xlsx in batches
+        self.blacklist = DeferredWorkbook(BLACKLIST_PATH, self.blacklist, log=print_to_csv, shared=IS_PASS_WORKER)
         
         self.added_movies: Set[Tuple[str, str]] = set()
         self.film_data: List[Dict] = []
@@ -374,68 +322,41 @@ class MovieProcessor:
         self.mpaa_counts: Dict[str, int] = {}
 
     def load_whitelist(self):
-        """Load and initialize the whitelist data."""
+        """Load the whitelist from the SQLite film store, importing whitelist.xlsx if it changed."""
         try:
-            # First check if file exists
-            if not os.path.exists(WHITELIST_PATH):
+            if self.film_store is None:
+                self.film_store = FilmStore(WHITELIST_DB_PATH)
+
+            if not os.path.exists(WHITELIST_PATH) and len(self.film_store) == 0:
                 print_to_csv("whitelist.xlsx not found. Creating new file.")
-                self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-                self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                return
-            
-            # Read the file to see what columns it actually has
-            try:
-                # Try to read without specifying names first to see the actual structure
-                temp_df = pd.read_excel(WHITELIST_PATH, header=0)
-                
-                # Check if we have the expected columns
-                if 'Link' in temp_df.columns and 'Title' in temp_df.columns:
-                    # File has the right structure, read it normally
-                    self.whitelist = temp_df
-                else:
-                    # File exists but has wrong structure, create new one
-                    print_to_csv("Whitelist file has wrong structure. Creating new file.")
-                    self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-                    self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                    return
-                    
-            except Exception as e:
-                print_to_csv(f"Error reading whitelist file: {str(e)}")
-                print_to_csv("Creating new whitelist file.")
-                self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-                self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                return
-            
-            # Normalize the data
-            self.whitelist['Title'] = self.whitelist['Title'].apply(normalize_text)
-            self.whitelist['Year'] = self.whitelist['Year'].astype(str).str.strip()
-            # Fill empty links with empty string instead of None
-            self.whitelist['Link'] = self.whitelist['Link'].fillna('')
-            
-            # Create a lookup dictionary for faster matching using URLs as keys
-            self.whitelist_lookup = {}
-            for idx, row in self.whitelist.iterrows():
-                if row['Link']:  # Only store entries with URLs
-                    try:
-                        # Handle null/empty Information values by treating them as empty dictionaries
-                        if pd.isna(row['Information']) or row['Information'] == '':
-                            info = {}
-                        else:
-                            info = json.loads(row['Information']) if isinstance(row['Information'], str) else row['Information']
-                        self.whitelist_lookup[row['Link']] = (info, idx, row['Link'])  # Added URL to tuple
-                    except (json.JSONDecodeError, TypeError):
-                        # If there's any error parsing, treat it as an empty dictionary
-                        info = {}
-                        self.whitelist_lookup[row['Link']] = (info, idx, row['Link'])  # Added URL to tuple
-                        continue
-                
+                self.film_store.export_to_xlsx(WHITELIST_PATH)
+            else:
+                try:
+                    imported = self.film_store.sync_from_xlsx(WHITELIST_PATH)
+                    if imported is not None:
+                        print_to_csv(f"📝 Imported {imported} whitelist rows from whitelist.xlsx into the film store")
+                except Exception as e:
+                    print_to_csv(f"Error reading whitelist file: {str(e)}")
+                    print_to_csv("Continuing with the existing film store contents.")
+
+            # Lookup dictionary keyed on URL: {link: (info, row_id, link)}
+            self.whitelist_lookup = self.film_store.lookup()
+
         except Exception as e:
             print_to_csv(f"Unexpected error loading whitelist: {str(e)}")
-            print_to_csv("Creating new whitelist file.")
-            self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
-
+            self.whitelist_lookup = {}
 
+    def save_whitelist(self):
+        """Export the film store back to whitelist.xlsx so it stays hand-editable."""
+        if self.film_store is None:
+            return
+        try:
+            # The other pass may be exporting at the same time
+            with FileLock(WHITELIST_PATH), STAGE_TIMER.stage('whitelist_xlsx_export'):
+                count = self.film_store.export_to_xlsx(WHITELIST_PATH)
+            print_to_csv(f"📝 Exported {count} whitelist rows to whitelist.xlsx")
+        except Exception as e:
+            print_to_csv(f"Error exporting whitelist: {str(e)}")
 
     def load_zero_reviews(self):
         """Load and initialize the zero reviews data."""
@@ -455,11 +376,14 @@ class MovieProcessor:
                 self.zero_reviews_lookup = {}
                 for idx, row in self.zero_reviews.iterrows():
                     if row['Link']:  # Only store entries with URLs
-                        self.zero_reviews_lookup[row['Link']] = idx
+                        self.zero_reviews_lookup[row['Link']] = True
                     
             else:
                 self.zero_reviews = pd.DataFrame(columns=['Title', 'Year', 'Blank', 'Link'])
                 self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+
+            # Additions/removals are buffered and written to Zero_Reviews.xlsx in batches
+            self.zero_reviews = DeferredWorkbook(ZERO_REVIEWS_PATH, self.zero_reviews, log=print_to_csv, shared=IS_PASS_WORKER)
                 
         except Exception as e:
             print_to_csv(f"ERROR loading zero reviews: {str(e)}")
@@ -483,108 +407,43 @@ class MovieProcessor:
         # Add to film data
         self.film_data.append(film_data)
 
-        # Process runtime category if we have runtime info
-        runtime = info.get('Runtime')
-        if runtime:
-            categories = []
-            if runtime < 91:
-                categories.append('90_Minutes_or_Less')
-            if runtime < 121:
-                categories.append('2_Hours_or_Less')
-            if runtime > 179:
-                categories.append('3_Hours_or_Greater')
-            if runtime > 239:
-                categories.append('4_Hours_or_Greater')
-            if getattr(self, 'scrape_type', 'popular') == 'rating':
-                if runtime < 100:
-                    categories.append('100_Minutes_or_Less')
-                if runtime > 150:
-                    categories.append('150_Minutes_or_More')
-        
-            for category in categories:
-                # Official runtime lists require 5000+ ratings
-                if category in OFFICIAL_RUNTIME_CATEGORIES and info.get('RatingCount', 0) < MIN_RATING_COUNT_OFFICIAL:
-                    continue
-                if add_to_runtime_stats(category, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-                    if category not in OFFICIAL_RUNTIME_CATEGORIES:
-                        self.update_runtime_statistics(info.get('Title'), info.get('Year'), info.get('tmdbID'), None, category)
-
-        # Process MAX_MOVIES_5000 using centralized function
-        if add_to_max_movies_5000(info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-            
-            # Update statistics for max_5000_stats
-            # Directors
-            for director in info.get('Directors', []):
-                max_movies_5000_stats['director_counts'][director] += 1
-
-            # Actors
-            for actor in info.get('Actors', []):
-                max_movies_5000_stats['actor_counts'][actor] += 1
-
-            # Decade
-            decade = info.get('Decade')
-            if decade:
-                max_movies_5000_stats['decade_counts'][decade] += 1
-
-            # Genres
-            for genre in info.get('Genres', []):
-                max_movies_5000_stats['genre_counts'][genre] += 1
+        categories = film_categories(info, include_official_runtime=getattr(self, 'scrape_type', 'popular') == 'rating')
 
-            # Studios
-            for studio in info.get('Studios', []):
-                max_movies_5000_stats['studio_counts'][studio] += 1
-
-            # Languages
-            for language in info.get('Languages', []):
-                max_movies_5000_stats['language_counts'][language] += 1
+        for category in categories['runtime']:
+            # Official runtime lists require 5000+ ratings
+            if category in OFFICIAL_RUNTIME_CATEGORIES and info.get('RatingCount', 0) < MIN_RATING_COUNT_OFFICIAL:
+                continue
+            add_to_runtime_stats(category, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url)
 
-            # Countries
-            for country in info.get('Countries', []):
-                max_movies_5000_stats['country_counts'][country] += 1
+        # Process MAX_MOVIES_5000 using centralized function
+        add_to_max_movies_5000(info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url)
+        film_stats.add_film(film_url, info)
 
         # Process MPAA rating if we have it
-        mpaa_rating = info.get('MPAA')
-        if mpaa_rating and mpaa_rating in MPAA_RATINGS:
-            if add_to_mpaa_stats(mpaa_rating, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-                self.update_statistics(mpaa_rating, film_url)
+        if categories['mpaa']:
+            add_to_mpaa_stats(categories['mpaa'], info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url)
 
         # Process continent data if we have countries
-        countries = info.get('Countries', [])
-        if countries:
-            added_to_continent = set()  # Track which continents the film has been added to
-            for country in countries:
-                country_mapped = False
-                # Normalize country name for case-insensitive comparison
-                normalized_country = country.strip()
-                for continent, country_list in CONTINENTS_COUNTRIES.items():
-                    # Check if normalized country matches any country in the list (case-insensitive)
-                    if any(normalized_country.lower() == c.lower() for c in country_list):
-                        # If continent not already added, add it to stats
-                        if continent not in added_to_continent:
-                            if add_to_continent_stats(continent, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url):
-                                self.update_continent_statistics(continent, film_url)
-                                added_to_continent.add(continent)  # Mark the continent as processed
-                        # Mark country as mapped regardless of whether continent was already added
-                        country_mapped = True
-                        break
-                if not country_mapped:
-                    unmapped_countries.add(country)
-                    # Store country with movie info for better tracking
-                    if not hasattr(self, 'unmapped_countries_movies'):
-                        self.unmapped_countries_movies = {}
-                    if country not in self.unmapped_countries_movies:
-                        self.unmapped_countries_movies[country] = []
-                    movie_info = {
-                        'title': info.get('Title', 'Unknown'),
-                        'year': info.get('Year', 'Unknown'),
-                        'url': film_url
-                    }
-                    if movie_info not in self.unmapped_countries_movies[country]:
-                        self.unmapped_countries_movies[country].append(movie_info)
-                    print_to_csv(f"DEBUG: {info.get('Title')} has unmapped country: '{country}' (URL: {film_url})")
-                    # Additional debugging to check if this might be a genre
-                    if country in ['Animation', 'Comedy', 'Family', 'Drama', 'Action', 'Horror', 'Romance', 'Thriller', 'Crime', 'Adventure', 'Fantasy', 'Science Fiction', 'Mystery', 'War', 'Western', 'Music', 'History']:
-                        print_to_csv(f"WARNING: '{country}' appears to be a genre, not a country! This suggests a data extraction bug.")
+        for continent in categories['continents']:
+            add_to_continent_stats(continent, info.get('Title'), info.get('Year'), info.get('tmdbID'), film_url)
+        for country in categories['unmapped_countries']:
+            unmapped_countries.add(country)
+            # Store country with movie info for better tracking
+            if not hasattr(self, 'unmapped_countries_movies'):
+                self.unmapped_countries_movies = {}
+            if country not in self.unmapped_countries_movies:
+                self.unmapped_countries_movies[country] = []
+            movie_info = {
+                'title': info.get('Title', 'Unknown'),
+                'year': info.get('Year', 'Unknown'),
+                'url': film_url
+            }
+            if movie_info not in self.unmapped_countries_movies[country]:
+                self.unmapped_countries_movies[country].append(movie_info)
+            print_to_csv(f"DEBUG: {info.get('Title')} has unmapped country: '{country}' (URL: {film_url})", DEBUG)
+            # Additional debugging to check if this might be a genre
+            if looks_like_genre(country):
+                print_to_csv(f"WARNING: '{country}' appears to be a genre, not a country! This suggests a data extraction bug.")
 
 
             
@@ -594,32 +453,18 @@ class MovieProcessor:
             return False  # Can't update whitelist without URL
             
         try:
-            # Check if URL already exists in whitelist
-            for row_idx, row in self.whitelist.iterrows():
-                url = row.get('Link', '')
-                if url == film_url:
-                    # Update existing entry
-                    self.whitelist.at[row_idx, 'Information'] = json.dumps(movie_data)
-                    self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
-                    # Save to Excel
-                    self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                    self.load_whitelist()  # Reload to ensure consistency
-                    return True
+            if film_url in self.whitelist_lookup:
+                # Update existing entry (single-row write, title/year stay as stored)
+                _, row_idx, _ = self.whitelist_lookup[film_url]
+                if not self.film_store.update_information(film_url, movie_data):
+                    row_idx = self.film_store.upsert(film_url, film_title, release_year, movie_data)
+                self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
+                return True
             
             # Add new entry if URL not found
-            new_row = pd.DataFrame([{
-                'Title': film_title,
-                'Year': release_year,
-                'Information': json.dumps(movie_data),
-                'Link': film_url
-            }])
-            self.whitelist = pd.concat([self.whitelist, new_row], ignore_index=True)
-            self.whitelist_lookup[film_url] = (movie_data, len(self.whitelist) - 1, film_url)
+            row_idx = self.film_store.upsert(film_url, film_title, release_year, movie_data)
+            self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
             print_to_csv(f"🔗 Added link to whitelist for {film_title}")
-            
-            # Save to Excel
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
-            self.load_whitelist()  # Reload to ensure consistency
             return True
             
         except Exception as e:
@@ -653,7 +498,13 @@ class MovieProcessor:
                 
         return None, None  # Movie not in whitelist
 
+    @STAGE_TIMER.timed()
     def fetch_tmdb_details(self, tmdb_id: str) -> Optional[Tuple[List[str], List[str]]]:
+        # Serve from the on-disk cache (including remembered 404s) before asking TMDB
+        hit, cached = self.tmdb_cache.get(tmdb_id)
+        if hit:
+            return cached
+
         movie_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={TMDB_API_KEY}&append_to_response=keywords"
         response = self.session.get(movie_url)
 
@@ -662,10 +513,13 @@ class MovieProcessor:
             keywords = [keyword['name'] for keyword in movie_data['keywords']['keywords']]
             genre_elements = movie_data['genres']
             genres = [genre['name'] for genre in genre_elements]
+            self.tmdb_cache.put(tmdb_id, keywords, genres)
             return keywords, genres
         else:
             if response.status_code == 401:
                 print_to_csv("Check your API key.")
+            elif response.status_code == 404:
+                self.tmdb_cache.put_not_found(tmdb_id)
             return None
 
     def add_to_blacklist(self, film_title: str, release_year: str, reason: str, film_url: str = None) -> None:
@@ -677,12 +531,9 @@ class MovieProcessor:
         if film_url in self.blacklist_lookup:
             return
             
-        # Add new entry
-        new_row = pd.DataFrame([[film_title, release_year, reason, film_url]],
-                               columns=['Title', 'Year', 'Reason', 'Link'])
-        self.blacklist = pd.concat([self.blacklist, new_row], ignore_index=True)
+        # Add new entry (written to disk with the next batched flush)
+        self.blacklist.append({'Title': film_title, 'Year': release_year, 'Reason': reason, 'Link': film_url})
         self.blacklist_lookup[film_url] = True
-        self.blacklist.to_excel(BLACKLIST_PATH, index=False)
         print_to_csv(f"⚫ {film_title} ({release_year}) added to blacklist {reason}")
 
     def is_whitelisted(self, film_title: str, release_year: str, film_url: str = None) -> bool:
@@ -693,146 +544,6 @@ class MovieProcessor:
         # Only check URL match, never use title/year
         return film_url in self.whitelist_lookup
 
-    def update_runtime_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver_or_data, category: str, film_url: str = None):
-        """Update statistics for the given runtime category."""
-        # Get the most recently added movie from the runtime category's film_data
-        if not runtime_stats[category]['film_data']:
-            return
-            
-        latest_movie = runtime_stats[category]['film_data'][-1]
-        film_title = latest_movie['Title']
-        release_year = latest_movie['Year']
-        film_url = latest_movie['Link']  # Get URL from the movie data
-        
-        # Use cached data if provided (dict), otherwise get from whitelist
-        if isinstance(driver_or_data, dict):
-            movie_info = driver_or_data
-        else:
-            # Get the movie info from whitelist using URL
-            movie_info, _ = self.get_whitelist_data(None, None, film_url)
-            if not movie_info:
-                return
-        
-        # Update directors
-        for director in movie_info.get('Directors', []):
-            runtime_stats[category]['director_counts'][director] += 1
-
-        # Update actors
-        for actor in movie_info.get('Actors', []):
-            runtime_stats[category]['actor_counts'][actor] += 1
-
-        # Update decade
-        decade = movie_info.get('Decade')
-        if decade:
-            runtime_stats[category]['decade_counts'][decade] += 1
-
-        # Update genres
-        for genre in movie_info.get('Genres', []):
-            runtime_stats[category]['genre_counts'][genre] += 1
-
-        # Update studios
-        for studio in movie_info.get('Studios', []):
-            runtime_stats[category]['studio_counts'][studio] += 1
-
-        # Update languages
-        for language in movie_info.get('Languages', []):
-            runtime_stats[category]['language_counts'][language] += 1
-
-        # Update countries
-        for country in movie_info.get('Countries', []):
-            runtime_stats[category]['country_counts'][country] += 1
-
-    def update_statistics(self, mpaa_rating: str, film_url: str = None):
-        """Update statistics for the given MPAA rating."""
-        # Get the most recently added movie from the MPAA rating's film_data
-            
-        latest_movie = mpaa_stats[mpaa_rating]['film_data'][-1]
-        film_title = latest_movie['Title']
-        release_year = latest_movie['Year']
-        film_url = latest_movie['Link']  # Get URL from the movie data
-        
-        # Get the movie info from whitelist using URL
-        movie_info, _ = self.get_whitelist_data(None, None, film_url)
-        if not movie_info:
-            return
-        
-        # Update directors
-        for director in movie_info.get('Directors', []):
-            mpaa_stats[mpaa_rating]['director_counts'][director] += 1
-
-        # Update actors
-        for actor in movie_info.get('Actors', []):
-            mpaa_stats[mpaa_rating]['actor_counts'][actor] += 1
-
-        # Update decade
-        decade = movie_info.get('Decade')
-        if decade:
-            mpaa_stats[mpaa_rating]['decade_counts'][decade] += 1
-
-        # Update genres
-        for genre in movie_info.get('Genres', []):
-            mpaa_stats[mpaa_rating]['genre_counts'][genre] += 1
-
-        # Update studios
-        for studio in movie_info.get('Studios', []):
-            mpaa_stats[mpaa_rating]['studio_counts'][studio] += 1
-
-        # Update languages
-        for language in movie_info.get('Languages', []):
-            mpaa_stats[mpaa_rating]['language_counts'][language] += 1
-
-        # Update countries
-        for country in movie_info.get('Countries', []):
-            mpaa_stats[mpaa_rating]['country_counts'][country] += 1
-
-    def update_continent_statistics(self, continent: str, film_url: str = None):
-        """Update statistics for the given continent."""
-        if not film_url:
-            print_to_csv("WARNING: No film URL provided for continent statistics update")
-            return
-
-        # Get the most recently added movie from the continent's film_data
-        if not continent_stats[continent]['film_data']:
-            return
-            
-        latest_movie = continent_stats[continent]['film_data'][-1]
-        film_title = latest_movie['Title']
-        release_year = latest_movie['Year']
-        
-        # Get the movie info from whitelist
-        movie_info, _ = self.get_whitelist_data(film_title, release_year, film_url)
-        if not movie_info:
-            return
-
-        # Update directors
-        for director in movie_info.get('Directors', []):
-            continent_stats[continent]['director_counts'][director] += 1
-
-        # Update actors
-        for actor in movie_info.get('Actors', []):
-            continent_stats[continent]['actor_counts'][actor] += 1
-
-        # Update decade
-        decade = movie_info.get('Decade')
-        if decade:
-            continent_stats[continent]['decade_counts'][decade] += 1
-
-        # Update genres
-        for genre in movie_info.get('Genres', []):
-            continent_stats[continent]['genre_counts'][genre] += 1
-
-        # Update studios
-        for studio in movie_info.get('Studios', []):
-            continent_stats[continent]['studio_counts'][studio] += 1
-
-        # Update languages
-        for language in movie_info.get('Languages', []):
-            continent_stats[continent]['language_counts'][language] += 1
-
-        # Update countries
-        for country in movie_info.get('Countries', []):
-            continent_stats[continent]['country_counts'][country] += 1
-
     def is_blacklisted(self, film_title: str, release_year: str = None, film_url: str = None, driver = None) -> bool:
         """Check if a movie is blacklisted using URL as primary identifier."""
         if not film_url:
@@ -863,19 +574,15 @@ class MovieProcessor:
             if film_url in self.zero_reviews_lookup:
                 return
                 
-            # Create new row
-            new_row = pd.DataFrame([{
+            # Queue new row (written to disk with the next batched flush)
+            self.zero_reviews.append({
                 'Title': film_title,
                 'Year': release_year,
                 'Blank': '',
                 'Link': film_url
-            }])
-            # Add to DataFrame
-            self.zero_reviews = pd.concat([self.zero_reviews, new_row], ignore_index=True)
+            })
             # Add to lookup
-            self.zero_reviews_lookup[film_url] = len(self.zero_reviews) - 1
-            # Save to Excel
-            self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+            self.zero_reviews_lookup[film_url] = True
                 
         except Exception as e:
             print_to_csv(f"ERROR adding to zero reviews: {str(e)}")
@@ -896,13 +603,10 @@ class MovieProcessor:
             return
         try:
             if film_url in self.zero_reviews_lookup:
-                idx_to_remove = self.zero_reviews_lookup[film_url]
-                # Remove the row
-                self.zero_reviews = self.zero_reviews.drop(idx_to_remove)
+                # Queue removal of the row
+                self.zero_reviews.remove(film_url)
                 # Remove from lookup
                 del self.zero_reviews_lookup[film_url]
-                # Save the updated DataFrame
-                self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
                 print_to_csv(f"🗑️  Removed {film_title} from zero reviews list (found on early popular page).")
         except Exception as e:
             print_to_csv(f"ERROR removing from zero reviews: {str(e)}")
@@ -917,14 +621,10 @@ class MovieProcessor:
             if film_url in self.zero_reviews_lookup:
                 # 1 in 10 chance to remove the entry after finding it
                 if random.random() < (1/10):
-                    # Get the index from lookup
-                    idx_to_remove = self.zero_reviews_lookup[film_url]
-                    # Remove the row
-                    self.zero_reviews = self.zero_reviews.drop(idx_to_remove)
+                    # Queue removal of the row
+                    self.zero_reviews.remove(film_url)
                     # Remove from lookup
                     del self.zero_reviews_lookup[film_url]
-                    # Save the updated DataFrame
-                    self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
                     print_to_csv(f"🗑️  Removed {film_title} from zero reviews list")
                 return True
             return False
@@ -933,6 +633,28 @@ class MovieProcessor:
             print_to_csv(f"ERROR checking zero reviews: {str(e)}")
             return False
 
+    def flush_pending_writes(self):
+        """Write buffered blacklist/zero-reviews changes and stop their periodic flushers."""
+        for workbook in (self.blacklist, self.zero_reviews):
+            if isinstance(workbook, DeferredWorkbook):
+                with STAGE_TIMER.stage('workbook_flush'):
+                    workbook.close()
+
+    CHECKPOINT_FIELDS = ('film_data', 'rejected_data', 'unfiltered_approved', 'unfiltered_denied',
+                         'director_counts', 'actor_counts', 'decade_counts', 'genre_counts', 'studio_counts',
+                         'language_counts', 'country_counts', 'rating_counts', 'mpaa_counts')
+
+    def checkpoint_state(self) -> Dict:
+        state = {field: getattr(self, field) for field in self.CHECKPOINT_FIELDS}
+        state['added_movies'] = [list(movie) for movie in self.added_movies]
+        return state
+
+    def restore_checkpoint_state(self, state: Dict):
+        for field in self.CHECKPOINT_FIELDS:
+            if field in state:
+                setattr(self, field, state[field])
+        self.added_movies = {tuple(movie) for movie in state.get('added_movies', [])}
+
     def clear_processor_data(self):
         """Clear all processor data structures for clean separation between runs."""
         self.added_movies.clear()
@@ -954,7 +676,7 @@ class MovieProcessor:
         
         print_to_csv("🧹 Cleared processor data structures.")
 
-def setup_webdriver():
+def setup_webdriver(fast: bool = FAST_BROWSER_PROFILE):
     """Create Chrome driver using undetected-chromedriver to avoid Cloudflare/captcha detection."""
     def _detect_chrome_major_version():
         try:
@@ -999,11 +721,15 @@ def setup_webdriver():
         "safebrowsing.enabled": True,
     }
     options.add_experimental_option("prefs", prefs)
+    if fast:
+        apply_fast_profile(options)
     chrome_major = _detect_chrome_major_version()
     if chrome_major:
         driver = uc.Chrome(options=options, use_subprocess=True, version_main=chrome_major)
     else:
         driver = uc.Chrome(options=options, use_subprocess=True)
+    if fast:
+        enable_resource_blocking(driver, log=print_to_csv)
     return driver
 
 def format_time(seconds):
@@ -1019,6 +745,7 @@ def format_time(seconds):
     else:
         return f"{seconds}s"
 
+@STAGE_TIMER.timed()
 def extract_all_movie_data(driver) -> Optional[Dict]:
     """Extract all movie data in a single JavaScript execution for maximum efficiency."""
     try:
@@ -1201,24 +928,10 @@ def extract_mpaa_rating(driver) -> Optional[str]:
         if not usa_ratings:
             return None
         
-        # Check if ANY USA rating exists and is not unrated
-        # If there are any rated releases, use the most appropriate one
-        rating_map = {
-            'R': 'R',
-            'PG-13': 'PG-13',
-            'PG': 'PG',
-            'G': 'G',
-            'NC-17': 'NC-17',
-            'X': 'NC-17',  # Historical rating
-            'M': 'PG',     # Historical rating
-            'GP': 'PG',    # Historical rating
-        }
-        
-        # First, look for any rated releases (non-NR)
-        for rating in usa_ratings:
-            if rating.upper() not in ['NR', 'NOT RATED', 'UNRATED']:
-                if rating in rating_map:
-                    return rating_map[rating]
+        # Use the first rated (non-NR) USA release; historical ratings map onto their modern equivalent
+        rating = first_mpaa_rating(usa_ratings)
+        if rating:
+            return rating
         
         # If all USA releases were unrated, skip this movie entirely
         # This means the movie was never rated by the MPAA in the USA
@@ -1230,17 +943,35 @@ def extract_mpaa_rating(driver) -> Optional[str]:
             print_to_csv(f"Error extracting MPAA rating: {str(e)}")
         return None
 
-# Initialize stats for MAX_MOVIES_5000
-max_movies_5000_stats = {
-    'film_data': [],  # Each entry will have Title, Year, tmdbID, and URL fields
-    'director_counts': defaultdict(int),
-    'actor_counts': defaultdict(int),
-    'decade_counts': defaultdict(int),
-    'genre_counts': defaultdict(int),
-    'studio_counts': defaultdict(int),
-    'language_counts': defaultdict(int),
-    'country_counts': defaultdict(int)
-}
+def load_film_page(driver, film_url: str) -> Dict:
+    """
+    Load a film page in driver and extract it without touching any scraper state, so it can run
+    on a pool worker. Returns a dict whose 'status' is 'ok', 'error_page', 'zero_reviews' or
+    'low_ratings'; 'ok' results carry movie_data and masthead_title.
+    """
+    with STAGE_TIMER.stage('rate_limit_wait'):
+        RATE_LIMITER.acquire(film_url)
+    with STAGE_TIMER.stage('driver.get'):
+        driver.get(site_url(film_url))
+    with STAGE_TIMER.stage('webdriver_wait'):
+        wait_for_markers(driver, FILM_PAGE_MARKERS)
+
+    try:
+        page_title = driver.title
+        if "not found" in page_title.lower() or "error" in page_title.lower():
+            return {'status': 'error_page', 'page_title': page_title}
+    except Exception:
+        pass
+
+    rating_quick = extract_rating_count_from_film_page(driver)
+    if rating_quick == 0:
+        return {'status': 'zero_reviews'}
+    if rating_quick is not None and rating_quick < MIN_RATING_COUNT:
+        return {'status': 'low_ratings', 'rating_count': rating_quick}
+
+    movie_data = extract_all_movie_data(driver)
+    masthead_title = masthead_title_from_driver(driver) if movie_data else None
+    return {'status': 'ok', 'movie_data': movie_data, 'masthead_title': masthead_title}
 
 def add_to_max_movies_5000(film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
     """
@@ -1249,21 +980,7 @@ def add_to_max_movies_5000(film_title: str, release_year: str, tmdb_id: str, fil
     Note: Duplicate checking is now done earlier in the process.
     """
 
-    if not film_url:
-        return False
-
-    # Check if we've reached the limit
-    if len(max_movies_5000_stats['film_data']) >= MAX_MOVIES_5000:
-        return False
-
-    # Add the movie
-    max_movies_5000_stats['film_data'].append({
-        'Title': film_title,  # For reference only
-        'Year': release_year,  # For reference only
-        'tmdbID': tmdb_id,
-        'Link': film_url  # Primary identifier
-    })
-    return True
+    return max_movies_5000_stats['film_data'].add(film_title, release_year, tmdb_id, film_url, limit=MAX_MOVIES_5000)
 
 def add_to_continent_stats(continent: str, film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
     """
@@ -1280,13 +997,7 @@ def add_to_continent_stats(continent: str, film_title: str, release_year: str, t
         bool: True if the movie was added, False otherwise
     """
     # Add the movie without any limits - we'll apply limits later when saving
-    continent_stats[continent]['film_data'].append({
-        'Title': film_title,
-        'Year': release_year,
-        'tmdbID': tmdb_id,
-        'Link': film_url
-    })
-    return True
+    return continent_stats[continent]['film_data'].add(film_title, release_year, tmdb_id, film_url)
 
 def add_to_runtime_stats(category: str, film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
     """
@@ -1303,13 +1014,7 @@ def add_to_runtime_stats(category: str, film_title: str, release_year: str, tmdb
         bool: True if the movie was added, False otherwise
     """
     # Add the movie without any limits - we'll apply limits later when saving
-    runtime_stats[category]['film_data'].append({
-        'Title': film_title,
-        'Year': release_year,
-        'tmdbID': tmdb_id,
-        'Link': film_url
-    })
-    return True
+    return runtime_stats[category]['film_data'].add(film_title, release_year, tmdb_id, film_url)
 
 def add_to_mpaa_stats(rating: str, film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
     """
@@ -1326,16 +1031,13 @@ def add_to_mpaa_stats(rating: str, film_title: str, release_year: str, tmdb_id:
         bool: True if the movie was added, False otherwise
     """
     # Add the movie without any limits - we'll apply limits later when saving
-    mpaa_stats[rating]['film_data'].append({
-        'Title': film_title,
-        'Year': release_year,
-        'tmdbID': tmdb_id,
-        'Link': film_url
-    })
-    return True
+    return mpaa_stats[rating]['film_data'].add(film_title, release_year, tmdb_id, film_url)
 
 class LetterboxdScraper:
-    def __init__(self, scrape_type="popular"):
+    CHECKPOINT_COUNTERS = ('total_titles', 'processed_titles', 'valid_movies_count', 'top_movies_count',
+                           'rejected_movies_count', 'unknown_continent_films')
+
+    def __init__(self, scrape_type="popular", checkpoint: Optional[ScrapeCheckpoint] = None):
         self.driver = setup_webdriver()
         self.driver.maximize_window()  # Full-screen looks more like real user, less likely to be flagged
         time.sleep(1)  # Let window settle before navigating
@@ -1377,11 +1079,55 @@ class LetterboxdScraper:
         self.recovery_attempts = 0
         self.max_recovery_attempts = 10
         self.processed_movies_on_current_page = set()  # Track movies processed on current page
-        # Last /film/... URL from the bottom of the previous listing page (detect volatile sort / pagination gaps)
-        self._listing_last_url_prev_page: Optional[str] = None
+        # Listing pages are loaded ahead of the film consumer; its snapshot cache holds the previous page's rows
+        # (used to detect volatile sort / pagination gaps)
+        self.listing_worker = BrowserWorker(0, setup_webdriver) if LISTING_LOOKAHEAD > 0 else None
+        self.listing_prefetcher = ListingPrefetcher(
+            lambda page_num: self._load_listing_page_and_collect(page_num, self.listing_worker),
+            lookahead=LISTING_LOOKAHEAD,
+            log=print_to_csv,
+        )
+        # HTTP-first film page loads (records which path served each film)
+        self.film_fetcher = FilmPageFetcher(log=print_to_csv)
+        # Film pages parsed by either pass (the other one may be running in another process)
+        self.page_cache = FilmPageCache(FILM_PAGE_CACHE_PATH, ttl_days=FILM_PAGE_CACHE_TTL_DAYS)
+        # Film pages for a listing page are loaded in parallel; results are consumed in listing order
+        self.film_pool = BrowserPool(FILM_WORKERS, setup_webdriver, log=print_to_csv) if FILM_WORKERS > 1 else None
+        # Scrape state is saved every CHECKPOINT_EVERY_PAGES pages so a new process can --resume
+        self.checkpoint = checkpoint
         
         print_to_csv("Initialized Letterboxd Scraper.")
 
+    def checkpoint_state(self) -> Dict:
+        """
+        Everything needed to continue this pass in a new process. Taken between listing pages, so
+        page_number is the next page to load and every film on earlier pages is already counted
+        (the processed URLs are the Links in the stats film lists).
+        """
+        return {
+            'scrape_type': self.scrape_type,
+            'page_number': self.page_number,
+            'scraper': {name: getattr(self, name) for name in self.CHECKPOINT_COUNTERS},
+            'processor': self.processor.checkpoint_state(),
+            'stats': stats_checkpoint_state(),
+        }
+
+    def save_checkpoint(self):
+        if self.checkpoint is not None and self.checkpoint.save(self.checkpoint_state()):
+            print_to_csv(f"💾 Checkpoint saved: {self.scrape_type} page {self.page_number}, {self.valid_movies_count} accepted")
+
+    def restore_checkpoint(self, state: Dict):
+        """Continue a pass from a checkpoint written by checkpoint_state()."""
+        for name in self.CHECKPOINT_COUNTERS:
+            if name in state['scraper']:
+                setattr(self, name, state['scraper'][name])
+        self.processor.restore_checkpoint_state(state['processor'])
+        restore_stats_checkpoint(state['stats'])
+        self.page_number = state['page_number']
+        self.last_successful_page = self.page_number
+        print_to_csv(f"♻️ Resuming {self.scrape_type} from page {self.page_number} "
+                     f"with {self.valid_movies_count} films already accepted")
+
     @staticmethod
     def _normalize_listing_film_url(film_url: Optional[str]) -> str:
         """Stable comparison for list poster hrefs (strip query, trailing slash, compare film slug)."""
@@ -1416,7 +1162,7 @@ class LetterboxdScraper:
         wait_time = min(30, 5 + (self.recovery_attempts * 10))
         print_to_csv(f"🔄 Attempting browser recovery (attempt {self.recovery_attempts}/{self.max_recovery_attempts})...")
         print_to_csv(f"⏳ Waiting {wait_time} seconds before attempting recovery...")
-        time.sleep(wait_time)
+        STAGE_TIMER.sleep(wait_time, 'recovery_sleep')
         
         try:
             # Close the crashed driver
@@ -1439,7 +1185,7 @@ class LetterboxdScraper:
             print_to_csv(f"📝 Note: Duplicate prevention will skip any movies already processed in this session.")
             
             # Navigate to the recovery page
-            self.driver.get(recovery_url)
+            self.driver.get(site_url(recovery_url))
             
             # Wait for page to load
             WebDriverWait(self.driver, 15).until(
@@ -1465,19 +1211,29 @@ class LetterboxdScraper:
         self.current_url = url
         self.last_successful_page = page_number
 
-    def _collect_film_entries_from_poster_containers(self, film_containers) -> List[dict]:
+    def _listing_browser_responsive(self, worker: Optional[BrowserWorker]) -> bool:
+        return self.is_browser_responsive() if worker is None else worker.is_responsive()
+
+    def _recover_listing_browser(self, worker: Optional[BrowserWorker]) -> bool:
+        """Recover the main driver, or restart the prefetch browser (the next page load starts it again)."""
+        if worker is None:
+            return self.recover_browser()
+        worker.reset_driver()
+        return True
+
+    def _collect_film_entries_from_poster_containers(self, film_containers, worker: Optional[BrowserWorker] = None) -> List[dict]:
         """Parse li.posteritem elements into the same dicts used by scrape_movies."""
         film_data_list: List[dict] = []
         for container in film_containers:
             try:
-                if not self.is_browser_responsive():
+                if not self._listing_browser_responsive(worker):
                     print_to_csv("🚨 Browser crash detected while processing movies! Attempting recovery...")
-                    if not self.recover_browser():
+                    if not self._recover_listing_browser(worker):
                         print_to_csv("❌ Browser recovery failed. Exiting scraping.")
                         raise RuntimeError("Browser recovery failed")
                     break
                 anchor = container.find_element(By.CSS_SELECTOR, 'a[href*="/film/"]')
-                film_url = anchor.get_attribute('href')
+                film_url = canonical_url(anchor.get_attribute('href'))
 
                 film_title = None
                 film_title = container.get_attribute('data-item-full-display-name')
@@ -1531,11 +1287,11 @@ class LetterboxdScraper:
                                 release_year = last_part
                                 film_title = ' '.join(title_parts[:-1]).strip()
 
-                    is_blacklisted = self.processor.is_blacklisted(None, None, film_url, None)
+                    # Blacklist membership is checked when the film is processed: this page may be
+                    # prefetched LISTING_LOOKAHEAD pages early, before films ahead of it are blacklisted
                     film_data_list.append({
                         'title': film_title,
                         'url': film_url,
-                        'is_blacklisted': is_blacklisted,
                         'release_year': release_year
                     })
                 else:
@@ -1545,7 +1301,7 @@ class LetterboxdScraper:
                             f"Available data: data-item-full-display-name='{container.get_attribute('data-item-full-display-name')}', "
                             f"data-item-name='{container.get_attribute('data-item-name')}', anchor-title='{anchor.get_attribute('title')}'"
                         )
-                        print_to_csv(f"   Debug: {debug_info}")
+                        print_to_csv(f"   Debug: {debug_info}", DEBUG)
                     except Exception:
                         pass
                     self.processor.rejected_data.append([film_title, None, None, 'Missing title or URL'])
@@ -1556,12 +1312,13 @@ class LetterboxdScraper:
                 continue
         return film_data_list
 
-    def _load_listing_page_and_collect(self, page_num: int) -> Tuple[Optional[List[dict]], bool]:
+    def _load_listing_page_and_collect(self, page_num: int, worker: Optional[BrowserWorker] = None) -> Tuple[Optional[List[dict]], bool]:
         """
         Navigate to /films/.../page/{page_num}/, wait for posters, return film entries.
         Returns (entries, abort_scrape). entries is None if this page should be skipped (load/container failure);
         entries may be an empty list if the page loaded but no rows parsed.
-        On success calls update_state_tracking(page_num, url).
+        Runs on the main driver, or on the prefetch worker's browser when worker is given. On success on the
+        main driver calls update_state_tracking(page_num, url); prefetched pages are tracked when consumed.
         """
         url = f'{self.base_url}page/{page_num}/'
         print_to_csv(f"\nLoading page {page_num}: {url}")
@@ -1569,17 +1326,21 @@ class LetterboxdScraper:
         page_retries = 30
         for retry in range(page_retries):
             try:
-                if not self.is_browser_responsive():
+                if not self._listing_browser_responsive(worker):
                     print_to_csv("🚨 Browser crash detected! Attempting recovery...")
-                    if not self.recover_browser():
+                    if not self._recover_listing_browser(worker):
                         print_to_csv("❌ Browser recovery failed. Exiting scraping.")
                         return None, True
                     continue
 
-                self.driver.get(url)
+                driver = self.driver if worker is None else worker.driver
+                with STAGE_TIMER.stage('rate_limit_wait'):
+                    RATE_LIMITER.acquire(url)
+                with STAGE_TIMER.stage('driver.get'):
+                    driver.get(site_url(url))
 
                 try:
-                    page_title = self.driver.title
+                    page_title = driver.title
                     print_to_csv(f"Page loaded: {page_title}")
 
                     if "not found" in page_title.lower() or "error" in page_title.lower():
@@ -1587,29 +1348,29 @@ class LetterboxdScraper:
                         return None, False
                 except Exception as e:
                     print_to_csv(f"Warning: Could not get page title: {str(e)}")
-                    if not self.is_browser_responsive():
+                    if not self._listing_browser_responsive(worker):
                         print_to_csv("🚨 Browser crash detected during page load! Attempting recovery...")
-                        if not self.recover_browser():
+                        if not self._recover_listing_browser(worker):
                             print_to_csv("❌ Browser recovery failed. Exiting scraping.")
                             return None, True
                         continue
 
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
-                )
+                with STAGE_TIMER.stage('webdriver_wait'):
+                    WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
+                    )
 
-                current_url = self.driver.current_url
+                current_url = canonical_url(driver.current_url)
                 if current_url != url and "page" not in current_url:
                     print_to_csv(f"⚠️ Page redirected from {url} to {current_url}")
 
-                self.update_state_tracking(page_num, url)
-                if HUMAN_DELAY_BETWEEN_PAGES[1] > 0:
-                    time.sleep(random.uniform(*HUMAN_DELAY_BETWEEN_PAGES))
+                if worker is None:
+                    self.update_state_tracking(page_num, url)
                 break
             except Exception as e:
-                if not self.is_browser_responsive():
+                if not self._listing_browser_responsive(worker):
                     print_to_csv("🚨 Browser crash detected during page load! Attempting recovery...")
-                    if not self.recover_browser():
+                    if not self._recover_listing_browser(worker):
                         print_to_csv("❌ Browser recovery failed. Exiting scraping.")
                         return None, True
                     continue
@@ -1628,22 +1389,24 @@ class LetterboxdScraper:
                 else:
                     print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {page_num}: {str(e)} - waiting {delay:.1f}s...")
 
-                time.sleep(delay)
+                STAGE_TIMER.sleep(delay)
 
         film_containers = []
         container_retries = 35
         for retry in range(container_retries):
             try:
-                if not self.is_browser_responsive():
+                if not self._listing_browser_responsive(worker):
                     print_to_csv("🚨 Browser crash detected while finding containers! Attempting recovery...")
-                    if not self.recover_browser():
+                    if not self._recover_listing_browser(worker):
                         print_to_csv("❌ Browser recovery failed. Exiting scraping.")
                         return None, True
                     continue
 
-                film_containers = WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.posteritem'))
-                )
+                driver = self.driver if worker is None else worker.driver
+                with STAGE_TIMER.stage('webdriver_wait'):
+                    film_containers = WebDriverWait(driver, 15).until(
+                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.posteritem'))
+                    )
 
                 n = len(film_containers)
                 print_to_csv(f"Found {n} film containers on attempt {retry + 1}")
@@ -1656,17 +1419,21 @@ class LetterboxdScraper:
                     f"reloading listing page... (Attempt {retry + 1}/{container_retries})"
                 )
                 delay = calculate_retry_delay(retry, base_delay=3)
-                time.sleep(delay)
-                self.driver.get(url)
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
-                )
-                time.sleep(2)
+                STAGE_TIMER.sleep(delay)
+                with STAGE_TIMER.stage('rate_limit_wait'):
+                    RATE_LIMITER.acquire(url)
+                with STAGE_TIMER.stage('driver.get'):
+                    driver.get(site_url(url))
+                with STAGE_TIMER.stage('webdriver_wait'):
+                    WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
+                    )
+                STAGE_TIMER.sleep(2)
                 continue
             except Exception as e:
-                if not self.is_browser_responsive():
+                if not self._listing_browser_responsive(worker):
                     print_to_csv("🚨 Browser crash detected while finding containers! Attempting recovery...")
-                    if not self.recover_browser():
+                    if not self._recover_listing_browser(worker):
                         print_to_csv("❌ Browser recovery failed. Exiting scraping.")
                         return None, True
                     continue
@@ -1685,9 +1452,10 @@ class LetterboxdScraper:
                 else:
                     print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)} - waiting {delay:.1f}s...")
 
-                time.sleep(delay)
-                self.driver.refresh()
-                time.sleep(2)
+                STAGE_TIMER.sleep(delay)
+                with STAGE_TIMER.stage('driver.get'):
+                    driver.refresh()
+                STAGE_TIMER.sleep(2)
 
         n = len(film_containers)
         if n != EXPECTED_LISTING_POSTERS_PER_PAGE:
@@ -1700,7 +1468,7 @@ class LetterboxdScraper:
         print_to_csv(f"\n{f' Page {page_num} ':=^100}")
 
         try:
-            film_data_list = self._collect_film_entries_from_poster_containers(film_containers)
+            film_data_list = self._collect_film_entries_from_poster_containers(film_containers, worker)
         except RuntimeError:
             return None, True
 
@@ -1716,11 +1484,12 @@ class LetterboxdScraper:
         so the displaced film can appear again; duplicate URLs are still skipped by session logic.
         Returns (possibly refreshed list for page P, stop_entire_scrape).
         """
-        if page_num <= 1 or not film_data_list or not self._listing_last_url_prev_page:
+        prev_snapshot = self.listing_prefetcher.snapshot(page_num - 1)
+        if page_num <= 1 or not film_data_list or not prev_snapshot:
             return film_data_list, False
 
         first_norm = self._normalize_listing_film_url(film_data_list[0]['url'])
-        prev_last_norm = self._normalize_listing_film_url(self._listing_last_url_prev_page)
+        prev_last_norm = self._normalize_listing_film_url(prev_snapshot[-1]['url'])
         if first_norm != prev_last_norm:
             return film_data_list, False
 
@@ -1739,7 +1508,7 @@ class LetterboxdScraper:
         if self._process_film_data_list(prev_list):
             return film_data_list, True
         if prev_list:
-            self._listing_last_url_prev_page = prev_list[-1]['url']
+            self.listing_prefetcher.remember(prev_p, prev_list)
 
         refreshed, abort = self._load_listing_page_and_collect(page_num)
         if abort:
@@ -1749,10 +1518,64 @@ class LetterboxdScraper:
             return film_data_list, False
         return refreshed, False
 
+    def _film_page_task(self, film_url: str):
+        """Pool task: HTTP first, then the worker's own browser."""
+        def task(worker):
+            page = self.page_cache.get(film_url)
+            if page is not None:
+                page['served_by'] = 'cache'
+                return page
+            if USE_HTTP_FILM_FETCH:
+                movie_data, masthead_title = self.film_fetcher.fetch(film_url)
+                if movie_data is not None:
+                    page = {'status': 'ok', 'movie_data': movie_data, 'masthead_title': masthead_title, 'served_by': 'http'}
+                    self._remember_film_page(film_url, page)
+                    return page
+            page = load_film_page(worker.driver, film_url)
+            page['served_by'] = 'selenium'
+            self._remember_film_page(film_url, page)
+            return page
+        return task
+
+    def _remember_film_page(self, film_url: str, page: Dict):
+        """Share a film page result with the other pass; error pages and pages missing a runtime are not kept."""
+        if page['status'] == 'ok' and not (page.get('movie_data') and page['movie_data'].get('Runtime') is not None):
+            return
+        if page['status'] in ('ok', 'zero_reviews', 'low_ratings'):
+            self.page_cache.put(film_url, page)
+
+    def _submit_film_page_loads(self, film_data_list: List[dict]) -> Dict[str, int]:
+        """Queue pool loads for the films on this page that will need their film page. Returns {url: ticket}."""
+        if self.film_pool is None:
+            return {}
+        tickets = {}
+        for film_data in film_data_list:
+            film_url = film_data['url']
+            if (
+                self.processor.is_blacklisted(None, None, film_url, None)
+                or film_url in tickets
+                or run_state.seen(film_url)
+                or film_url in self.processed_movies_on_current_page
+                or self.processor.is_whitelisted(None, None, film_url)
+                or (self.page_number >= 31 and self.processor.is_in_zero_reviews(film_url))
+            ):
+                continue
+            tickets[film_url] = self.film_pool.submit(self._film_page_task(film_url))
+        return tickets
+
     def _process_film_data_list(self, film_data_list: List[dict]) -> bool:
         """
         Run the per-film pipeline for one listing page. Returns True if scraping should stop (goal reached or fatal).
         """
+        tickets = self._submit_film_page_loads(film_data_list)
+        try:
+            return self._process_film_entries(film_data_list, tickets)
+        finally:
+            # Results nobody collected (cap reached, film skipped) are dropped
+            if tickets:
+                self.film_pool.cancel(tickets.values())
+
+    def _process_film_entries(self, film_data_list: List[dict], tickets: Dict[str, int]) -> bool:
         for film_data in film_data_list:
             if self.valid_movies_count >= MAX_MOVIES:
                 print_to_csv(f"✅ {MAX_MOVIES} unique movies successfully scraped. Stopping scraping.")
@@ -1765,7 +1588,7 @@ class LetterboxdScraper:
             whitelist_info, _ = self.processor.get_whitelist_data(None, None, film_url)
 
             if film_url in self.processed_movies_on_current_page:
-                print_to_csv(f"⚠️ {film_title} was already processed on this page. Skipping.")
+                print_to_csv(f"⚠️ {film_title} was already processed on this page. Skipping.", DEBUG)
                 continue
 
             self.total_titles += 1
@@ -1779,14 +1602,14 @@ class LetterboxdScraper:
                 self.rejected_movies_count += 1
                 continue
 
-            if film_data['is_blacklisted']:
+            if self.processor.is_blacklisted(None, None, film_url, None):
                 print_to_csv(f"❌ {film_title} was not added due to being blacklisted.")
                 self.processor.rejected_data.append([film_title, release_year, None, 'Blacklisted'])
                 self.rejected_movies_count += 1
                 continue
 
-            if any(movie['Link'] == film_url for movie in max_movies_5000_stats['film_data']):
-                print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.")
+            if run_state.seen(film_url):
+                print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.", DEBUG)
                 continue
 
             if self.processor.is_whitelisted(None, None, film_url):
@@ -1797,41 +1620,39 @@ class LetterboxdScraper:
                 continue
 
             movie_retries = 15
+            force_browser = False
+            ticket = tickets.pop(film_url, None)
             for retry in range(movie_retries):
                 try:
-                    if not self.is_browser_responsive():
-                        print_to_csv("🚨 Browser crash detected while loading movie page! Attempting recovery...")
-                        if not self.recover_browser():
-                            print_to_csv("❌ Browser recovery failed. Skipping this movie.")
-                            break
-
-                    if HUMAN_DELAY_BETWEEN_FILMS[1] > 0:
-                        time.sleep(random.uniform(*HUMAN_DELAY_BETWEEN_FILMS))
-
-                    self.driver.get(film_url)
-
-                    try:
-                        page_title = self.driver.title
-                        if "not found" in page_title.lower() or "error" in page_title.lower():
-                            print_to_csv(f"⚠️ Movie page appears to be an error page: {page_title}")
+                    # Try the server-rendered HTML first; only fall back to the browser when needed
+                    movie_data, masthead_title = None, None
+                    if ticket is not None:
+                        # First attempt uses the pool's load; retries go through the main driver
+                        pending, ticket = ticket, None
+                        page = self.film_pool.result(pending)
+                        movie_data, masthead_title, stop = self._apply_film_page_result(page, film_title, release_year, film_url)
+                        if stop:
                             break
-                    except Exception:
-                        pass
-
-                    rating_quick = extract_rating_count_from_film_page(self.driver)
-                    if rating_quick == 0:
-                        print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
-                        self.processor.add_to_zero_reviews(film_title, release_year, film_url)
-                        self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
-                        self.rejected_movies_count += 1
-                        break
-                    if rating_quick is not None and rating_quick < MIN_RATING_COUNT:
-                        print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {rating_quick} ratings.")
-                        self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient ratings (< 1000)'])
-                        self.rejected_movies_count += 1
-                        break
-
-                    movie_data = extract_all_movie_data(self.driver)
+                        if movie_data is not None and page['served_by'] in ('selenium', 'cache'):
+                            self.film_fetcher.record(film_url, page['served_by'])
+                    else:
+                        cached = None if force_browser else self.page_cache.get(film_url)
+                        if cached is not None:
+                            movie_data, masthead_title, stop = self._apply_film_page_result(cached, film_title, release_year, film_url)
+                            if stop:
+                                break
+                            if movie_data is not None:
+                                self.film_fetcher.record(film_url, 'cache')
+                        if movie_data is None and USE_HTTP_FILM_FETCH and not force_browser:
+                            movie_data, masthead_title = self.film_fetcher.fetch(film_url)
+                            if movie_data is not None:
+                                self._remember_film_page(film_url, {'status': 'ok', 'movie_data': movie_data, 'masthead_title': masthead_title})
+                        if movie_data is None:
+                            movie_data, masthead_title, stop = self._load_film_page_in_browser(film_title, release_year, film_url)
+                            if stop:
+                                break
+                            if movie_data is not None:
+                                self.film_fetcher.record(film_url, 'selenium')
 
                     if not movie_data:
                         print_to_csv(f"❌ Failed to extract data for {film_title}")
@@ -1852,7 +1673,6 @@ class LetterboxdScraper:
                         self.rejected_movies_count += 1
                         break
 
-                    masthead_title = masthead_title_from_driver(self.driver)
                     display_title = masthead_title if masthead_title else film_title
                     movie_data['Title'] = display_title
                     movie_data['Link'] = film_url
@@ -1865,9 +1685,11 @@ class LetterboxdScraper:
                         runtime_retries = 5
                         print_to_csv(f"⚠️ {film_title} skipped due to missing runtime")
                         self.rejected_movies_count += 1
+                        # Retry in the browser in case the runtime is rendered client-side
+                        force_browser = True
                         if retry < runtime_retries - 1:
                             print_to_csv(f"Retrying... (Attempt {retry + 1}/{runtime_retries})")
-                            time.sleep(2)
+                            STAGE_TIMER.sleep(2)
                             continue
                         break
 
@@ -1899,10 +1721,44 @@ class LetterboxdScraper:
                         else:
                             print_to_csv(f"Retry {retry + 1}/{movie_retries} processing movie: {str(e)} - waiting {delay:.1f}s...")
 
-                        time.sleep(delay)
+                        STAGE_TIMER.sleep(delay)
                         continue
         return False
 
+    def _load_film_page_in_browser(self, film_title: str, release_year: str, film_url: str) -> Tuple[Optional[Dict], Optional[str], bool]:
+        """
+        Load a film page in Selenium and extract it. Returns (movie_data, masthead_title, stop);
+        stop=True means the film was handled (rejected or skipped) and the caller should move on.
+        """
+        if not self.is_browser_responsive():
+            print_to_csv("🚨 Browser crash detected while loading movie page! Attempting recovery...")
+            if not self.recover_browser():
+                print_to_csv("❌ Browser recovery failed. Skipping this movie.")
+                return None, None, True
+
+        page = load_film_page(self.driver, film_url)
+        self._remember_film_page(film_url, page)
+        return self._apply_film_page_result(page, film_title, release_year, film_url)
+
+    def _apply_film_page_result(self, page: Dict, film_title: str, release_year: str, film_url: str) -> Tuple[Optional[Dict], Optional[str], bool]:
+        """Record the rejections load_film_page reports; returns (movie_data, masthead_title, stop)."""
+        status = page['status']
+        if status == 'error_page':
+            print_to_csv(f"⚠️ Movie page appears to be an error page: {page['page_title']}")
+            return None, None, True
+        if status == 'zero_reviews':
+            print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
+            self.processor.add_to_zero_reviews(film_title, release_year, film_url)
+            self.processor.rejected_data.append([film_title, release_year, None, 'Zero reviews'])
+            self.rejected_movies_count += 1
+            return None, None, True
+        if status == 'low_ratings':
+            print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {page['rating_count']} ratings.")
+            self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient ratings (< 1000)'])
+            self.rejected_movies_count += 1
+            return None, None, True
+        return page.get('movie_data'), page.get('masthead_title'), False
+
     def reset_crash_counter(self):
         """Reset the crash counter when a movie is successfully processed after recovery."""
         if self.recovery_attempts > 0:
@@ -1928,8 +1784,8 @@ class LetterboxdScraper:
             tmdb_id = info.get('tmdbID')  # Only for display purposes
             
             # Check if URL has already been processed in this scrape session
-            if any(movie['Link'] == film_url for movie in max_movies_5000_stats['film_data']):
-                print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.")
+            if run_state.seen(film_url):
+                print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.", DEBUG)
                 return False
                         
             # Process using URL as primary identifier
@@ -1945,17 +1801,14 @@ class LetterboxdScraper:
                     if self.scrape_type == 'rating':
                         runtime_val = info.get('Runtime')
                         rating_count_val = info.get('RatingCount', 0) or 0
-                        official_categories = []
-                        if isinstance(runtime_val, (int, float)):
-                            if runtime_val < 100:
-                                official_categories.append('100_Minutes_or_Less')
-                            if runtime_val > 150:
-                                official_categories.append('150_Minutes_or_More')
+                        official_categories = [
+                            cat for cat in runtime_categories(runtime_val, include_official=True)
+                            if cat in OFFICIAL_RUNTIME_CATEGORIES
+                        ]
                         for cat in official_categories:
-                            if cat in OFFICIAL_RUNTIME_CATEGORIES:
-                                if len(runtime_stats[cat]['film_data']) < MAX_MOVIES_RUNTIME_OFFICIAL and rating_count_val < MIN_RATING_COUNT_OFFICIAL:
-                                    force_refresh_for_official = True
-                                    break
+                            if len(runtime_stats[cat]['film_data']) < MAX_MOVIES_RUNTIME_OFFICIAL and rating_count_val < MIN_RATING_COUNT_OFFICIAL:
+                                force_refresh_for_official = True
+                                break
                 except Exception:
                     force_refresh_for_official = False
 
@@ -1973,10 +1826,12 @@ class LetterboxdScraper:
                                 print_to_csv("❌ Browser recovery failed. Skipping this movie.")
                                 return False
                         
-                        self.driver.get(film_url)
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property=\"og:title\"]'))
-                        )
+                        with STAGE_TIMER.stage('driver.get'):
+                            self.driver.get(site_url(film_url))
+                        with STAGE_TIMER.stage('webdriver_wait'):
+                            WebDriverWait(self.driver, 10).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property=\"og:title\"]'))
+                            )
                         #time.sleep(random.uniform(1.0, 1.5))
                         
                         # Extract basic info
@@ -1989,8 +1844,9 @@ class LetterboxdScraper:
                         # Extract rating count
                         rating_count = 0
                         try:
-                            page_source = self.driver.page_source
-                            match = re.search(r'ratingCount":(\d+)', page_source)
+                            with STAGE_TIMER.stage('rating_count_regex'):
+                                page_source = self.driver.page_source
+                                match = re.search(r'ratingCount":(\d+)', page_source)
                             if match:
                                 rating_count = int(match.group(1))
                             
@@ -2006,9 +1862,10 @@ class LetterboxdScraper:
                         # Extract runtime
                         runtime = None
                         try:
-                            runtime_element = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
-                            )
+                            with STAGE_TIMER.stage('webdriver_wait'):
+                                runtime_element = WebDriverWait(self.driver, 10).until(
+                                    EC.presence_of_element_located((By.CSS_SELECTOR, 'p.text-link.text-footer'))
+                                )
                             runtime_text = runtime_element.text
                             match = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
                             if match:
@@ -2181,9 +2038,11 @@ class LetterboxdScraper:
                 break
 
             cur_page = self.page_number
-            film_data_list, abort = self._load_listing_page_and_collect(cur_page)
+            film_data_list, abort = self.listing_prefetcher.get(cur_page)
             if abort:
                 return
+            if film_data_list is not None and self.listing_worker is not None:
+                self.update_state_tracking(cur_page, f'{self.base_url}page/{cur_page}/')
             if film_data_list is None:
                 self.page_number += 1
                 continue
@@ -2201,8 +2060,10 @@ class LetterboxdScraper:
                 return
 
             if film_data_list:
-                self._listing_last_url_prev_page = film_data_list[-1]['url']
+                self.listing_prefetcher.remember(cur_page, film_data_list)
             self.page_number += 1
+            if cur_page % CHECKPOINT_EVERY_PAGES == 0:
+                self.save_checkpoint()
 
     def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str, cached_data: Dict = None):
         """Process a movie that has been approved."""
@@ -2345,74 +2206,31 @@ class LetterboxdScraper:
                 'Link': film_url
             })
 
+            # Record the film's directors, actors, genres etc. once for every list it ends up on
+            film_stats.add_film(film_url, cached_data)
+
             # Add to max_movies_5000_stats only if we haven't reached the limit
-            if len(max_movies_5000_stats['film_data']) < MAX_MOVIES_5000:
-                max_movies_5000_stats['film_data'].append({
-                    'Title': film_title,
-                    'Year': release_year,
-                    'tmdbID': tmdb_id,
-                    'Link': film_url
-                })
-                # Update statistics for this movie using cached data
-                self.update_max_movies_5000_statistics(film_title, release_year, tmdb_id, cached_data, film_url)
+            add_to_max_movies_5000(film_title, release_year, tmdb_id, film_url)
             
             # Add to MPAA stats if applicable (use cached data if available)
             mpaa_rating = cached_data.get('MPAA') if cached_data else extract_mpaa_rating(self.driver)
             if mpaa_rating in MPAA_RATINGS:
-                # Check if we've reached the limit for this rating
-                max_limit = (
-                    self.max_movies_g if mpaa_rating == 'G' else
-                    self.max_movies_nc17 if mpaa_rating == 'NC-17' else
-                    MAX_MOVIES_MPAA
+                # Only up to the number of films the saved list keeps
+                mpaa_stats[mpaa_rating]['film_data'].add(
+                    film_title, release_year, tmdb_id, film_url, limit=self._list_limit('mpaa', mpaa_rating)
                 )
-                if len(mpaa_stats[mpaa_rating]['film_data']) < max_limit:
-                    mpaa_stats[mpaa_rating]['film_data'].append({
-                        'Title': film_title,
-                        'Year': release_year,
-                        'tmdbID': tmdb_id,
-                        'Link': film_url
-                    })
-                    # Update MPAA statistics
-                    self.processor.update_statistics(mpaa_rating, film_url)
 
             # Add to runtime stats if applicable (runtime already extracted from cached_data or page)
             if runtime is not None:
-                categories = []
-                if runtime < 91:
-                    categories.append('90_Minutes_or_Less')
-                if runtime < 121:
-                    categories.append('2_Hours_or_Less')
-                if runtime > 179:
-                    categories.append('3_Hours_or_Greater')
-                if runtime > 239:
-                    categories.append('4_Hours_or_Greater')
-                if self.scrape_type == 'rating':
-                    if runtime < 100:
-                        categories.append('100_Minutes_or_Less')
-                    if runtime > 150:
-                        categories.append('150_Minutes_or_More')
+                categories = runtime_categories(runtime, include_official=self.scrape_type == 'rating')
 
                 for category in categories:
                     # Official runtime lists use a higher rating threshold (5000)
                     if category in OFFICIAL_RUNTIME_CATEGORIES and rating_count < MIN_RATING_COUNT_OFFICIAL:
                         continue
-                    # Check if we've reached the limit for this category
-                    max_limit = (
-                        MAX_MOVIES_RUNTIME_OFFICIAL if category in OFFICIAL_RUNTIME_CATEGORIES else
-                        self.max_180 if category == '3_Hours_or_Greater' else
-                        self.max_240 if category == '4_Hours_or_Greater' else
-                        MAX_MOVIES_RUNTIME
+                    runtime_stats[category]['film_data'].add(
+                        film_title, release_year, tmdb_id, film_url, limit=self._list_limit('runtime', category)
                     )
-                    if len(runtime_stats[category]['film_data']) < max_limit:
-                        runtime_stats[category]['film_data'].append({
-                            'Title': film_title,
-                            'Year': release_year,
-                            'tmdbID': tmdb_id,
-                            'Link': film_url
-                        })
-                        # Update runtime statistics only for non-official categories
-                        if category not in OFFICIAL_RUNTIME_CATEGORIES:
-                            self.processor.update_runtime_statistics(film_title, release_year, tmdb_id, cached_data if cached_data else self.driver, category, film_url)
 
             # Add to continent stats if applicable (use cached data)
             try:
@@ -2422,33 +2240,10 @@ class LetterboxdScraper:
                     country_elements = self.driver.find_elements(By.CSS_SELECTOR, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]')
                     countries = [country.get_attribute('textContent').strip() for country in country_elements if country.get_attribute('textContent').strip()]
                 
-                added_to_continent = set()  # Track which continents the film has been added to
-                for country_name in countries:
-                    if country_name:
-                        # Check if the country belongs to any continent
-                        for continent, continent_countries in CONTINENTS_COUNTRIES.items():
-                            # Check if normalized country matches any country in the list (case-insensitive)
-                            if any(country_name.lower() == c.lower() for c in continent_countries):
-                                # If continent not already added, add it to stats
-                                if continent not in added_to_continent:
-                                    # Check if we've reached the limit for this continent
-                                    max_limit = (
-                                        self.max_movies_africa if continent == 'Africa' else
-                                        self.max_movies_oceania if continent == 'Oceania' else
-                                        self.max_movies_south_america if continent == 'South America' else
-                                        MAX_MOVIES_CONTINENT
-                                    )
-                                    if len(continent_stats[continent]['film_data']) < max_limit:
-                                        continent_stats[continent]['film_data'].append({
-                                            'Title': film_title,
-                                            'Year': release_year,
-                                            'tmdbID': tmdb_id,
-                                            'Link': film_url
-                                        })
-                                        # Update continent statistics
-                                        self.processor.update_continent_statistics(continent, film_url)
-                                        added_to_continent.add(continent)  # Mark the continent as processed
-                                break
+                for continent in continents_for_countries(countries):
+                    continent_stats[continent]['film_data'].add(
+                        film_title, release_year, tmdb_id, film_url, limit=self._list_limit('continent', continent)
+                    )
             except Exception:
                 pass
 
@@ -2457,69 +2252,44 @@ class LetterboxdScraper:
             self.processor.rejected_data.append([film_title, release_year, None, f'Error processing: {str(e)}'])
             return False
 
-    def update_max_movies_5000_statistics(self, film_title: str, release_year: str, tmdb_id: str, cached_data: Dict = None, film_url: str = None):
-        """Update statistics for the given movie for MAX_MOVIES_5000 using cached data."""
-        if not film_url:
-            print_to_csv("WARNING: No film URL provided for statistics update")
-            return
+    def _list_limit(self, kind: str, name: str) -> int:
+        """Number of films the saved mpaa/runtime/continent list keeps."""
+        if kind == 'mpaa':
+            return self.max_movies_g if name == 'G' else self.max_movies_nc17 if name == 'NC-17' else MAX_MOVIES_MPAA
+        if kind == 'runtime':
+            return int(
+                MAX_MOVIES_RUNTIME_OFFICIAL if name in OFFICIAL_RUNTIME_CATEGORIES else
+                self.max_180 if name == '3_Hours_or_Greater' else
+                self.max_240 if name == '4_Hours_or_Greater' else
+                MAX_MOVIES_RUNTIME
+            )
+        return int(
+            self.max_movies_africa if name == 'Africa' else
+            self.max_movies_oceania if name == 'Oceania' else
+            self.max_movies_south_america if name == 'South America' else
+            MAX_MOVIES_CONTINENT
+        )
 
-        # Find the movie in film_data
-        movie_data = next((movie for movie in max_movies_5000_stats['film_data'] 
-                          if movie['Title'] == film_title and movie['Year'] == release_year), None)
-        
-        if not movie_data:
-            return
+    def compute_top_stats(self) -> Dict:
+        """
+        Top-10 attribute values for every stats file, from one grouped count over film_stats.
+        Keys are '5000', 'mpaa:<rating>', 'runtime:<category>' and 'continent:<continent>', each over the capped list.
+        """
+        memberships = {'5000': [movie['Link'] for movie in max_movies_5000_stats['film_data']]}
+        for rating in MPAA_RATINGS:
+            memberships[f'mpaa:{rating}'] = [movie['Link'] for movie in mpaa_stats[rating]['film_data'][:self._list_limit('mpaa', rating)]]
+        for category in RUNTIME_CATEGORIES:
+            if category not in OFFICIAL_RUNTIME_CATEGORIES:
+                memberships[f'runtime:{category}'] = [movie['Link'] for movie in runtime_stats[category]['film_data'][:self._list_limit('runtime', category)]]
+        for continent in CONTINENTS_COUNTRIES.keys():
+            memberships[f'continent:{continent}'] = [movie['Link'] for movie in continent_stats[continent]['film_data'][:self._list_limit('continent', continent)]]
 
-        # Use cached data if available (much faster than Selenium queries)
-        if cached_data:
-            # Directors
-            for director in cached_data.get('Directors', []):
-                if director:
-                    max_movies_5000_stats['director_counts'][director] += 1
-
-            # Actors
-            for actor in cached_data.get('Actors', []):
-                if actor:
-                    max_movies_5000_stats['actor_counts'][actor] += 1
-
-            # Decade
-            decade = cached_data.get('Decade')
-            if decade:
-                max_movies_5000_stats['decade_counts'][decade] += 1
-
-            # Genres
-            genres = cached_data.get('Genres', [])
-            for genre in genres:
-                if genre:
-                    max_movies_5000_stats['genre_counts'][genre] += 1
-            movie_data['Genres'] = genres
-
-            # Studios
-            studios = cached_data.get('Studios', [])
-            for studio in studios:
-                if studio:
-                    max_movies_5000_stats['studio_counts'][studio] += 1
-            movie_data['Studios'] = studios
-
-            # Languages
-            languages = cached_data.get('Languages', [])
-            for language in languages:
-                if language:
-                    max_movies_5000_stats['language_counts'][language] += 1
-            movie_data['Languages'] = languages
-
-            # Countries
-            countries = cached_data.get('Countries', [])
-            for country in countries:
-                if country:
-                    max_movies_5000_stats['country_counts'][country] += 1
-                    # Debug: Check if this looks like a genre instead of a country
-                    if country in ['Animation', 'Comedy', 'Family', 'Drama', 'Action', 'Horror', 'Romance', 'Thriller', 'Crime', 'Adventure', 'Fantasy', 'Science Fiction', 'Mystery', 'War', 'Western', 'Music', 'History']:
-                        print_to_csv(f"WARNING: Found genre '{country}' in country extraction for {movie_data.get('Title', 'Unknown')}")
-            movie_data['Countries'] = countries
-        else:
-            # Fallback to old method if cached_data not available (shouldn't happen)
-            print_to_csv(f"WARNING: No cached data provided for {film_title}, statistics may be incomplete")
+        # Films restored from a checkpoint were never recorded in this process; the whitelist has them
+        for link in {link for links in memberships.values() for link in links}:
+            if link not in film_stats:
+                movie_data, _ = self.processor.get_whitelist_data(None, None, link)
+                film_stats.add_film(link, movie_data)
+        return film_stats.top_values(memberships)
 
     def save_max_movies_5000_results(self):
         """Save results for MAX_MOVIES_5000."""
@@ -2569,40 +2339,12 @@ class LetterboxdScraper:
             file.write("-- Feature film spin-offs from television shows must contain original material, not just recap or compilation of existing material.\n")
             file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
 
-            # Mapping for display names
-            category_display_names = {
-                'director_counts': 'directors',
-                'actor_counts': 'actors',
-                'decade_counts': 'decades',
-                'genre_counts': 'genres',
-                'studio_counts': 'studios',
-                'language_counts': 'languages',
-                'country_counts': 'countries'
-            }
-
-            # Write top 10 statistics for this category
-            for category_name, counts in max_movies_5000_stats.items():
-                if category_name != 'film_data':
-                    display_name = category_display_names.get(category_name, category_name.replace('_counts', ''))
-                    file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                    sorted_items = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]
-                    for item, count in sorted_items:
-                        file.write(f"{item}: {count}\n")
-                    file.write("\n")
+            # Write top 10 statistics (decades are listed as plain years in this file)
+            write_top_values(file, self.top_stats['5000'], decade_suffix='')
             file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
 
     def save_continent_results(self):
         """Save results for each continent."""
-        category_display_names = {
-            'director_counts': 'directors',
-            'actor_counts': 'actors',
-            'decade_counts': 'decades',
-            'genre_counts': 'genres',
-            'studio_counts': 'studios',
-            'language_counts': 'languages',
-            'country_counts': 'countries'
-        }
-
         def get_ordinal(n):
             if 10 <= n % 100 <= 20:
                 suffix = 'th'
@@ -2616,21 +2358,11 @@ class LetterboxdScraper:
         for continent in CONTINENTS_COUNTRIES.keys():
             continent_data = continent_stats[continent]['film_data']
             if continent_data:
-                # Determine the max limit based on the continent
-                max_limit = (
-                    self.max_movies_africa if continent == 'Africa' else
-                    self.max_movies_oceania if continent == 'Oceania' else
-                    self.max_movies_south_america if continent == 'South America' else
-                    MAX_MOVIES_CONTINENT
-                )
                 # Limit to top results
-                top_data = continent_data[:int(max_limit)]  # Ensure it does not exceed the max
+                top_data = continent_data[:self._list_limit('continent', continent)]  # Ensure it does not exceed the max
                 if top_data:
                     # Limit the film_data to only the top results
-                    continent_stats[continent]['film_data'] = top_data
-                    
-                    # Recalculate statistics from the LIMITED data BEFORE writing
-                    self.recalculate_continent_statistics(continent)
+                    continent_stats[continent]['film_data'].truncate(len(top_data))
                     
                     # Save movie data in chunks
                     num_chunks = (len(top_data) + CHUNK_SIZE - 1) // CHUNK_SIZE
@@ -2664,108 +2396,15 @@ class LetterboxdScraper:
                         file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
 
                         # Write top 10 statistics for this continent
-                        for category_name in category_display_names.keys():  # Use the same order as defined in the dictionary
-                            if category_name in continent_stats[continent]:  # Only process if the category exists
-                                counts = continent_stats[continent][category_name]
-                                display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                                file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                                for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                                    file.write(f"{item}: {count}\n")
-                                file.write("\n")
+                        write_top_values(file, self.top_stats[f'continent:{continent}'])
                         file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
 
-    def recalculate_continent_statistics(self, continent):
-        """Recalculate statistics for a continent based on the limited film data."""
-        # Reset all statistics
-        continent_stats[continent]['director_counts'] = defaultdict(int)
-        continent_stats[continent]['actor_counts'] = defaultdict(int)
-        continent_stats[continent]['decade_counts'] = defaultdict(int)
-        continent_stats[continent]['genre_counts'] = defaultdict(int)
-        continent_stats[continent]['studio_counts'] = defaultdict(int)
-        continent_stats[continent]['language_counts'] = defaultdict(int)
-        continent_stats[continent]['country_counts'] = defaultdict(int)
-        
-        # Recalculate statistics from the limited film data
-        for movie in continent_stats[continent]['film_data']:
-            # Get movie data from whitelist
-            movie_data, _ = self.processor.get_whitelist_data(movie['Title'], movie['Year'], movie['Link'])
-            if movie_data:
-                # Update statistics
-                self.update_continent_statistics(continent, movie_data)
-
-    def update_continent_statistics(self, continent, movie_data):
-        """Update statistics for a continent with movie data."""
-        # Update director counts
-        if movie_data.get('Directors'):
-            for director in movie_data['Directors']:
-                continent_stats[continent]['director_counts'][director] += 1
-        
-        # Update actor counts
-        if movie_data.get('Actors'):
-            for actor in movie_data['Actors']:
-                continent_stats[continent]['actor_counts'][actor] += 1
-        
-        # Update decade counts
-        if movie_data.get('Year'):
-            try:
-                year = int(movie_data['Year'])
-                decade = f"{year // 10 * 10}s"
-                continent_stats[continent]['decade_counts'][decade] += 1
-            except (ValueError, TypeError):
-                pass
-        
-        # Update genre counts
-        if movie_data.get('Genres'):
-            for genre in movie_data['Genres']:
-                continent_stats[continent]['genre_counts'][genre] += 1
-        
-        # Update studio counts
-        if movie_data.get('Studios'):
-            for studio in movie_data['Studios']:
-                continent_stats[continent]['studio_counts'][studio] += 1
-        
-        # Update language counts
-        if movie_data.get('Languages'):
-            for language in movie_data['Languages']:
-                continent_stats[continent]['language_counts'][language] += 1
-        
-        # Update country counts
-        if movie_data.get('Countries'):
-            for country in movie_data['Countries']:
-                continent_stats[continent]['country_counts'][country] += 1
-
     def save_results(self):
         """Save all results to files"""
         
-        # Track movies by title
-        title_to_movies = defaultdict(list)
-        
-        # Add approved movies
-        for movie in self.processor.film_data:
-            # Only add if not already in the list with the same tmdbID
-            if not any(m['tmdb_id'] == movie['tmdbID'] for m in title_to_movies[movie['Title'].lower()]):
-                title_to_movies[movie['Title'].lower()].append({
-                    'title': movie['Title'],
-                    'year': movie['Year'],
-                    'tmdb_id': movie['tmdbID'],
-                    'status': 'Approved'
-                })
-        
-        # Add rejected movies
-        for movie in self.processor.rejected_data:
-            if len(movie) >= 3:  # Ensure we have at least title, year, and reason
-                # Only add if not already in the list with the same tmdbID
-                if not any(m['tmdb_id'] == movie[2] for m in title_to_movies[movie[0].lower()]):
-                    title_to_movies[movie[0].lower()].append({
-                        'title': movie[0],
-                        'year': movie[1],
-                        'tmdb_id': movie[2] if len(movie) > 2 else 'N/A',
-                        'status': f'Rejected: {movie[3]}' if len(movie) > 3 else 'Rejected'
-                    })
-
         # Save unfiltered approved data (append mode)
         approved_path = os.path.join(BASE_DIR, 'unfiltered_approved.csv')
-        with open(approved_path, mode='a', newline='', encoding='utf-8') as file:
+        with FileLock(approved_path), open(approved_path, mode='a', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             # Write header if file is empty
             if file.tell() == 0:
@@ -2779,7 +2418,7 @@ class LetterboxdScraper:
 
         # Save unfiltered denied data (append mode)
         denied_path = os.path.join(BASE_DIR, 'unfiltered_denied.csv')
-        with open(denied_path, mode='a', newline='', encoding='utf-8') as file:
+        with FileLock(denied_path), open(denied_path, mode='a', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             # Write header if file is empty
             if file.tell() == 0:
@@ -2793,6 +2432,9 @@ class LetterboxdScraper:
         # Save ceiling counts (before continent results truncate the data)
         self.save_ceiling_counts()
 
+        # Top-10 sections for every stats file in one pass
+        self.top_stats = self.compute_top_stats()
+
         # Save MPAA results
         self.save_mpaa_results()
 
@@ -2808,11 +2450,14 @@ class LetterboxdScraper:
         # Save MAX_MOVIES_5000 results
         self.save_max_movies_5000_results()
 
+        # Record which fetch path (HTTP or browser) served each film page
+        self.film_fetcher.save_served_by(os.path.join(BASE_DIR, f'film_fetch_paths_{self.scrape_type}.csv'))
+
     def save_ceiling_counts(self):
         """Save ceiling counts to Output_Ceilings.txt showing total movies that would have been added if no caps existed."""
         ceiling_path = os.path.join(output_dir, 'Output_Ceilings.txt')
         
-        with open(ceiling_path, mode='a', encoding='utf-8') as file:
+        with FileLock(ceiling_path), open(ceiling_path, mode='a', encoding='utf-8') as file:
             # Write header with timestamp
             file.write(f"\n{'='*50}\n")
             file.write(f"{self.scrape_type.upper()} 5000 CEILING COUNTS - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -2834,7 +2479,7 @@ class LetterboxdScraper:
             
             # Runtime category ceilings
             file.write("RUNTIME CATEGORY CEILINGS:\n")
-            for category in RUNTIME_CATEGORIES.keys():
+            for category in RUNTIME_CATEGORIES:
                 total_count = len(runtime_stats[category]['film_data'])
                 file.write(f"{category}: {total_count}\n")
             file.write("\n")
@@ -2849,18 +2494,8 @@ class LetterboxdScraper:
             if not top_data:
                 continue
             
-            # Determine the maximum limit for this rating
-            max_limit = MAX_MOVIES_MPAA
-            if rating == 'G':
-                max_limit = self.max_movies_g
-            elif rating == 'NC-17':
-                max_limit = self.max_movies_nc17
-
             # Limit to top entries
-            top_data = top_data[:max_limit]
-            
-            # Recalculate statistics from the limited data
-            self.recalculate_mpaa_statistics(rating, top_data)
+            top_data = top_data[:self._list_limit('mpaa', rating)]
 
             # Save movie data in chunks
             num_chunks = (len(top_data) + CHUNK_SIZE - 1) // CHUNK_SIZE
@@ -2903,107 +2538,19 @@ class LetterboxdScraper:
                 file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
 
                 # Write statistics for each category
-                category_display_names = {
-                    'director_counts': 'directors',
-                    'actor_counts': 'actors',
-                    'decade_counts': 'decades',
-                    'genre_counts': 'genres',
-                    'studio_counts': 'studios',
-                    'language_counts': 'languages',
-                    'country_counts': 'countries'
-                }
-
-                for category_name, counts in mpaa_stats[rating].items():
-                    if category_name != 'film_data':
-                        # Use the mapping for display names
-                        display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                        file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                        for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                            file.write(f"{item}: {count}\n")
-                        file.write("\n")
+                write_top_values(file, self.top_stats[f'mpaa:{rating}'])
                 file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
 
-    def recalculate_mpaa_statistics(self, rating, top_data):
-        """Recalculate statistics for an MPAA rating based on the limited film data."""
-        # Reset all statistics
-        mpaa_stats[rating]['director_counts'] = defaultdict(int)
-        mpaa_stats[rating]['actor_counts'] = defaultdict(int)
-        mpaa_stats[rating]['decade_counts'] = defaultdict(int)
-        mpaa_stats[rating]['genre_counts'] = defaultdict(int)
-        mpaa_stats[rating]['studio_counts'] = defaultdict(int)
-        mpaa_stats[rating]['language_counts'] = defaultdict(int)
-        mpaa_stats[rating]['country_counts'] = defaultdict(int)
-        
-        # Recalculate statistics from the limited film data
-        for movie in top_data:
-            # Get movie data from whitelist
-            movie_data, _ = self.processor.get_whitelist_data(movie['Title'], movie['Year'], movie['Link'])
-            if movie_data:
-                # Update statistics
-                self.update_mpaa_statistics(rating, movie_data)
-
-    def update_mpaa_statistics(self, rating, movie_data):
-        """Update statistics for an MPAA rating with movie data."""
-        # Update director counts
-        if movie_data.get('Directors'):
-            for director in movie_data['Directors']:
-                mpaa_stats[rating]['director_counts'][director] += 1
-        
-        # Update actor counts
-        if movie_data.get('Actors'):
-            for actor in movie_data['Actors']:
-                mpaa_stats[rating]['actor_counts'][actor] += 1
-        
-        # Update decade counts
-        if movie_data.get('Year'):
-            try:
-                year = int(movie_data['Year'])
-                decade = f"{year // 10 * 10}s"
-                mpaa_stats[rating]['decade_counts'][decade] += 1
-            except (ValueError, TypeError):
-                pass
-        
-        # Update genre counts
-        if movie_data.get('Genres'):
-            for genre in movie_data['Genres']:
-                mpaa_stats[rating]['genre_counts'][genre] += 1
-        
-        # Update studio counts
-        if movie_data.get('Studios'):
-            for studio in movie_data['Studios']:
-                mpaa_stats[rating]['studio_counts'][studio] += 1
-        
-        # Update language counts
-        if movie_data.get('Languages'):
-            for language in movie_data['Languages']:
-                mpaa_stats[rating]['language_counts'][language] += 1
-        
-        # Update country counts
-        if movie_data.get('Countries'):
-            for country in movie_data['Countries']:
-                mpaa_stats[rating]['country_counts'][country] += 1
-
     def save_runtime_results(self):
         """Save results for each runtime category."""
-        for category in RUNTIME_CATEGORIES.keys():
+        for category in RUNTIME_CATEGORIES:
             # Official runtime lists (under 100 min, over 150 min) are rating-only
             if category in OFFICIAL_RUNTIME_CATEGORIES and self.scrape_type != 'rating':
                 continue
             category_data = runtime_stats[category]['film_data']
             if category_data:
-                # Determine the max limit based on the category
-                max_limit = (
-                    MAX_MOVIES_RUNTIME_OFFICIAL if category in OFFICIAL_RUNTIME_CATEGORIES else
-                    self.max_180 if category == '3_Hours_or_Greater' else
-                    self.max_240 if category == '4_Hours_or_Greater' else
-                    MAX_MOVIES_RUNTIME
-                )
                 # Limit to top results
-                top_data = category_data[:int(max_limit)]  # Ensure it does not exceed the max
-                
-                # Recalculate statistics only for categories that track stats
-                if category not in OFFICIAL_RUNTIME_CATEGORIES:
-                    self.recalculate_runtime_statistics(category, top_data)
+                top_data = category_data[:self._list_limit('runtime', category)]  # Ensure it does not exceed the max
 
                 # Save movie data in chunks
                 num_chunks = (len(top_data) + CHUNK_SIZE - 1) // CHUNK_SIZE
@@ -3061,86 +2608,9 @@ class LetterboxdScraper:
                         file.write("-- Entries that have scores inflated because they share a name with a popular television show are removed, as I notice them.\n\n")
 
                         # Write statistics for each category
-                        category_display_names = {
-                            'director_counts': 'directors',
-                            'actor_counts': 'actors',
-                            'decade_counts': 'decades',
-                            'genre_counts': 'genres',
-                            'studio_counts': 'studios',
-                            'language_counts': 'languages',
-                            'country_counts': 'countries'
-                        }
-
-                        for category_name, counts in runtime_stats[category].items():
-                            if category_name != 'film_data':
-                                # Use the mapping for display names
-                                display_name = category_display_names.get(category_name, category_name.replace('_', ' '))
-                                file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
-                                for item, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]:
-                                    file.write(f"{item}: {count}\n")
-                                file.write("\n")
+                        write_top_values(file, self.top_stats[f'runtime:{category}'])
                         file.write("<strong>If you notice any movies you believe should/should not be included just let me know!</strong>")
 
-    def recalculate_runtime_statistics(self, category, top_data):
-        """Recalculate statistics for a runtime category based on the limited film data."""
-        # Reset all statistics
-        runtime_stats[category]['director_counts'] = defaultdict(int)
-        runtime_stats[category]['actor_counts'] = defaultdict(int)
-        runtime_stats[category]['decade_counts'] = defaultdict(int)
-        runtime_stats[category]['genre_counts'] = defaultdict(int)
-        runtime_stats[category]['studio_counts'] = defaultdict(int)
-        runtime_stats[category]['language_counts'] = defaultdict(int)
-        runtime_stats[category]['country_counts'] = defaultdict(int)
-        
-        # Recalculate statistics from the limited film data
-        for movie in top_data:
-            # Get movie data from whitelist
-            movie_data, _ = self.processor.get_whitelist_data(movie['Title'], movie['Year'], movie['Link'])
-            if movie_data:
-                # Update statistics
-                self.update_runtime_statistics(category, movie_data)
-
-    def update_runtime_statistics(self, category, movie_data):
-        """Update statistics for a runtime category with movie data."""
-        # Update director counts
-        if movie_data.get('Directors'):
-            for director in movie_data['Directors']:
-                runtime_stats[category]['director_counts'][director] += 1
-        
-        # Update actor counts
-        if movie_data.get('Actors'):
-            for actor in movie_data['Actors']:
-                runtime_stats[category]['actor_counts'][actor] += 1
-        
-        # Update decade counts
-        if movie_data.get('Year'):
-            try:
-                year = int(movie_data['Year'])
-                decade = f"{year // 10 * 10}s"
-                runtime_stats[category]['decade_counts'][decade] += 1
-            except (ValueError, TypeError):
-                pass
-        
-        # Update genre counts
-        if movie_data.get('Genres'):
-            for genre in movie_data['Genres']:
-                runtime_stats[category]['genre_counts'][genre] += 1
-        
-        # Update studio counts
-        if movie_data.get('Studios'):
-            for studio in movie_data['Studios']:
-                runtime_stats[category]['studio_counts'][studio] += 1
-        
-        # Update language counts
-        if movie_data.get('Languages'):
-            for language in movie_data['Languages']:
-                runtime_stats[category]['language_counts'][language] += 1
-        
-        # Update country counts
-        if movie_data.get('Countries'):
-            for country in movie_data['Countries']:
-                runtime_stats[category]['country_counts'][country] += 1
-
     def save_unknown_continent_films(self):
         """Save list of films with unknown countries to a file."""
         if unmapped_countries:
@@ -3161,64 +2631,179 @@ class LetterboxdScraper:
                         f.write("  No movie information available\n")
                     f.write("\n")
 
-def main():
+def run_scrape_pass(scrape_type: str, resume: bool = False) -> Dict:
+    """
+    Run one pass (popular or rating) from start to saved results, or from its checkpoint when
+    resuming. Returns the pass's status ('ok', 'stopped', 'failed' or 'skipped') and totals.
+    """
+    result = {'scrape_type': scrape_type, 'status': 'failed', 'scraped': 0, 'accepted': 0, 'rejected': 0,
+              'unfiltered_approved': 0, 'unfiltered_denied': 0}
+    checkpoint = ScrapeCheckpoint(CHECKPOINT_PATH_TEMPLATE.format(scrape_type), log=print_to_csv)
+    STAGE_TIMER.reset()
+    state = checkpoint.load() if resume else None
+    if resume and state is None:
+        print_to_csv(f"No {scrape_type} checkpoint to resume from; starting from page 1.")
+    if state and state.get('completed'):
+        print_to_csv(f"⏭️ {scrape_type.upper()} scraping finished before the checkpoint; skipping it.")
+        result['status'] = 'skipped'
+        return result
+
+    scraper = None
+    try:
+        print_to_csv(f"\n{'Starting ' + scrape_type.upper() + ' scraping':=^100}")
+        scraper = LetterboxdScraper(scrape_type, checkpoint)
+        if state:
+            scraper.restore_checkpoint(state)
+        scraper.scrape_movies()
+        scraper.save_results()
+        if scraper.valid_movies_count >= MAX_MOVIES or scraper.page_number > 1000:
+            checkpoint.save({'completed': True})
+            result['status'] = 'ok'
+        else:
+            result['status'] = 'stopped'
+            print_to_csv(f"⏸️ {scrape_type.upper()} stopped early on page {scraper.page_number}; "
+                         f"run with --resume to continue from the last checkpoint.")
+
+        # Format statistics for this run
+        print_to_csv(f"\n{scrape_type.upper() + ' Statistics':=^100}")
+        print_to_csv(f"{'Total movies scraped:':<30} {scraper.total_titles:>10}")
+        print_to_csv(f"{'Total accepted:':<30} {scraper.valid_movies_count:>10}")
+        print_to_csv(f"{'Total rejected:':<30} {scraper.rejected_movies_count:>10}")
+        print_to_csv(f"{'Total unfiltered approved:':<30} {len(scraper.processor.unfiltered_approved):>10}")
+        print_to_csv(f"{'Total unfiltered denied:':<30} {len(scraper.processor.unfiltered_denied):>10}")
+        print_to_csv(scraper.processor.tmdb_cache.summary())
+        print_to_csv(scraper.page_cache.summary())
+        print_to_csv(scraper.film_fetcher.summary())
+        print_to_csv(RATE_LIMITER.summary())
+
+        result.update(
+            scraped=scraper.total_titles,
+            accepted=scraper.valid_movies_count,
+            rejected=scraper.rejected_movies_count,
+            unfiltered_approved=len(scraper.processor.unfiltered_approved),
+            unfiltered_denied=len(scraper.processor.unfiltered_denied),
+        )
+
+    except Exception as e:
+        print_to_csv(f"\n{'Error in ' + scrape_type + ' scraping':=^100}")
+        print_to_csv(f"❌ An error occurred during {scrape_type} execution: {e}")
+    finally:
+        if scraper:
+            try:
+                scraper.driver.quit()
+            except:
+                pass
+            if scraper.film_pool is not None:
+                scraper.film_pool.close()
+            scraper.listing_prefetcher.close()
+            if scraper.listing_worker is not None:
+                scraper.listing_worker.reset_driver()
+            scraper.page_cache.close()
+            # Write the film store back to whitelist.xlsx once per pass instead of per film
+            scraper.processor.save_whitelist()
+            scraper.processor.flush_pending_writes()
+            write_stage_report(scrape_type)
+    return result
+
+def write_stage_report(scrape_type: str):
+    """Log the pass's per-stage timings and write them to Stage_Timings_<pass>.txt/.json beside Output_Ceilings.txt."""
+    title = f"{scrape_type.upper()} 5000 STAGE TIMINGS"
+    for line in STAGE_TIMER.report_lines(title):
+        print_to_csv(line)
+    base_path = os.path.join(output_dir, f'Stage_Timings_{scrape_type}')
+    try:
+        STAGE_TIMER.write_report(base_path + '.txt', base_path + '.json', title)
+    except OSError as e:
+        print_to_csv(f"⚠️ Could not write stage timings: {str(e)}")
+
+def pass_log_name(scrape_type: str) -> str:
+    return f'All_Outputs.{scrape_type}.csv'
+
+def _run_pass_in_worker(scrape_type: str, resume: bool) -> Dict:
+    """Process pool entry point: this process's module-level stats belong to scrape_type alone."""
+    global IS_PASS_WORKER, OUTPUT_LOG_NAME, LOG_PREFIX
+    IS_PASS_WORKER = True
+    OUTPUT_LOG_NAME = pass_log_name(scrape_type)
+    LOG_PREFIX = f"[{scrape_type}] "
+    # atexit does not run in pool workers; persist batched blacklist/zero-reviews changes when this one exits
+    Finalize(None, flush_all, exitpriority=5)
+    return run_scrape_pass(scrape_type, resume)
+
+def run_passes_in_processes(resume: bool) -> List[Dict]:
+    """Run every pass at once, each in its own process with its own browsers, then merge their logs."""
+    print_to_csv(f"🚀 Running the {', '.join(scrape_types)} passes in parallel processes")
+    results = []
+    with ProcessPoolExecutor(max_workers=len(scrape_types)) as executor:
+        futures = {executor.submit(_run_pass_in_worker, scrape_type, resume): scrape_type for scrape_type in scrape_types}
+        for future in as_completed(futures):
+            scrape_type = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print_to_csv(f"❌ The {scrape_type} process crashed: {str(e)}")
+                results.append({'scrape_type': scrape_type, 'status': 'failed', 'scraped': 0, 'accepted': 0,
+                                'rejected': 0, 'unfiltered_approved': 0, 'unfiltered_denied': 0})
+
+    flush_output_logs()
+    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as merged:
+        for scrape_type in scrape_types:
+            part_path = os.path.join(output_dir, pass_log_name(scrape_type))
+            if os.path.exists(part_path):
+                with open(part_path, mode='r', newline='', encoding='utf-8') as part:
+                    merged.write(part.read())
+                os.remove(part_path)
+    return results
+
+def main(resume: bool = False, parallel: bool = PARALLEL_PASSES):
     start_time = time.time()
-    total_movies_scraped = 0
-    total_accepted = 0
-    total_rejected = 0
-    total_unfiltered_approved = 0
-    total_unfiltered_denied = 0
-    
-    for i, scrape_type in enumerate(scrape_types):
-        scraper = None
-        try:
-            print_to_csv(f"\n{'Starting ' + scrape_type.upper() + ' scraping':=^100}")
-            scraper = LetterboxdScraper(scrape_type)
-            scraper.scrape_movies()
-            scraper.save_results()
-
-            # Format statistics for this run
-            print_to_csv(f"\n{scrape_type.upper() + ' Statistics':=^100}")
-            print_to_csv(f"{'Total movies scraped:':<30} {scraper.total_titles:>10}")
-            print_to_csv(f"{'Total accepted:':<30} {scraper.valid_movies_count:>10}")
-            print_to_csv(f"{'Total rejected:':<30} {scraper.rejected_movies_count:>10}")
-            print_to_csv(f"{'Total unfiltered approved:':<30} {len(scraper.processor.unfiltered_approved):>10}")
-            print_to_csv(f"{'Total unfiltered denied:':<30} {len(scraper.processor.unfiltered_denied):>10}")
-
-            # Add to totals
-            total_movies_scraped += scraper.total_titles
-            total_accepted += scraper.valid_movies_count
-            total_rejected += scraper.rejected_movies_count
-            total_unfiltered_approved += len(scraper.processor.unfiltered_approved)
-            total_unfiltered_denied += len(scraper.processor.unfiltered_denied)
 
-        except Exception as e:
-            print_to_csv(f"\n{'Error in ' + scrape_type + ' scraping':=^100}")
-            print_to_csv(f"❌ An error occurred during {scrape_type} execution: {e}")
-        finally:
-            if scraper:
-                try:
-                    scraper.driver.quit()
-                except:
-                    pass
-            
+    if not resume:
+        # Cached pages are only shared between this run's passes; never rank on a previous run's counts
+        page_cache = FilmPageCache(FILM_PAGE_CACHE_PATH, ttl_days=FILM_PAGE_CACHE_TTL_DAYS)
+        page_cache.clear()
+        page_cache.close()
+
+    if parallel and len(scrape_types) > 1:
+        results = run_passes_in_processes(resume)
+    else:
+        results = []
+        for i, scrape_type in enumerate(scrape_types):
+            results.append(run_scrape_pass(scrape_type, resume))
             # Clear all data structures between runs (except after the last run)
-            if i < len(scrape_types) - 1 and scraper is not None:
-                clear_all_data_structures(scraper.processor)
+            if i < len(scrape_types) - 1:
+                clear_all_data_structures()
 
     # Format final combined statistics
     print_to_csv(f"\n{'Final Combined Statistics':=^100}")
-    print_to_csv(f"{'Total movies scraped:':<30} {total_movies_scraped:>10}")
-    print_to_csv(f"{'Total accepted:':<30} {total_accepted:>10}")
-    print_to_csv(f"{'Total rejected:':<30} {total_rejected:>10}")
-    print_to_csv(f"{'Total unfiltered approved:':<30} {total_unfiltered_approved:>10}")
-    print_to_csv(f"{'Total unfiltered denied:':<30} {total_unfiltered_denied:>10}")
+    print_to_csv(f"{'Total movies scraped:':<30} {sum(r['scraped'] for r in results):>10}")
+    print_to_csv(f"{'Total accepted:':<30} {sum(r['accepted'] for r in results):>10}")
+    print_to_csv(f"{'Total rejected:':<30} {sum(r['rejected'] for r in results):>10}")
+    print_to_csv(f"{'Total unfiltered approved:':<30} {sum(r['unfiltered_approved'] for r in results):>10}")
+    print_to_csv(f"{'Total unfiltered denied:':<30} {sum(r['unfiltered_denied'] for r in results):>10}")
 
     # Format execution time
     execution_time = time.time() - start_time
+    total_accepted = sum(r['accepted'] for r in results)
     print_to_csv(f"\n{'Execution Summary':=^100}")
     print_to_csv(f"Total execution time: {format_time(execution_time)}")
     print_to_csv(f"Average processing speed: {total_accepted / execution_time:.2f} movies/second")
 
+    if all(r['status'] in ('ok', 'skipped') for r in results):
+        for scrape_type in scrape_types:
+            ScrapeCheckpoint(CHECKPOINT_PATH_TEMPLATE.format(scrape_type)).clear()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Scrape the Letterboxd popular and highest rated 5000 lists.")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue from the last checkpoint instead of starting over at page 1")
+    parser.add_argument('--serial', action='store_true',
+                        help="Run the popular and rating passes one after the other instead of in parallel processes")
+    args = parser.parse_args()
+    try:
+        main(resume=args.resume, parallel=PARALLEL_PASSES and not args.serial)
+    except KeyboardInterrupt:
+        print_to_csv("\n⚠️ Received interrupt signal. Cleaning up...")
+        # Persist any batched blacklist/zero-reviews changes before exiting
+        flush_all()
+        print_to_csv("Exiting gracefully (rerun with --resume to continue from the last checkpoint)...")
+        sys.exit(0)
@@ -0,0 +1,89 @@
+"""
+Compare Letterboxd page-load time with the fast browser profile (eager loads, posters/fonts/ads
+blocked) against Chrome's default full page loads.
+
+Each mode gets its own Chrome session. Every URL is loaded ROUNDS times and timed from
+driver.get() until the DOM markers its extractor needs are present, which is the point a
+scraper can start reading the page.
+"""
+
+import math
+import statistics
+import time
+
+import undetected_chromedriver as uc
+
+from browser_profile import (FILM_PAGE_MARKERS, LISTING_PAGE_MARKERS, apply_fast_profile,
+                             enable_resource_blocking, wait_for_markers)
+from rate_limiter import get_rate_limiter
+
+# (url, markers) pairs to time; mix of film pages and listing pages
+PAGES = [
+    ('https://letterboxd.com/film/parasite-2019/', FILM_PAGE_MARKERS),
+    ('https://letterboxd.com/film/the-godfather/', FILM_PAGE_MARKERS),
+    ('https://letterboxd.com/film/spirited-away/', FILM_PAGE_MARKERS),
+    ('https://letterboxd.com/films/by/rating/page/1/', LISTING_PAGE_MARKERS),
+    ('https://letterboxd.com/films/popular/page/2/', LISTING_PAGE_MARKERS),
+]
+ROUNDS = 3  # Loads per URL per mode (the first load of each URL also warms the HTTP cache)
+MARKER_TIMEOUT = 30  # Seconds to wait for markers before counting the load as failed
+
+RATE_LIMITER = get_rate_limiter()
+
+
+def create_driver(fast: bool):
+    options = uc.ChromeOptions()
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    if fast:
+        apply_fast_profile(options)
+    driver = uc.Chrome(options=options, use_subprocess=True)
+    if fast:
+        enable_resource_blocking(driver)
+    return driver
+
+
+def time_mode(fast: bool):
+    """Return ({url: [seconds, ...]}, failed_loads) for one browser mode."""
+    driver = create_driver(fast)
+    timings = {url: [] for url, _ in PAGES}
+    failures = 0
+    try:
+        for _ in range(ROUNDS):
+            for url, markers in PAGES:
+                RATE_LIMITER.acquire(url)
+                start = time.perf_counter()
+                driver.get(url)
+                if not wait_for_markers(driver, markers, timeout=MARKER_TIMEOUT):
+                    failures += 1
+                    continue
+                timings[url].append(time.perf_counter() - start)
+    finally:
+        driver.quit()
+    return timings, failures
+
+
+def summarize(label: str, timings, failures: int) -> float:
+    all_loads = [t for loads in timings.values() for t in loads]
+    print(f"\n{label}")
+    for url, loads in timings.items():
+        if loads:
+            print(f"  {url}: median {statistics.median(loads):.2f}s, best {min(loads):.2f}s over {len(loads)} loads")
+    if failures:
+        print(f"  {failures} loads timed out waiting for markers")
+    if not all_loads:
+        return float('nan')
+    mean = statistics.mean(all_loads)
+    print(f"  Overall: mean {mean:.2f}s, median {statistics.median(all_loads):.2f}s")
+    return mean
+
+
+def main():
+    full = summarize("Full page loads (blocking off)", *time_mode(fast=False))
+    fast = summarize("Fast profile (eager + blocking on)", *time_mode(fast=True))
+    if not math.isnan(full) and not math.isnan(fast) and fast > 0:
+        print(f"\n⏱️ Fast profile is {full / fast:.1f}x faster ({full - fast:.2f}s saved per page)")
+
+
+if __name__ == "__main__":
+    main()
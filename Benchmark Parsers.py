@@ -0,0 +1,146 @@
+"""
+Time the HTML parsers offline, over the pages saved in benchmark_fixtures/.
+
+Each parser in page_parsers.py, plus film_page_fetcher.parse_film_page (the HTTP twin of
+the in-browser extract_all_movie_data), is run ROUNDS times over its fixture and reported
+as pages per second and memory allocated per page (tracemalloc peak). Nothing is fetched,
+so runs are repeatable and quick enough to check a parsing change before a real scrape.
+
+    python "Benchmark Parsers.py"                          run and print the table
+    python "Benchmark Parsers.py" --save-baseline b.json   also store the results
+    python "Benchmark Parsers.py" --baseline b.json        exit 1 if any parser got slower
+                                                           than REGRESSION_TOLERANCE allows
+    python "Benchmark Parsers.py" --record                 refresh the fixtures from FIXTURE_SOURCES
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from film_page_fetcher import create_session, is_challenge_page, parse_film_page
+from page_parsers import json_ld_rating_count, parse_boxofficemojo_chart, parse_og_title, parse_poster_list
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_fixtures')
+
+# fixture file -> live page it was recorded from (used by --record)
+FIXTURE_SOURCES = {
+    'letterboxd_list_page.html': 'https://letterboxd.com/dave/list/official-top-250-narrative-feature-films/',
+    'letterboxd_films_page.html': 'https://letterboxd.com/films/by/rating/page/1/',
+    'letterboxd_film_page.html': 'https://letterboxd.com/film/parasite-2019/',
+    'boxofficemojo_chart.html': 'https://www.boxofficemojo.com/chart/ww_top_lifetime_gross/?area=XWW',
+}
+
+# (name, fixture file, parser, result size) - result size is a sanity check that the parser still finds something
+BENCHMARKS = [
+    ('parse_poster_list (list page)', 'letterboxd_list_page.html', parse_poster_list, lambda r: len(r[0] or [])),
+    ('parse_poster_list (films page)', 'letterboxd_films_page.html', parse_poster_list, lambda r: len(r[0] or [])),
+    ('parse_film_page', 'letterboxd_film_page.html', parse_film_page, lambda r: len(r[0] or {})),
+    ('parse_og_title', 'letterboxd_film_page.html', parse_og_title, lambda r: len(r or {})),
+    ('json_ld_rating_count', 'letterboxd_film_page.html', json_ld_rating_count, lambda r: int(r > 0)),
+    ('parse_boxofficemojo_chart', 'boxofficemojo_chart.html', parse_boxofficemojo_chart, len),
+]
+ROUNDS = 50  # Parses per benchmark (after one warm-up parse)
+REGRESSION_TOLERANCE = 0.25  # Fail --baseline if pages/sec drops or KiB/page grows by more than this fraction
+
+
+def load_fixture(filename: str) -> str:
+    with open(os.path.join(FIXTURE_DIR, filename), mode='r', encoding='utf-8') as file:
+        return file.read()
+
+
+def record_fixtures() -> None:
+    """Overwrite the fixtures with the current live pages; challenge pages are not saved."""
+    session = create_session()
+    for filename, url in FIXTURE_SOURCES.items():
+        response = session.get(url, timeout=30)
+        if response.status_code != 200 or is_challenge_page(response.status_code, response.text):
+            print(f"❌ {url}: HTTP {response.status_code} or challenge page, keeping the old {filename}")
+            continue
+        with open(os.path.join(FIXTURE_DIR, filename), mode='w', encoding='utf-8') as file:
+            file.write(response.text)
+        print(f"✅ Recorded {filename} ({len(response.text) / 1024:.0f} KiB) from {url}")
+
+
+def run_benchmark(parser, html: str, size):
+    """Return {pages_per_sec, kib_per_page, peak_kib, items} for one parser over one page."""
+    items = size(parser(html))  # Warm-up, and the sanity count
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        parser(html)
+    elapsed = time.perf_counter() - start
+
+    # Allocation is measured on a separate parse so tracemalloc's overhead stays out of the timing
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        parser(html)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'pages_per_sec': ROUNDS / elapsed if elapsed > 0 else float('inf'),
+        'peak_kib': (peak - before) / 1024,
+        'kib_per_page': len(html.encode('utf-8')) / 1024,
+        'items': items,
+    }
+
+
+def compare(results, baseline) -> list:
+    """Lines describing every parser that regressed past REGRESSION_TOLERANCE."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if current['pages_per_sec'] < previous['pages_per_sec'] * (1 - REGRESSION_TOLERANCE):
+            regressions.append(f"{name}: {previous['pages_per_sec']:.1f} -> {current['pages_per_sec']:.1f} pages/sec")
+        if current['peak_kib'] > previous['peak_kib'] * (1 + REGRESSION_TOLERANCE):
+            regressions.append(f"{name}: {previous['peak_kib']:.0f} -> {current['peak_kib']:.0f} KiB allocated per page")
+        if previous['items'] and not current['items']:
+            regressions.append(f"{name}: parsed {previous['items']} items before, none now")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTML parsers over the saved fixtures.")
+    parser.add_argument('--record', action='store_true', help="refresh the fixtures from the live pages first")
+    parser.add_argument('--baseline', help="JSON results to compare against; exit 1 on regression")
+    parser.add_argument('--save-baseline', help="write this run's results to a JSON file")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures()
+
+    results = {}
+    print(f"{'Parser':<34}{'Pages/sec':>11}{'Page KiB':>10}{'Alloc KiB':>11}{'Items':>7}")
+    for name, filename, func, size in BENCHMARKS:
+        result = run_benchmark(func, load_fixture(filename), size)
+        results[name] = result
+        print(f"{name:<34}{result['pages_per_sec']:>11.1f}{result['kib_per_page']:>10.0f}{result['peak_kib']:>11.0f}{result['items']:>7}")
+        if not result['items']:
+            print(f"  ⚠️ {name} found nothing in {filename}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, mode='w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"\n💾 Results saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, mode='r', encoding='utf-8') as file:
+            regressions = compare(results, json.load(file))
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\n✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
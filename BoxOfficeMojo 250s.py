@@ -1,8 +1,10 @@
 import requests
-from bs4 import BeautifulSoup
 import csv
 import os
 import platform
+from output_log import INFO, output_log
+from page_parsers import parse_boxofficemojo_chart
+from site_urls import site_url
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -28,12 +30,9 @@ paths = get_os_specific_paths()
 output_dir = paths['output_dir']
 
 # Define a custom print function
-def print_to_csv(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+def print_to_csv(message: str, level: int = INFO):
+    """Prints a message to the terminal and appends it to All_Outputs.csv (written by a background thread)."""
+    output_log(os.path.join(output_dir, 'All_Outputs.csv')).emit(message, level)
 
 def scrape_movies(urls, output_filename):
     os.makedirs(output_dir, exist_ok=True)
@@ -49,44 +48,18 @@ def scrape_movies(urls, output_filename):
     for url in urls:
         page_movies = []
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(site_url(url), headers=headers)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            movie_rows = soup.select('table.mojo-body-table tr:has(td.mojo-field-type-rank)')
 
-            for row in movie_rows:
+            for rank, title, year in parse_boxofficemojo_chart(response.text):
                 if movies_processed >= 250:
                     break
-                
-                try:
-                    rank_element = row.select_one('td.mojo-field-type-rank')
-                    title_element = row.select_one('td.mojo-field-type-title a')
-                    year_cell = row.select_one('td.mojo-field-type-year')
-                    
-                    # Try to get year from link first, if not found get direct text
-                    year = None
-                    if year_cell:
-                        year_link = year_cell.select_one('a')
-                        if year_link:
-                            year = year_link.text.strip()
-                        else:
-                            year = year_cell.text.strip()
-                    
-                    if not all([rank_element, title_element, year]):
-                        continue
-                    
-                    rank = int(rank_element.text.strip())
-                    title = title_element.text.strip()
-                    
-                    page_movies.append([rank, title, year])
-                    movies_processed += 1
-                    
-                    if movies_processed % 10 == 0:
-                        print_to_csv(f"Processed {movies_processed} movies")
-                        
-                except Exception as e:
-                    continue
+
+                page_movies.append([rank, title, year])
+                movies_processed += 1
+
+                if movies_processed % 10 == 0:
+                    print_to_csv(f"Processed {movies_processed} movies")
 
             movies.extend(page_movies)
 
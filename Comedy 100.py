@@ -1,6 +1,5 @@
 import requests
 from bs4 import BeautifulSoup
-import json
 import time
 import csv
 import random
@@ -12,6 +11,9 @@ from selenium.common.exceptions import NoSuchWindowException, WebDriverException
 import os
 import platform
 from tqdm import tqdm
+from browser_profile import apply_fast_profile, enable_resource_blocking
+from output_log import INFO, output_log
+from page_parsers import json_ld_rating_count
 
 # Silence undetected_chromedriver's noisy __del__ that logs WinError 6 on shutdown
 try:
@@ -51,14 +53,12 @@ LIST_ONLY = True
 # Leave None to use a fresh profile each run. Close any open Chrome using that profile before running.
 CHROME_USER_DATA_DIR = None  # e.g. r'C:\Users\bigba\AppData\Local\Google\Chrome\User Data'
 CHROME_PROFILE_DIR = None    # e.g. 'Default' or 'Profile 1'
+FAST_BROWSER_PROFILE = True  # Eager page loads with posters, fonts and ad/analytics scripts blocked (browser_profile.py)
 
 # Define a custom print function
-def print_to_csv(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+def print_to_csv(message: str, level: int = INFO):
+    """Prints a message to the terminal and appends it to All_Outputs.csv (written by a background thread)."""
+    output_log(os.path.join(output_dir, 'All_Outputs.csv')).emit(message, level)
 
 def create_session():
     session = requests.Session()
@@ -69,7 +69,7 @@ def create_session():
 
 # The process_film function is no longer needed since we extract data directly from the list page
 
-def setup_webdriver():
+def setup_webdriver(fast: bool = FAST_BROWSER_PROFILE):
     """
     Create Chrome driver using undetected-chromedriver to avoid Cloudflare/captcha detection,
     mirroring the Genre 250s Chrome setup.
@@ -110,11 +110,15 @@ def setup_webdriver():
         options.add_argument(f"--user-data-dir={CHROME_USER_DATA_DIR}")
         if CHROME_PROFILE_DIR:
             options.add_argument(f"--profile-directory={CHROME_PROFILE_DIR}")
+    if fast:
+        apply_fast_profile(options)
     chrome_major = _detect_chrome_major_version()
     if chrome_major:
         driver = uc.Chrome(options=options, use_subprocess=True, version_main=chrome_major)
     else:
         driver = uc.Chrome(options=options, use_subprocess=True)
+    if fast:
+        enable_resource_blocking(driver, log=print_to_csv)
     return driver
 
 
@@ -245,18 +249,7 @@ def process_page(session, url, max_films, min_watches, approved_films, page_html
                     try:
                         full_film_url = f"https://letterboxd.com{film_url}"
                         film_response = session.get(full_film_url, timeout=10)
-                        film_soup = BeautifulSoup(film_response.content, 'html.parser')
-                        json_ld = film_soup.find('script', type='application/ld+json')
-                        rating_count = 0
-                        if json_ld:
-                            try:
-                                json_text = json_ld.string.strip()
-                                if '/* <![CDATA[ */' in json_text:
-                                    json_text = json_text.replace('/* <![CDATA[ */', '').replace('/* ]]> */', '')
-                                film_data_json = json.loads(json_text)
-                                rating_count = film_data_json.get('aggregateRating', {}).get('ratingCount', 0)
-                            except (json.JSONDecodeError, KeyError):
-                                rating_count = 0
+                        rating_count = json_ld_rating_count(film_response.content)
                         if rating_count < min_watches:
                             print_to_csv(f"❌ {film_title} - Not added (Rating count: {rating_count} < {min_watches})")
                             continue
@@ -3,6 +3,9 @@ import time
 import random
 import signal
 import sys
+import argparse
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 import pandas as pd
@@ -24,6 +27,17 @@ from selenium.webdriver.support import expected_conditions as EC
 import json
 from selenium.common.exceptions import NoSuchElementException
 from credentials_loader import load_credentials
+from film_store import FilmStore, store_path_for
+from deferred_workbook import DeferredWorkbook, flush_all
+from tmdb_cache import TmdbCache
+from film_page_fetcher import parse_film_page
+from browser_session import BrowserSessionManager
+from shared_genre_crawl import FilmVerdictCache, GenreTopLists
+from file_lock import FileLock
+from browser_profile import FILM_PAGE_MARKERS, apply_fast_profile, enable_resource_blocking, wait_for_markers
+from taxonomy import first_mpaa_rating
+from output_log import DEBUG, INFO, flush_output_logs, output_log
+from site_urls import canonical_url, site_url
 
 # Silence undetected_chromedriver's noisy __del__ that logs WinError 6 on shutdown
 try:
@@ -31,18 +45,25 @@ try:
 except Exception:
     pass
 
-# Global variable to store the current scraper for cleanup
+# Global variables to store the current scraper and the run's browsers for cleanup
 current_scraper = None
+browser_session = None
+# Set in --workers processes: they log to their own file and leave whitelist.xlsx to the parent
+IS_COMBINATION_WORKER = False
 
 def signal_handler(signum, frame):
     """Handle Ctrl+C gracefully"""
     print_to_csv("\n⚠️ Received interrupt signal. Cleaning up...")
-    if current_scraper is not None:
+    if browser_session is not None:
         try:
-            current_scraper.driver.quit()
-            print_to_csv("Scraper cleaned up successfully")
+            browser_session.close()
+            print_to_csv("Browsers cleaned up successfully")
         except:
             pass
+    if current_scraper is not None and not IS_COMBINATION_WORKER:
+        current_scraper.processor.save_whitelist()
+    # Persist any batched blacklist/zero-reviews changes before exiting
+    flush_all()
     print_to_csv("Exiting gracefully...")
     sys.exit(0)
 
@@ -77,14 +98,16 @@ LIST_DIR = paths['base_dir']
 # Leave None to use a fresh profile each run. Close any open Chrome using that profile before running.
 CHROME_USER_DATA_DIR = None  # e.g. r'C:\Users\bigba\AppData\Local\Google\Chrome\User Data'
 CHROME_PROFILE_DIR = None    # e.g. 'Default' or 'Profile 1'
+FAST_BROWSER_PROFILE = True  # Eager page loads with posters, fonts and ad/analytics scripts blocked (browser_profile.py)
+
+OUTPUT_LOG_NAME = 'All_Outputs.csv'  # Worker processes log to their own file, merged in afterwards
+LOG_PREFIX = ''  # Terminal prefix naming the combination a worker process is on
+LOG_LEVEL = 'INFO'  # 'DEBUG' also logs the per-film debug and skip lines
 
 # Define a custom print function
-def print_to_csv(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    with open(os.path.join(BASE_DIR, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+def print_to_csv(message: str, level: int = INFO):
+    """Prints a message to the terminal and appends it to All_Outputs.csv (written by a background thread)."""
+    output_log(os.path.join(BASE_DIR, OUTPUT_LOG_NAME), level=LOG_LEVEL).emit(message, level, prefix=LOG_PREFIX)
 
 # Configure locale and constants
 locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
@@ -97,11 +120,19 @@ EXPECTED_LISTING_POSTERS_PER_PAGE = 72
 MAX_RETRIES = 25
 RETRY_DELAY = 15
 CHUNK_SIZE = 1900
+FILM_WORKERS = 4  # Parallel browser workers for film pages (1 = load them one by one on the main driver)
+SHARED_CRAWL = True  # Build every genre list from one /films/by/{sort}/ crawl (False = crawl each genre separately)
+SHARED_CRAWL_MAX_PAGES = 400  # Ranking pages to walk per sort; genres still short after this get their own crawl
 
 # File paths
 BLACKLIST_PATH = os.path.join(LIST_DIR, 'blacklist.xlsx')
 WHITELIST_PATH = os.path.join(LIST_DIR, 'whitelist.xlsx')
+WHITELIST_DB_PATH = store_path_for(WHITELIST_PATH)  # Indexed SQLite copy of the whitelist
 ZERO_REVIEWS_PATH = os.path.join(LIST_DIR, 'Zero_Reviews.xlsx')  # Add new path
+TMDB_CACHE_PATH = os.path.join(LIST_DIR, 'tmdb_cache.sqlite3')  # Shared TMDB keyword/genre cache
+TMDB_CACHE_TTL_DAYS = 30  # Re-fetch cached TMDB details after this many days
+FILM_VERDICT_CACHE_PATH = os.path.join(LIST_DIR, 'film_verdicts.sqlite3')  # Shared-crawl verdicts for films outside the whitelist
+FILM_VERDICT_TTL_DAYS = 14  # Re-check cached verdicts after this many days
 
 # Load credentials
 credentials = load_credentials()
@@ -116,6 +147,12 @@ FILTER_KEYWORDS = {
 
 FILTER_GENRES = {'Documentary'}
 
+# Whitelist Information missing any of these is stale and gets refreshed from the film page
+WHITELIST_REQUIRED_FIELDS = [
+    'Title', 'Year', 'Runtime', 'RatingCount',
+    'Languages', 'Countries', 'Directors', 'Genres', 'Studios', 'Actors'
+]
+
 @dataclass
 class MovieData:
     url: str  # Only identifier
@@ -140,7 +177,7 @@ class RequestsSession:
         self.session.mount("http://", adapter)
 
     def get(self, url: str, **kwargs) -> requests.Response:
-        return self.session.get(url, **kwargs)
+        return self.session.get(site_url(url), **kwargs)
 
 def normalize_text(text):
     return unicodedata.normalize('NFKC', str(text)).strip()
@@ -187,7 +224,8 @@ def og_release_year_from_page_source(page_source: str) -> Optional[str]:
 class MovieProcessor:
     def __init__(self):
         self.session = RequestsSession()
-        self.whitelist = None
+        self.tmdb_cache = TmdbCache(TMDB_CACHE_PATH, ttl_days=TMDB_CACHE_TTL_DAYS)
+        self.film_store = None
         self.whitelist_lookup = {}
         self.zero_reviews = None
         self.zero_reviews_lookup = {}
@@ -232,6 +270,11 @@ class MovieProcessor:
         for idx, row in self.blacklist.iterrows():
             if row['Link']:  # Only store entries with URLs
                 self.blacklist_lookup[row['Link']] = True
+
+        # Blacklist/zero-reviews changes are buffered and written to disk in batches
+        # In --workers mode other processes write the same workbooks, so flushes merge with the file on disk
+        self.blacklist = DeferredWorkbook(BLACKLIST_PATH, self.blacklist, log=print_to_csv, shared=IS_COMBINATION_WORKER)
+        self.zero_reviews = DeferredWorkbook(ZERO_REVIEWS_PATH, self.zero_reviews, log=print_to_csv, shared=IS_COMBINATION_WORKER)
         
         self.added_movies: Set[Tuple[str, str]] = set()
         self.film_data: List[Dict] = []
@@ -250,66 +293,39 @@ class MovieProcessor:
         self.rating_counts: Dict[str, int] = {}
 
     def load_whitelist(self):
-        """Load and initialize the whitelist data."""
+        """Load the whitelist from the SQLite film store, importing whitelist.xlsx if it changed."""
         try:
-            # First check if file exists
-            if not os.path.exists(WHITELIST_PATH):
+            if self.film_store is None:
+                self.film_store = FilmStore(WHITELIST_DB_PATH)
+
+            if not os.path.exists(WHITELIST_PATH) and len(self.film_store) == 0:
                 print_to_csv("whitelist.xlsx not found. Creating new file.")
-                self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-                self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                return
-            
-            # Read the file to see what columns it actually has
-            try:
-                # Try to read without specifying names first to see the actual structure
-                temp_df = pd.read_excel(WHITELIST_PATH, header=0)
-                
-                # Check if we have the expected columns
-                if 'Link' in temp_df.columns and 'Title' in temp_df.columns:
-                    # File has the right structure, read it normally
-                    self.whitelist = temp_df
-                else:
-                    # File exists but has wrong structure, create new one
-                    print_to_csv("Whitelist file has wrong structure. Creating new file.")
-                    self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-                    self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                    return
-                    
-            except Exception as e:
-                print_to_csv(f"Error reading whitelist file: {str(e)}")
-                print_to_csv("Creating new whitelist file.")
-                self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-                self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                return
-            
-            # Normalize the data
-            self.whitelist['Title'] = self.whitelist['Title'].apply(normalize_text)
-            self.whitelist['Year'] = self.whitelist['Year'].astype(str).str.strip()
-            # Fill empty links with empty string instead of None
-            self.whitelist['Link'] = self.whitelist['Link'].fillna('')
-            
-            # Create a lookup dictionary for faster matching using URLs as keys
-            self.whitelist_lookup = {}
-            for idx, row in self.whitelist.iterrows():
-                if row['Link']:  # Only store entries with URLs
-                    try:
-                        # Handle null/empty Information values by treating them as empty dictionaries
-                        if pd.isna(row['Information']) or row['Information'] == '':
-                            info = {}
-                        else:
-                            info = json.loads(row['Information']) if isinstance(row['Information'], str) else row['Information']
-                        self.whitelist_lookup[row['Link']] = (info, idx, row['Link'])  # Added URL to tuple
-                    except (json.JSONDecodeError, TypeError):
-                        # If there's any error parsing, treat it as an empty dictionary
-                        info = {}
-                        self.whitelist_lookup[row['Link']] = (info, idx, row['Link'])  # Added URL to tuple
-                        continue
-                
+                self.film_store.export_to_xlsx(WHITELIST_PATH)
+            else:
+                try:
+                    imported = self.film_store.sync_from_xlsx(WHITELIST_PATH)
+                    if imported is not None:
+                        print_to_csv(f"📝 Imported {imported} whitelist rows from whitelist.xlsx into the film store")
+                except Exception as e:
+                    print_to_csv(f"Error reading whitelist file: {str(e)}")
+                    print_to_csv("Continuing with the existing film store contents.")
+
+            # Lookup dictionary keyed on URL: {link: (info, row_id, link)}
+            self.whitelist_lookup = self.film_store.lookup()
+
         except Exception as e:
             print_to_csv(f"Unexpected error loading whitelist: {str(e)}")
-            print_to_csv("Creating new whitelist file.")
-            self.whitelist = pd.DataFrame(columns=['Title', 'Year', 'Information', 'Link'])
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
+            self.whitelist_lookup = {}
+
+    def save_whitelist(self):
+        """Export the film store back to whitelist.xlsx so it stays hand-editable."""
+        if self.film_store is None:
+            return
+        try:
+            count = self.film_store.export_to_xlsx(WHITELIST_PATH)
+            print_to_csv(f"📝 Exported {count} whitelist rows to whitelist.xlsx")
+        except Exception as e:
+            print_to_csv(f"Error exporting whitelist: {str(e)}")
 
     def load_zero_reviews(self):
         """Load and initialize the zero reviews data."""
@@ -340,7 +356,7 @@ class MovieProcessor:
                 self.zero_reviews_lookup = {}
                 for idx, row in self.zero_reviews.iterrows():
                     if row['Link']:  # Only store entries with URLs
-                        self.zero_reviews_lookup[row['Link']] = idx
+                        self.zero_reviews_lookup[row['Link']] = True
                     
             else:
                 print_to_csv("Zero_Reviews.xlsx not found. Creating new file.")
@@ -408,32 +424,18 @@ class MovieProcessor:
             return False  # Can't update whitelist without URL
             
         try:
-            # Check if URL already exists in whitelist
-            for row_idx, row in self.whitelist.iterrows():
-                url = row.get('Link', '')
-                if url == film_url:
-                    # Update existing entry
-                    self.whitelist.at[row_idx, 'Information'] = json.dumps(movie_data)
-                    self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
-                    # Save to Excel
-                    self.whitelist.to_excel(WHITELIST_PATH, index=False)
-                    self.load_whitelist()  # Reload to ensure consistency
-                    return True
+            if film_url in self.whitelist_lookup:
+                # Update existing entry (single-row write, title/year stay as stored)
+                _, row_idx, _ = self.whitelist_lookup[film_url]
+                if not self.film_store.update_information(film_url, movie_data):
+                    row_idx = self.film_store.upsert(film_url, film_title, release_year, movie_data)
+                self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
+                return True
             
             # Add new entry if URL not found
-            new_row = pd.DataFrame([{
-                'Title': film_title,
-                'Year': release_year,
-                'Information': json.dumps(movie_data),
-                'Link': film_url
-            }])
-            self.whitelist = pd.concat([self.whitelist, new_row], ignore_index=True)
-            self.whitelist_lookup[film_url] = (movie_data, len(self.whitelist) - 1, film_url)
+            row_idx = self.film_store.upsert(film_url, film_title, release_year, movie_data)
+            self.whitelist_lookup[film_url] = (movie_data, row_idx, film_url)
             print_to_csv(f"🔗 Added link to whitelist for {film_title}")
-            
-            # Save to Excel
-            self.whitelist.to_excel(WHITELIST_PATH, index=False)
-            self.load_whitelist()  # Reload to ensure consistency
             return True
             
         except Exception as e:
@@ -468,6 +470,11 @@ class MovieProcessor:
         return None, None  # Movie not in whitelist
 
     def fetch_tmdb_details(self, tmdb_id: str) -> Optional[Tuple[List[str], List[str]]]:
+        # Serve from the on-disk cache (including remembered 404s) before asking TMDB
+        hit, cached = self.tmdb_cache.get(tmdb_id)
+        if hit:
+            return cached
+
         movie_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={TMDB_API_KEY}&append_to_response=keywords"
         response = self.session.get(movie_url)
 
@@ -476,10 +483,13 @@ class MovieProcessor:
             keywords = [keyword['name'] for keyword in movie_data['keywords']['keywords']]
             genre_elements = movie_data['genres']
             genres = [genre['name'] for genre in genre_elements]
+            self.tmdb_cache.put(tmdb_id, keywords, genres)
             return keywords, genres
         else:
             if response.status_code == 401:
                 print_to_csv("Check your API key.")
+            elif response.status_code == 404:
+                self.tmdb_cache.put_not_found(tmdb_id)
             return None
 
     def add_to_blacklist(self, film_title: str, release_year: str, reason: str, film_url: str = None) -> None:
@@ -491,12 +501,9 @@ class MovieProcessor:
         if film_url in self.blacklist_lookup:
             return
             
-        # Add new entry
-        new_row = pd.DataFrame([[film_title, release_year, reason, film_url]],
-                               columns=['Title', 'Year', 'Reason', 'Link'])
-        self.blacklist = pd.concat([self.blacklist, new_row], ignore_index=True)
+        # Add new entry (written to disk with the next batched flush)
+        self.blacklist.append({'Title': film_title, 'Year': release_year, 'Reason': reason, 'Link': film_url})
         self.blacklist_lookup[film_url] = True
-        self.blacklist.to_excel(BLACKLIST_PATH, index=False)
         print_to_csv(f"⚫ {film_title} ({release_year}) added to blacklist {reason}")
 
     def is_whitelisted(self, film_title: str, release_year: str, film_url: str = None) -> bool:
@@ -646,19 +653,15 @@ class MovieProcessor:
             if film_url in self.zero_reviews_lookup:
                 return
                 
-            # Create new row
-            new_row = pd.DataFrame([{
+            # Queue new row (written to disk with the next batched flush)
+            self.zero_reviews.append({
                 'Title': film_title,
                 'Year': release_year,
                 'Blank': '',
                 'Link': film_url
-            }])
-            # Add to DataFrame
-            self.zero_reviews = pd.concat([self.zero_reviews, new_row], ignore_index=True)
+            })
             # Add to lookup
-            self.zero_reviews_lookup[film_url] = len(self.zero_reviews) - 1
-            # Save to Excel
-            self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
+            self.zero_reviews_lookup[film_url] = True
                 
         except Exception as e:
             print_to_csv(f"ERROR adding to zero reviews: {str(e)}")
@@ -673,14 +676,10 @@ class MovieProcessor:
             if film_url in self.zero_reviews_lookup:
                 # 1 in 15 chance to remove the entry after finding it
                 if random.random() < (1/15):
-                    # Get the index from lookup
-                    idx_to_remove = self.zero_reviews_lookup[film_url]
-                    # Remove the row
-                    self.zero_reviews = self.zero_reviews.drop(idx_to_remove)
+                    # Queue removal of the row
+                    self.zero_reviews.remove(film_url)
                     # Remove from lookup
                     del self.zero_reviews_lookup[film_url]
-                    # Save the updated DataFrame
-                    self.zero_reviews.to_excel(ZERO_REVIEWS_PATH, index=False)
                     print_to_csv(f"🗑️  Removed {film_title} from zero reviews list")
                 return True
             return False
@@ -689,7 +688,13 @@ class MovieProcessor:
             print_to_csv(f"ERROR checking zero reviews: {str(e)}")
             return False
 
-def setup_webdriver():
+    def flush_pending_writes(self):
+        """Write buffered blacklist/zero-reviews changes and stop their periodic flushers."""
+        for workbook in (self.blacklist, self.zero_reviews):
+            if isinstance(workbook, DeferredWorkbook):
+                workbook.close()
+
+def setup_webdriver(fast: bool = FAST_BROWSER_PROFILE):
     """Create Chrome driver using undetected-chromedriver to avoid Cloudflare/captcha detection."""
     def _detect_chrome_major_version():
         try:
@@ -734,11 +739,15 @@ def setup_webdriver():
         "safebrowsing.enabled": True,
     }
     options.add_experimental_option("prefs", prefs)
+    if fast:
+        apply_fast_profile(options)
     chrome_major = _detect_chrome_major_version()
     if chrome_major:
         driver = uc.Chrome(options=options, use_subprocess=True, version_main=chrome_major)
     else:
         driver = uc.Chrome(options=options, use_subprocess=True)
+    if fast:
+        enable_resource_blocking(driver, log=print_to_csv)
     return driver
 
 def format_time(seconds):
@@ -835,24 +844,10 @@ def extract_mpaa_rating(driver) -> Optional[str]:
         if not usa_ratings:
             return None
         
-        # Check if ANY USA rating exists and is not unrated
-        # If there are any rated releases, use the most appropriate one
-        rating_map = {
-            'R': 'R',
-            'PG-13': 'PG-13',
-            'PG': 'PG',
-            'G': 'G',
-            'NC-17': 'NC-17',
-            'X': 'NC-17',  # Historical rating
-            'M': 'PG',     # Historical rating
-            'GP': 'PG',    # Historical rating
-        }
-        
-        # First, look for any rated releases (non-NR)
-        for rating in usa_ratings:
-            if rating.upper() not in ['NR', 'NOT RATED', 'UNRATED']:
-                if rating in rating_map:
-                    return rating_map[rating]
+        # Use the first rated (non-NR) USA release; historical ratings map onto their modern equivalent
+        rating = first_mpaa_rating(usa_ratings)
+        if rating:
+            return rating
         
         # If all USA releases were unrated, skip this movie entirely
         # This means the movie was never rated by the MPAA in the USA
@@ -876,6 +871,30 @@ MAX_MOVIES_stats = {
     'country_counts': defaultdict(int)
 }
 
+def load_film_page(driver, film_url: str) -> Dict:
+    """
+    Load a film page on a pool worker's driver and parse it from the page source. Returns a dict
+    whose 'status' is 'ok' (with movie_data/masthead_title), 'error_page', or 'unparsed' when
+    the film should be reloaded on the main driver instead.
+    """
+    driver.get(site_url(film_url))
+    wait_for_markers(driver, FILM_PAGE_MARKERS)
+    try:
+        page_title = driver.title
+        if "not found" in page_title.lower() or "error" in page_title.lower():
+            return {'status': 'error_page', 'page_title': page_title}
+    except Exception:
+        pass
+
+    movie_data, masthead_title = parse_film_page(driver.page_source)
+    if movie_data is None:
+        return {'status': 'unparsed'}
+    # Directors from the same selector update_MAX_MOVIES_statistics reads on the main driver, so
+    # pooled and inline films are counted alike (parse_film_page prefers the #tab-crew links)
+    director_names = (element.text.strip() for element in driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor'))
+    movie_data['Directors'] = [name for name in director_names if name]
+    return {'status': 'ok', 'movie_data': movie_data, 'masthead_title': masthead_title}
+
 def add_to_MAX_MOVIES(film_title: str, release_year: str, tmdb_id: str, film_url: str) -> bool:
     """
     Centralized function to add a movie to MAX_MOVIES_stats.
@@ -900,8 +919,9 @@ def add_to_MAX_MOVIES(film_title: str, release_year: str, tmdb_id: str, film_url
     return True
 
 class LetterboxdScraper:
-    def __init__(self):
-        self.driver = setup_webdriver()
+    def __init__(self, session: BrowserSessionManager):
+        # Browsers come warm from the run-wide session; only the scraper state below is per combination
+        self.driver = session.checkout()
         self.processor = MovieProcessor()
         self.base_url = 'https://letterboxd.com/films/by/rating/'
         self.total_titles = 0
@@ -912,6 +932,8 @@ class LetterboxdScraper:
         self.top_movies_count = 0  # Track the number of movies added to the top genre list
         self.rejected_movies_count = 0  # Add counter for rejected movies
         self._listing_last_url_prev_page: Optional[str] = None
+        # Film pages for a listing page are loaded in parallel; results are consumed in listing order
+        self.film_pool = session.pool
         print_to_csv("Initialized Letterboxd Scraper.")
 
     @staticmethod
@@ -928,7 +950,7 @@ class LetterboxdScraper:
         for container in film_containers:
             try:
                 anchor = container.find_element(By.CSS_SELECTOR, 'a[href*="/film/"]')
-                film_url = anchor.get_attribute('href')
+                film_url = canonical_url(anchor.get_attribute('href'))
                 film_title = None
                 film_title = container.get_attribute('data-item-full-display-name')
                 if not film_title:
@@ -977,7 +999,7 @@ class LetterboxdScraper:
                             f"Available data: data-item-full-display-name='{container.get_attribute('data-item-full-display-name')}', "
                             f"data-item-name='{container.get_attribute('data-item-name')}', anchor-title='{anchor.get_attribute('title')}'"
                         )
-                        print_to_csv(f"   Debug: {debug_info}")
+                        print_to_csv(f"   Debug: {debug_info}", DEBUG)
                     except Exception:
                         pass
                     self.processor.rejected_data.append([film_title, None, None, 'Missing title or URL'])
@@ -986,8 +1008,11 @@ class LetterboxdScraper:
                 continue
         return film_data_list
 
-    def process_movie_data(self, info, film_title=None, film_url=None):
-        """Process movie data from the whitelist using URL as the primary identifier."""
+    def process_movie_data(self, info, film_title=None, film_url=None, page_data=None):
+        """
+        Process movie data from the whitelist using URL as the primary identifier.
+        page_data is the parsed film page when a pool worker (not self.driver) loaded it.
+        """
         try:
             if not info or not film_url:
                 return False
@@ -998,20 +1023,16 @@ class LetterboxdScraper:
             
             # Check if URL has already been processed in this scrape session
             if any(movie['Link'] == film_url for movie in MAX_MOVIES_stats['film_data']):
-                print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.")
+                print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.", DEBUG)
                 return False
                         
             # Process using URL as primary identifier
             if self.processor.is_whitelisted(None, None, film_url):
                 # If info is empty or incomplete, collect fresh data
-                required_fields = [
-                    'Title', 'Year', 'Runtime', 'RatingCount',
-                    'Languages', 'Countries', 'Directors', 'Genres', 'Studios', 'Actors'
-                ]
-                missing_fields = [field for field in required_fields if not info.get(field)]
+                missing_fields = [field for field in WHITELIST_REQUIRED_FIELDS if not info.get(field)]
                 if not info or info == {} or missing_fields:
                     try:
-                        self.driver.get(film_url)
+                        self.driver.get(site_url(film_url))
                         WebDriverWait(self.driver, 10).until(
                             EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property=\"og:title\"]'))
                         )
@@ -1177,7 +1198,7 @@ class LetterboxdScraper:
                 return True
             
             # If not whitelisted, process as a new movie
-            self.process_approved_movie(film_title, release_year, tmdb_id, film_url, 'unfiltered')
+            self.process_approved_movie(film_title, release_year, tmdb_id, film_url, 'unfiltered', page_data=page_data)
             return True
                 
         except Exception as e:
@@ -1186,7 +1207,83 @@ class LetterboxdScraper:
             print_to_csv(f"Error details: {e.__dict__ if hasattr(e, '__dict__') else 'No details available'}")
             return False
 
-    def _process_one_genre_listing_film(self, film_data: dict, seen_titles: set) -> bool:
+    def _submit_film_page_loads(self, film_data_list: List[dict]) -> Dict[str, int]:
+        """Queue pool loads for the films on this page that will need their film page. Returns {url: ticket}."""
+        if self.film_pool is None:
+            return {}
+        session_links = {movie['Link'] for movie in MAX_MOVIES_stats['film_data']}
+        tickets = {}
+        for film_data in film_data_list:
+            film_url = film_data['url']
+            if (
+                film_data['is_blacklisted']
+                or film_url in tickets
+                or film_url in session_links
+                or film_url in self.processor.zero_reviews_lookup
+                or self.processor.is_whitelisted(None, None, film_url)
+            ):
+                continue
+            tickets[film_url] = self.film_pool.submit(lambda worker, film_url=film_url: load_film_page(worker.driver, film_url))
+        return tickets
+
+    def _apply_pooled_film_page(self, page: Dict, film_title: str, release_year: str, film_url: str) -> bool:
+        """
+        Run the listing-film checks on a page a pool worker loaded. Returns False when the film
+        still has to be loaded on self.driver (unparsed page or missing runtime).
+        """
+        if page['status'] == 'error_page':
+            print_to_csv(f"⚠️ Movie page appears to be an error page: {page['page_title']}")
+            return True
+        if page['status'] != 'ok':
+            return False
+
+        page_data = page['movie_data']
+        rating_count = page_data.get('RatingCount') or 0
+        if rating_count == 0:
+            yr = release_year or page_data.get('Year')
+            print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
+            self.processor.add_to_zero_reviews(film_title, yr, film_url)
+            self.processor.rejected_data.append([film_title, yr, None, 'Zero reviews'])
+            self.rejected_movies_count += 1
+            return True
+        if rating_count < MIN_RATING_COUNT:
+            print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {rating_count} ratings.")
+            self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient ratings (< 1000)'])
+            self.rejected_movies_count += 1
+            return True
+
+        runtime = page_data.get('Runtime')
+        if runtime is None:
+            return False
+        release_year = page_data.get('Year')
+        if runtime < MIN_RUNTIME:
+            print_to_csv(f"❌ {film_title} was not added due to insufficient runtime: {runtime} minutes.")
+            self.processor.rejected_data.append([film_title, release_year, None, 'Insufficient runtime (< 40 minutes)'])
+            self.processor.add_to_blacklist(film_title, release_year, 'Insufficient runtime (< 40 minutes)', film_url)
+            self.rejected_movies_count += 1
+            return True
+
+        display_title = page['masthead_title'] or film_title
+        movie_data = {
+            'Title': display_title,
+            'Year': release_year,
+            'tmdbID': page_data.get('tmdbID'),
+            'MPAA': None,
+            'Runtime': runtime,
+            'RatingCount': rating_count,
+            'Languages': [],
+            'Countries': [],
+            'Decade': page_data.get('Decade'),
+            'Directors': [],
+            'Genres': [],
+            'Studios': [],
+            'Actors': [],
+            'Link': film_url
+        }
+        self.process_movie_data(movie_data, display_title, film_url, page_data=page_data)
+        return True
+
+    def _process_one_genre_listing_film(self, film_data: dict, seen_titles: set, ticket: Optional[int] = None) -> bool:
         """Process one browse-row film. Returns True if the outer scrape should stop (MAX_MOVIES reached)."""
         if self.valid_movies_count >= MAX_MOVIES:
             print_to_csv(f"\nReached the target of {MAX_MOVIES} successful movies. Stopping scraping.")
@@ -1212,17 +1309,26 @@ class LetterboxdScraper:
             return False
 
         if any(movie['Link'] == film_url for movie in MAX_MOVIES_stats['film_data']):
-            print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.")
+            print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.", DEBUG)
             return False
 
         if whitelist_info:
             self.process_movie_data(whitelist_info, film_title, film_url)
             return False
 
+        if ticket is not None:
+            try:
+                handled = self._apply_pooled_film_page(self.film_pool.result(ticket), film_title, release_year, film_url)
+            except Exception as e:
+                print_to_csv(f"🔄 Pooled load failed for {film_title} ({str(e)}); loading it on the main browser.")
+                handled = False
+            if handled:
+                return self.valid_movies_count >= MAX_MOVIES
+
         movie_retries = 20
         for retry in range(movie_retries):
             try:
-                self.driver.get(film_url)
+                self.driver.get(site_url(film_url))
                 try:
                     page_title = self.driver.title
                     if "not found" in page_title.lower() or "error" in page_title.lower():
@@ -1353,7 +1459,7 @@ class LetterboxdScraper:
         prev_list: List[dict] = []
         for retry in range(container_retries):
             try:
-                self.driver.get(prev_url)
+                self.driver.get(site_url(prev_url))
                 WebDriverWait(self.driver, 10).until(
                     EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.posteritem'))
                 )
@@ -1367,7 +1473,7 @@ class LetterboxdScraper:
                     f"retry {retry + 1}/{container_retries}"
                 )
                 time.sleep(3)
-                self.driver.get(prev_url)
+                self.driver.get(site_url(prev_url))
                 time.sleep(2)
             except Exception as e:
                 print_to_csv(f"⚠️ Boundary heal load prev page: {e}")
@@ -1383,7 +1489,7 @@ class LetterboxdScraper:
         refreshed: List[dict] = []
         for retry in range(container_retries):
             try:
-                self.driver.get(listing_url)
+                self.driver.get(site_url(listing_url))
                 WebDriverWait(self.driver, 10).until(
                     EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.posteritem'))
                 )
@@ -1397,7 +1503,7 @@ class LetterboxdScraper:
                     f"retry {retry + 1}/{container_retries}"
                 )
                 time.sleep(3)
-                self.driver.get(listing_url)
+                self.driver.get(site_url(listing_url))
                 time.sleep(2)
             except Exception as e:
                 print_to_csv(f"⚠️ Boundary heal load current page: {e}")
@@ -1407,6 +1513,92 @@ class LetterboxdScraper:
             return film_data_list, False
         return refreshed, False
 
+    def _load_listing_containers(self, url: str) -> List:
+        """Load a listing page with retries and return its li.posteritem containers (possibly not a full page)."""
+        # Send a GET request to the URL with retry mechanism
+        page_retries = 20
+        for retry in range(page_retries):
+            try:
+                self.driver.get(site_url(url))
+                
+                # Check if page loaded successfully
+                try:
+                    page_title = self.driver.title
+                    
+                    # Check if we got redirected to an error page
+                    if "not found" in page_title.lower() or "error" in page_title.lower():
+                        print_to_csv(f"❌ Page {self.page_number} appears to be an error page: {page_title}")
+                        self.page_number += 1
+                        continue
+                        
+                except Exception as e:
+                    print_to_csv(f"Warning: Could not get page title: {str(e)}")
+                
+                # Wait for the page to load
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
+                )
+                
+                # Additional check: verify we're on the right page
+                current_url = canonical_url(self.driver.current_url)
+                if current_url != url and "page" not in current_url:
+                    print_to_csv(f"⚠️ Page redirected from {url} to {current_url}")
+                
+                break
+            except Exception as e:
+                if retry == page_retries - 1:
+                    print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
+                    # Try to move to next page instead of crashing
+                    print_to_csv(f"Moving to next page and continuing...")
+                    self.page_number += 1
+                    continue
+                print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
+                time.sleep(2)
+                
+                # Additional error handling for network issues
+                if "timeout" in str(e).lower() or "connection" in str(e).lower():
+                    print_to_csv(f"⚠️ Network issue detected, waiting longer before retry...")
+                    time.sleep(10)  # Wait longer for network issues
+        
+        #time.sleep(random.uniform(1.0, 1.5))
+
+        film_containers = []
+        container_retries = 25
+        for retry in range(container_retries):
+            try:
+                film_containers = WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.posteritem'))
+                )
+                n = len(film_containers)
+                print_to_csv(f"Found {n} film containers on attempt {retry + 1}")
+                if n == EXPECTED_LISTING_POSTERS_PER_PAGE:
+                    print_to_csv(f"✅ Found {n} containers (full page), proceeding...")
+                    break
+                print_to_csv(
+                    f"⚠️ Expected exactly {EXPECTED_LISTING_POSTERS_PER_PAGE} posters, found {n}; "
+                    f"reloading listing... (Attempt {retry + 1}/{container_retries})"
+                )
+                time.sleep(3)
+                self.driver.get(site_url(url))
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
+                )
+                time.sleep(2)
+            except Exception as e:
+                if retry == container_retries - 1:
+                    print_to_csv(f"❌ Failed to find film containers after {container_retries} attempts: {str(e)}")
+                    print_to_csv("Moving to next page and continuing...")
+                    film_containers = []
+                    break
+                print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
+                time.sleep(5)
+                self.driver.refresh()
+                time.sleep(2)
+                if "timeout" in str(e).lower():
+                    print_to_csv("⚠️ Timeout detected, waiting longer before retry...")
+                    time.sleep(10)
+        return film_containers
+
     def scrape_movies(self):
         seen_titles = set()  # <-- Add this at the start of the method
 
@@ -1421,88 +1613,7 @@ class LetterboxdScraper:
             url = f'{self.base_url}page/{self.page_number}/'
             print_to_csv(f"\nLoading page {self.page_number}: {url}")
             
-            # Send a GET request to the URL with retry mechanism
-            page_retries = 20
-            for retry in range(page_retries):
-                try:
-                    self.driver.get(url)
-                    
-                    # Check if page loaded successfully
-                    try:
-                        page_title = self.driver.title
-                        
-                        # Check if we got redirected to an error page
-                        if "not found" in page_title.lower() or "error" in page_title.lower():
-                            print_to_csv(f"❌ Page {self.page_number} appears to be an error page: {page_title}")
-                            self.page_number += 1
-                            continue
-                            
-                    except Exception as e:
-                        print_to_csv(f"Warning: Could not get page title: {str(e)}")
-                    
-                    # Wait for the page to load
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
-                    )
-                    
-                    # Additional check: verify we're on the right page
-                    current_url = self.driver.current_url
-                    if current_url != url and "page" not in current_url:
-                        print_to_csv(f"⚠️ Page redirected from {url} to {current_url}")
-                    
-                    break
-                except Exception as e:
-                    if retry == page_retries - 1:
-                        print_to_csv(f"❌ Failed to load page after {page_retries} attempts: {str(e)}")
-                        # Try to move to next page instead of crashing
-                        print_to_csv(f"Moving to next page and continuing...")
-                        self.page_number += 1
-                        continue
-                    print_to_csv(f"Retry {retry + 1}/{page_retries} loading page {self.page_number}: {str(e)}")
-                    time.sleep(2)
-                    
-                    # Additional error handling for network issues
-                    if "timeout" in str(e).lower() or "connection" in str(e).lower():
-                        print_to_csv(f"⚠️ Network issue detected, waiting longer before retry...")
-                        time.sleep(10)  # Wait longer for network issues
-            
-            #time.sleep(random.uniform(1.0, 1.5))
-
-            film_containers = []
-            container_retries = 25
-            for retry in range(container_retries):
-                try:
-                    film_containers = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.posteritem'))
-                    )
-                    n = len(film_containers)
-                    print_to_csv(f"Found {n} film containers on attempt {retry + 1}")
-                    if n == EXPECTED_LISTING_POSTERS_PER_PAGE:
-                        print_to_csv(f"✅ Found {n} containers (full page), proceeding...")
-                        break
-                    print_to_csv(
-                        f"⚠️ Expected exactly {EXPECTED_LISTING_POSTERS_PER_PAGE} posters, found {n}; "
-                        f"reloading listing... (Attempt {retry + 1}/{container_retries})"
-                    )
-                    time.sleep(3)
-                    self.driver.get(url)
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
-                    )
-                    time.sleep(2)
-                except Exception as e:
-                    if retry == container_retries - 1:
-                        print_to_csv(f"❌ Failed to find film containers after {container_retries} attempts: {str(e)}")
-                        print_to_csv("Moving to next page and continuing...")
-                        film_containers = []
-                        break
-                    print_to_csv(f"Retry {retry + 1}/{container_retries} finding film containers: {str(e)}")
-                    time.sleep(5)
-                    self.driver.refresh()
-                    time.sleep(2)
-                    if "timeout" in str(e).lower():
-                        print_to_csv("⚠️ Timeout detected, waiting longer before retry...")
-                        time.sleep(10)
+            film_containers = self._load_listing_containers(url)
 
             n_posters = len(film_containers)
             if n_posters != EXPECTED_LISTING_POSTERS_PER_PAGE:
@@ -1529,23 +1640,250 @@ class LetterboxdScraper:
             if stop:
                 return
 
-            for film_data in film_data_list:
-                if self._process_one_genre_listing_film(film_data, seen_titles):
-                    return
+            tickets = self._submit_film_page_loads(film_data_list)
+            try:
+                for film_data in film_data_list:
+                    if self._process_one_genre_listing_film(film_data, seen_titles, tickets.pop(film_data['url'], None)):
+                        return
+            finally:
+                # Results nobody collected (target reached, film skipped) are dropped
+                if tickets:
+                    self.film_pool.cancel(tickets.values())
 
             if film_data_list:
                 self._listing_last_url_prev_page = film_data_list[-1]['url']
 
             self.page_number += 1
 
-    def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str):
-        """Process a movie that has been approved."""
+    @staticmethod
+    def _shared_entry(film_data: dict, info: Dict, whitelisted: bool, verdict: str, reason: Optional[str] = None) -> Dict:
+        return {
+            'title': info.get('Title') or film_data['title'],
+            'year': info.get('Year') or film_data['release_year'],
+            'tmdb_id': info.get('tmdbID'),
+            'link': film_data['url'],
+            'info': info,
+            'whitelisted': whitelisted,
+            'verdict': verdict,  # 'approved', 'denied' (outside our criteria, e.g. no TMDB ID) or 'rejected'
+            'reason': reason,
+        }
+
+    def _cached_shared_entry(self, film_data: dict, verdicts: FilmVerdictCache) -> Tuple[Optional[Dict], bool]:
+        """
+        Resolve a ranking row from what is already known. Returns (entry, needs_page); entry is
+        None for skipped films, and for stale whitelist rows it is the stale entry to fall back on.
+        """
+        film_url = film_data['url']
+        if film_data['is_blacklisted']:
+            return None, False
+        if self.processor.is_zero_reviews(film_data['title'], film_data['release_year'], film_url):
+            return None, False
+        info, _ = self.processor.get_whitelist_data(None, None, film_url)
+        if info is not None:
+            entry = self._shared_entry(film_data, info, True, 'approved')
+            return entry, any(not info.get(field) for field in WHITELIST_REQUIRED_FIELDS)
+        cached = verdicts.get(film_url)
+        if cached is None:
+            return None, True
+        verdict, reason, page_data = cached
+        return self._shared_entry(film_data, page_data, False, verdict, reason), False
+
+    def _judge_shared_film(self, film_title: str, page_data: Dict, film_url: str) -> Tuple[str, Optional[str]]:
+        """Apply process_approved_movie's checks to a parsed film page. Returns (verdict, reason)."""
+        release_year = page_data.get('Year')
+        rating_count = page_data.get('RatingCount') or 0
+        if rating_count == 0:
+            print_to_csv(f"📊 {film_title} has no reviews. Adding to zero reviews list.")
+            self.processor.add_to_zero_reviews(film_title, release_year, film_url)
+            return 'rejected', 'Zero reviews'
+        if rating_count < MIN_RATING_COUNT:
+            print_to_csv(f"❌ {film_title} was not added due to insufficient ratings: {rating_count} ratings.")
+            return 'rejected', 'Insufficient ratings (< 1000)'
+
+        runtime = page_data.get('Runtime')
+        if runtime is None:
+            print_to_csv(f"❌ {film_title} was not added due to missing runtime.")
+            return 'denied', 'Missing runtime'
+        if runtime < MIN_RUNTIME:
+            reason = f'Short runtime of {runtime} minutes'
+            print_to_csv(f"❌ {film_title} was not added due to a short runtime of {runtime} minutes.")
+            self.processor.add_to_blacklist(film_title, release_year, reason, film_url)
+            return 'rejected', reason
+
+        tmdb_id = page_data.get('tmdbID')
+        if not tmdb_id:
+            print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
+            return 'denied', 'Missing TMDB ID'
+        tmdb_data = self.processor.fetch_tmdb_details(tmdb_id)
+        if tmdb_data is None:
+            print_to_csv(f"❌ {film_title} was not added due to failed TMDB data fetch.")
+            return 'denied', 'Failed TMDB data fetch'
+
+        keywords, genres = tmdb_data
+        lowered_keywords = [kw.lower() for kw in keywords]
+        lowered_genres = [gen.lower() for gen in genres]
+        for matches in ([k for k in FILTER_KEYWORDS if k.lower() in lowered_keywords],
+                        [g for g in FILTER_GENRES if g.lower() in lowered_genres]):
+            if matches:
+                reason = f"due to being a {', '.join(matches)}."
+                print_to_csv(f"❌ {film_title} was not added {reason}")
+                self.processor.add_to_blacklist(film_title, release_year, reason, film_url)
+                return 'rejected', reason
+        return 'approved', None
+
+    def _shared_entry_from_page(self, film_data: dict, ticket: Optional[int], stale_entry: Optional[Dict],
+                                verdicts: FilmVerdictCache) -> Optional[Dict]:
+        """Load (or collect from the pool) a film page and turn it into a shared-crawl entry."""
+        film_url = film_data['url']
+        page = None
+        if ticket is not None:
+            try:
+                page = self.film_pool.result(ticket)
+            except Exception as e:
+                print_to_csv(f"🔄 Pooled load failed for {film_data['title']} ({str(e)}); loading it on the main browser.")
+        if page is None or page['status'] == 'unparsed':
+            try:
+                page = load_film_page(self.driver, film_url)
+            except Exception as e:
+                print_to_csv(f"❌ Could not load {film_data['title']}: {str(e)}")
+                page = {'status': 'failed'}
+
+        if page['status'] != 'ok':
+            if page['status'] == 'error_page':
+                print_to_csv(f"⚠️ Movie page appears to be an error page: {page['page_title']}")
+            # A stale whitelist row with genres is still better than dropping the film
+            if stale_entry is not None and stale_entry['info'].get('Genres'):
+                return stale_entry
+            return None
+
+        page_data = {key: value for key, value in page['movie_data'].items() if key != 'Link'}
+        display_title = page['masthead_title'] or film_data['title']
+        if stale_entry is not None:
+            page_data['Title'] = stale_entry['info'].get('Title') or display_title
+            if self.processor.update_whitelist(page_data['Title'], page_data.get('Year'), page_data, film_url):
+                print_to_csv(f"📝 Updated whitelist data for {page_data['Title']}")
+            return self._shared_entry(film_data, page_data, True, 'approved')
+
+        page_data['Title'] = display_title
+        verdict, reason = self._judge_shared_film(display_title, page_data, film_url)
+        # Blacklist and zero-review verdicts are already persisted; rating counts grow, so those expire
+        if verdict == 'approved' or (reason or '').startswith('Insufficient ratings'):
+            verdicts.put(film_url, verdict, reason, page_data)
+        return self._shared_entry(film_data, page_data, False, verdict, reason)
+
+    def _process_shared_rows(self, film_data_list: List[dict], top_lists: GenreTopLists, verdicts: FilmVerdictCache) -> None:
+        """Resolve one ranking page in order and offer each film to the genre lists it belongs to."""
+        resolved = []
+        tickets = {}
+        for film_data in film_data_list:
+            entry, needs_page = self._cached_shared_entry(film_data, verdicts)
+            resolved.append((film_data, entry, needs_page))
+            if needs_page and self.film_pool is not None:
+                tickets[film_data['url']] = self.film_pool.submit(
+                    lambda worker, film_url=film_data['url']: load_film_page(worker.driver, film_url)
+                )
+        try:
+            for film_data, entry, needs_page in resolved:
+                self.total_titles += 1
+                if needs_page:
+                    entry = self._shared_entry_from_page(film_data, tickets.pop(film_data['url'], None), entry, verdicts)
+                if entry is None:
+                    self.rejected_movies_count += 1
+                    continue
+                genre_names = entry['info'].get('Genres') or []
+                if entry['verdict'] == 'denied':
+                    top_lists.deny(entry, genre_names)
+                    continue
+                if entry['verdict'] != 'approved':
+                    self.rejected_movies_count += 1
+                    continue
+                added = top_lists.offer(entry, genre_names)
+                if added:
+                    print_to_csv(f"✅ {entry['title']} added to {', '.join(added)}")
+                    # 2% chance to clear the whitelist data for random auditing
+                    if entry['whitelisted'] and random.random() < 0.02:
+                        self.processor.update_whitelist(entry['title'], entry['year'], {}, entry['link'])
+                        print_to_csv(f"🤓 Random data audit scheduled for {entry['title']} ({entry['year']})")
+        finally:
+            if tickets:
+                self.film_pool.cancel(tickets.values())
+
+    def _save_shared_genre(self, genre: str, sort_type: str, top_lists: GenreTopLists) -> int:
+        """Replay one genre's list through the usual per-combination state, write its outputs and return its film count."""
+        self.reset_MAX_MOVIES_stats()
+        self.reset_counters()
+        for entry in top_lists.lists[genre]:
+            if entry['whitelisted']:
+                self.processor.process_whitelist_info(entry['info'], entry['link'])
+            else:
+                self.processor.unfiltered_approved.append([entry['title'], entry['year'], entry['tmdb_id'], entry['link']])
+                self.processor.film_data.append({
+                    'Title': entry['title'],
+                    'Year': entry['year'],
+                    'tmdbID': entry['tmdb_id'],
+                    'Link': entry['link']
+                })
+                if add_to_MAX_MOVIES(entry['title'], entry['year'], entry['tmdb_id'], entry['link']):
+                    self.update_MAX_MOVIES_statistics(entry['title'], entry['year'], entry['tmdb_id'], entry['info'], entry['link'])
+            self.valid_movies_count += 1
+        for entry in top_lists.denied[genre]:
+            self.processor.unfiltered_denied.append([entry['title'], entry['year'], None, entry['link']])
+        self.save_results(genre, sort_type)
+        print_to_csv(f"✅ Saved {genre} {sort_type} from the shared crawl ({self.valid_movies_count} films)")
+        return self.valid_movies_count
+
+    def scrape_shared(self, genres: List[str], sort_type: str) -> Dict[str, int]:
+        """
+        Walk /films/by/{sort_type}/ once and build every genre's top list from it. Saves each
+        genre that filled up and returns {genre: films saved} for those; the rest are left for
+        per-genre crawls.
+        """
+        self.base_url = f'https://letterboxd.com/films/by/{sort_type}/'
+        top_lists = GenreTopLists(genres, MAX_MOVIES)
+        verdicts = FilmVerdictCache(FILM_VERDICT_CACHE_PATH, ttl_days=FILM_VERDICT_TTL_DAYS)
+        seen_urls = set()
+        self.page_number = 1
+        try:
+            while not top_lists.complete and self.page_number <= SHARED_CRAWL_MAX_PAGES:
+                url = f'{self.base_url}page/{self.page_number}/'
+                print_to_csv(f"\nLoading page {self.page_number}: {url}")
+                film_containers = self._load_listing_containers(url)
+                if len(film_containers) != EXPECTED_LISTING_POSTERS_PER_PAGE:
+                    print_to_csv(f"❌ Expected {EXPECTED_LISTING_POSTERS_PER_PAGE} posters, found {len(film_containers)}. Moving to next page...")
+                    self.page_number += 1
+                    continue
+                # Rows that shift across a page boundary mid-crawl are only counted once
+                film_data_list = []
+                for film_data in self._build_film_data_list_from_containers(film_containers):
+                    if film_data['url'] not in seen_urls:
+                        seen_urls.add(film_data['url'])
+                        film_data_list.append(film_data)
+                self._process_shared_rows(film_data_list, top_lists, verdicts)
+                print_to_csv(f"📚 Genre lists after page {self.page_number}: {top_lists.progress()}")
+                self.page_number += 1
+        finally:
+            print_to_csv(verdicts.summary())
+            verdicts.close()
+
+        unfilled = top_lists.unfilled()
+        if unfilled:
+            print_to_csv(f"⚠️ Shared {sort_type} crawl stopped with {', '.join(unfilled)} short of {MAX_MOVIES}; they get their own crawl.")
+        saved = {}
+        for genre in genres:
+            if top_lists.is_full(genre):
+                saved[genre] = self._save_shared_genre(genre, sort_type, top_lists)
+        return saved
+
+    def process_approved_movie(self, film_title: str, release_year: str, tmdb_id: str, film_url: str, approval_type: str, page_data: Optional[Dict] = None):
+        """Process a movie that has been approved. page_data replaces self.driver for pool-loaded pages."""
         try:
             # Extract TMDB ID from page source
             try:
-                page_source = self.driver.page_source
+                page_source = self.driver.page_source if page_data is None else ''
                 tmdb_match = re.search(r'data-tmdb-id="(\d+)"', page_source)
-                if tmdb_match:
+                if page_data is not None and page_data.get('tmdbID'):
+                    tmdb_id = page_data['tmdbID']
+                elif tmdb_match:
                     tmdb_id = tmdb_match.group(1)
                 else:
                     print_to_csv(f"❌ {film_title} was not added due to missing TMDB ID.")
@@ -1565,7 +1903,9 @@ class LetterboxdScraper:
             rating_count = 0
             try:
                 match = re.search(r'ratingCount":(\d+)', page_source)
-                if match:
+                if page_data is not None:
+                    rating_count = page_data.get('RatingCount') or 0
+                elif match:
                     rating_count = int(match.group(1))
             except Exception as e:
                 print_to_csv(f"Error extracting rating count: {str(e)}")
@@ -1584,13 +1924,16 @@ class LetterboxdScraper:
                 return
 
             runtime = None
-            try:
-                runtime_text = self.driver.find_element(By.CSS_SELECTOR, 'p.text-link.text-footer').text
-                rm = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
-                if rm:
-                    runtime = int(rm.group(1))
-            except Exception:
-                runtime = None
+            if page_data is not None:
+                runtime = page_data.get('Runtime')
+            else:
+                try:
+                    runtime_text = self.driver.find_element(By.CSS_SELECTOR, 'p.text-link.text-footer').text
+                    rm = re.search(r'(\d+)\s*min(?:s)?', runtime_text)
+                    if rm:
+                        runtime = int(rm.group(1))
+                except Exception:
+                    runtime = None
 
             if runtime is None:
                 print_to_csv(f"❌ {film_title} was not added due to missing runtime.")
@@ -1666,14 +2009,14 @@ class LetterboxdScraper:
                     'Link': film_url
                 })
                 # Update statistics for this movie
-                self.update_MAX_MOVIES_statistics(film_title, release_year, tmdb_id, self.driver, film_url)
+                self.update_MAX_MOVIES_statistics(film_title, release_year, tmdb_id, page_data if page_data is not None else self.driver, film_url)
 
         except Exception as e:
             print_to_csv(f"Error processing approved movie {film_title}: {str(e)}")
             self.processor.rejected_data.append([film_title, release_year, None, f'Error processing: {str(e)}'])
             return False
 
-    def update_MAX_MOVIES_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver, film_url: str = None):
+    def update_MAX_MOVIES_statistics(self, film_title: str, release_year: str, tmdb_id: str, driver_or_data, film_url: str = None):
         """Update statistics for the given movie for MAX_MOVIES."""
         if not film_url:
             print_to_csv("WARNING: No film URL provided for statistics update")
@@ -1686,6 +2029,24 @@ class LetterboxdScraper:
         if not movie_data:
             return
 
+        # Use parsed page data if provided (dict), otherwise read the driver's current page
+        if isinstance(driver_or_data, dict):
+            for director in driver_or_data.get('Directors', []):
+                MAX_MOVIES_stats['director_counts'][director] += 1
+            for actor in driver_or_data.get('Actors', []):
+                MAX_MOVIES_stats['actor_counts'][actor] += 1
+            decade = driver_or_data.get('Decade')
+            if decade:
+                MAX_MOVIES_stats['decade_counts'][decade] += 1
+            for field, counts in (('Genres', 'genre_counts'), ('Studios', 'studio_counts'),
+                                  ('Languages', 'language_counts'), ('Countries', 'country_counts')):
+                values = driver_or_data.get(field, [])
+                for value in values:
+                    MAX_MOVIES_stats[counts][value] += 1
+                movie_data[field] = values
+            return
+        driver = driver_or_data
+
         # Directors
         try:
             director_elements = driver.find_elements(By.CSS_SELECTOR, 'span.creatorlist a.contributor')
@@ -1896,7 +2257,7 @@ class LetterboxdScraper:
 
         # Save unfiltered approved data (append mode)
         approved_path = os.path.join(BASE_DIR, 'unfiltered_approved.csv')
-        with open(approved_path, mode='a', newline='', encoding='utf-8') as file:
+        with FileLock(approved_path), open(approved_path, mode='a', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             # Write header if file is empty
             if file.tell() == 0:
@@ -1910,7 +2271,7 @@ class LetterboxdScraper:
 
         # Save unfiltered denied data (append mode)
         denied_path = os.path.join(BASE_DIR, 'unfiltered_denied.csv')
-        with open(denied_path, mode='a', newline='', encoding='utf-8') as file:
+        with FileLock(denied_path), open(denied_path, mode='a', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             # Write header if file is empty
             if file.tell() == 0:
@@ -1992,7 +2353,7 @@ class LetterboxdScraper:
         
         # Save unfiltered approved data (append mode)
         approved_path = os.path.join(BASE_DIR, 'unfiltered_approved.csv')
-        with open(approved_path, mode='a', newline='', encoding='utf-8') as file:
+        with FileLock(approved_path), open(approved_path, mode='a', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             # Write header if file is empty
             if file.tell() == 0:
@@ -2006,7 +2367,7 @@ class LetterboxdScraper:
 
         # Save unfiltered denied data (append mode)
         denied_path = os.path.join(BASE_DIR, 'unfiltered_denied.csv')
-        with open(denied_path, mode='a', newline='', encoding='utf-8') as file:
+        with FileLock(denied_path), open(denied_path, mode='a', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             # Write header if file is empty
             if file.tell() == 0:
@@ -2017,120 +2378,258 @@ class LetterboxdScraper:
                 else:
                     print_to_csv(f"Warning: Movie data incomplete for {movie[0] if movie else 'Unknown'}")
 
-def main():
+GENRES = ["action", "adventure", "animation", "comedy", "crime", "drama", "family", "fantasy", "history", "horror", "music", "mystery", "romance", "science-fiction", "thriller", "war", "western"]  # List of genres to iterate through
+# GENRES = ['history', 'war'] # Test only some genres
+SORT_TYPES = ["rating", "popular"]  # Loop through both "rating" and "popular"
+# SORT_TYPES = ["rating"] # Test only one sort type
+MAX_COMBINATION_RETRIES = 10  # Maximum number of retries for each genre/sort combination
+RUN_SUMMARY_PATH = os.path.join(BASE_DIR, 'genre_run_summary.csv')  # Per-combination timings for the last run
+
+def run_genre_combination(session: BrowserSessionManager, genre: str, sort_type: str, MAX_RETRIES: int = MAX_COMBINATION_RETRIES) -> Dict:
     """
-    Main function that processes all genre/sort type combinations with retry logic.
-    
-    Key features:
+    Scrape one genre/sort combination with retry logic and return its summary
+    (genre, sort_type, status, attempts, accepted, seconds, error).
+
     - Retries failed genre/sort combinations up to MAX_RETRIES times
     - Distinguishes between retryable and non-retryable errors
-    - Ensures full output for each combination before moving to the next
     - Uses exponential backoff for retry delays
     - Saves emergency results for failed combinations
     """
     global current_scraper
-    genres = ["action", "adventure", "animation", "comedy", "crime", "drama", "family", "fantasy", "history", "horror", "music", "mystery", "romance", "science-fiction", "thriller", "war", "western"]  # List of genres to iterate through
-    # genres =['history', 'war'] # Test only some genres
-
-    start_time = time.time()
-    MAX_RETRIES = 10  # Maximum number of retries for each genre/sort combination
+    combination_start = time.time()
+    accepted = 0
+    last_error = ''
+    retry_count = 0
+    success = False
     
-    for genre in genres:
-        for sort_type in ["rating", "popular"]:  # Loop through both "rating" and "popular"
-        # for sort_type in ["rating"]: # Test only one sort type
-            retry_count = 0
-            success = False
+    while retry_count <= MAX_RETRIES and not success:
+        scraper = None
+        try:
+            if retry_count > 0:
+                print_to_csv(f"\n{'Retrying genre/sort combination':=^100}")
+                print_to_csv(f"Genre: {genre}, Sort: {sort_type} (Attempt {retry_count + 1}/{MAX_RETRIES + 1})")
+            else:
+                print_to_csv(f"\n{'Starting new genre/sort combination':=^100}")
+                print_to_csv(f"Genre: {genre}, Sort: {sort_type}")
             
-            while retry_count <= MAX_RETRIES and not success:
-                scraper = None
-                try:
-                    if retry_count > 0:
-                        print_to_csv(f"\n{'Retrying genre/sort combination':=^100}")
-                        print_to_csv(f"Genre: {genre}, Sort: {sort_type} (Attempt {retry_count + 1}/{MAX_RETRIES + 1})")
-                    else:
-                        print_to_csv(f"\n{'Starting new genre/sort combination':=^100}")
-                        print_to_csv(f"Genre: {genre}, Sort: {sort_type}")
-                    
-                    scraper = LetterboxdScraper()
-                    # Update global variable for signal handler
-                    current_scraper = scraper
-                    
-                    scraper.base_url = f'https://letterboxd.com/films/genre/{genre}/by/{sort_type}/'  # Update base URL for the genre and sort type
-                    scraper.reset_MAX_MOVIES_stats()  # Reset statistics for new genre/sort type
-                    scraper.reset_counters()  # Reset counters for new genre/sort type
-                    scraper.scrape_movies()
-                    scraper.save_results(genre, sort_type)  # Pass genre and sort_type to save_results
-
-                    # Format final statistics
-                    print_to_csv(f"\n{'Final Statistics':=^100}")
-                    print_to_csv(f"{'Total movies scraped:':<30} {scraper.total_titles:>10}")
-                    print_to_csv(f"{'Total accepted:':<30} {scraper.valid_movies_count:>10}")
-                    print_to_csv(f"{'Total rejected:':<30} {scraper.rejected_movies_count:>10}")  # Use counter instead of len(rejected_data)
-                    print_to_csv(f"{'Total unfiltered approved:':<30} {len(scraper.processor.unfiltered_approved):>10}")
-                    print_to_csv(f"{'Total unfiltered denied:':<30} {len(scraper.processor.unfiltered_denied):>10}")
-
-                    # Format execution time
-                    execution_time = time.time() - start_time
-                    print_to_csv(f"\n{'Execution Summary':=^100}")
-                    print_to_csv(f"Total execution time: {format_time(execution_time)}")
-                    print_to_csv(f"Average processing speed: {scraper.valid_movies_count / execution_time:.2f} movies/second")
-                    
-                    # Mark as successful
-                    success = True
-                    print_to_csv(f"✅ Successfully completed {genre} {sort_type}")
+            scraper = LetterboxdScraper(session)
+            # Update global variable for signal handler
+            current_scraper = scraper
+            
+            scraper.base_url = f'https://letterboxd.com/films/genre/{genre}/by/{sort_type}/'  # Update base URL for the genre and sort type
+            scraper.reset_MAX_MOVIES_stats()  # Reset statistics for new genre/sort type
+            scraper.reset_counters()  # Reset counters for new genre/sort type
+            scraper.scrape_movies()
+            scraper.save_results(genre, sort_type)  # Pass genre and sort_type to save_results
+
+            # Format final statistics
+            print_to_csv(f"\n{'Final Statistics':=^100}")
+            print_to_csv(f"{'Total movies scraped:':<30} {scraper.total_titles:>10}")
+            print_to_csv(f"{'Total accepted:':<30} {scraper.valid_movies_count:>10}")
+            print_to_csv(f"{'Total rejected:':<30} {scraper.rejected_movies_count:>10}")  # Use counter instead of len(rejected_data)
+            print_to_csv(f"{'Total unfiltered approved:':<30} {len(scraper.processor.unfiltered_approved):>10}")
+            print_to_csv(f"{'Total unfiltered denied:':<30} {len(scraper.processor.unfiltered_denied):>10}")
+            print_to_csv(scraper.processor.tmdb_cache.summary())
+
+            # Format execution time
+            execution_time = time.time() - combination_start
+            print_to_csv(f"\n{'Execution Summary':=^100}")
+            print_to_csv(f"Total execution time: {format_time(execution_time)}")
+            print_to_csv(f"Average processing speed: {scraper.valid_movies_count / execution_time:.2f} movies/second")
+            
+            # Mark as successful
+            success = True
+            accepted = scraper.valid_movies_count
+            print_to_csv(f"✅ Successfully completed {genre} {sort_type}")
 
-                except Exception as e:
-                    retry_count += 1
-                    print_to_csv(f"\n{'Error':=^100}")
-                    print_to_csv(f"❌ An error occurred during execution: {e}")
-                    print_to_csv(f"Error type: {type(e).__name__}")
-                    print_to_csv(f"Error details: {str(e)}")
-                    
-                    # Check if error is retryable
-                    if not is_retryable_error(e):
-                        print_to_csv(f"❌ Non-retryable error detected. Moving to next combination.")
-                        # Save emergency results for this failed combination
-                        if scraper is not None:
-                            try:
-                                scraper.save_results_emergency(genre, sort_type)
-                                print_to_csv(f"💾 Emergency results saved for {genre} {sort_type}")
-                            except Exception as save_error:
-                                print_to_csv(f"❌ Failed to save emergency results: {save_error}")
-                        break  # Exit retry loop
-                    
-                    if retry_count <= MAX_RETRIES:
-                        print_to_csv(f"🔄 Will retry {genre} {sort_type} (Attempt {retry_count + 1}/{MAX_RETRIES + 1})")
-                        # Wait before retrying
-                        wait_time = min(30 * retry_count, 120)  # Exponential backoff, max 2 minutes
-                        print_to_csv(f"⏳ Waiting {wait_time} seconds before retry...")
-                        time.sleep(wait_time)
-                    else:
-                        print_to_csv(f"❌ Failed to complete {genre} {sort_type} after {MAX_RETRIES + 1} attempts. Moving to next combination.")
-                        # Save emergency results for this failed combination
-                        if scraper is not None:
-                            try:
-                                scraper.save_results_emergency(genre, sort_type)
-                                print_to_csv(f"💾 Emergency results saved for {genre} {sort_type}")
-                            except Exception as save_error:
-                                print_to_csv(f"❌ Failed to save emergency results: {save_error}")
-                finally:
-                    # Always try to clean up the scraper
-                    if scraper is not None:
-                        try:
-                            print_to_csv("Cleaning up scraper...")
-                            scraper.driver.quit()
-                            print_to_csv("Scraper cleaned up successfully")
-                            # Clear global variable
-                            current_scraper = None
-                        except Exception as cleanup_error:
-                            print_to_csv(f"Error during cleanup: {cleanup_error}")
-                            # Force quit if normal quit fails
-                            try:
-                                scraper.driver.service.process.kill()
-                            except:
-                                pass
-                            # Clear global variable
-                            current_scraper = None
+        except Exception as e:
+            retry_count += 1
+            last_error = str(e)
+            print_to_csv(f"\n{'Error':=^100}")
+            print_to_csv(f"❌ An error occurred during execution: {e}")
+            print_to_csv(f"Error type: {type(e).__name__}")
+            print_to_csv(f"Error details: {str(e)}")
+            
+            # Check if error is retryable
+            if not is_retryable_error(e):
+                print_to_csv(f"❌ Non-retryable error detected. Moving to next combination.")
+                # Save emergency results for this failed combination
+                if scraper is not None:
+                    try:
+                        scraper.save_results_emergency(genre, sort_type)
+                        print_to_csv(f"💾 Emergency results saved for {genre} {sort_type}")
+                    except Exception as save_error:
+                        print_to_csv(f"❌ Failed to save emergency results: {save_error}")
+                break  # Exit retry loop
+            
+            if retry_count <= MAX_RETRIES:
+                print_to_csv(f"🔄 Will retry {genre} {sort_type} (Attempt {retry_count + 1}/{MAX_RETRIES + 1})")
+                # Wait before retrying
+                wait_time = min(30 * retry_count, 120)  # Exponential backoff, max 2 minutes
+                print_to_csv(f"⏳ Waiting {wait_time} seconds before retry...")
+                time.sleep(wait_time)
+            else:
+                print_to_csv(f"❌ Failed to complete {genre} {sort_type} after {MAX_RETRIES + 1} attempts. Moving to next combination.")
+                # Save emergency results for this failed combination
+                if scraper is not None:
+                    try:
+                        scraper.save_results_emergency(genre, sort_type)
+                        print_to_csv(f"💾 Emergency results saved for {genre} {sort_type}")
+                    except Exception as save_error:
+                        print_to_csv(f"❌ Failed to save emergency results: {save_error}")
+        finally:
+            # The browsers stay up for the next combination; only the scraper is dropped
+            if scraper is not None:
+                # Flush batched writes so the next combination reads up-to-date workbooks
+                scraper.processor.flush_pending_writes()
+                current_scraper = None
+
+    return {
+        'genre': genre,
+        'sort_type': sort_type,
+        'status': 'ok' if success else 'failed',
+        'attempts': retry_count + 1 if success else retry_count,
+        'accepted': accepted,
+        'seconds': time.time() - combination_start,
+        'error': '' if success else last_error,
+    }
+
+def combination_log_name(genre: str, sort_type: str) -> str:
+    return f'All_Outputs.{genre}_{sort_type}.csv'
+
+def _init_combination_worker(workers: int):
+    """ProcessPoolExecutor initializer: one warm browser session per worker process."""
+    global browser_session, IS_COMBINATION_WORKER
+    IS_COMBINATION_WORKER = True
+    # Split the film-page workers between processes so the total browser count stays about the same
+    browser_session = BrowserSessionManager(setup_webdriver, pool_size=max(1, FILM_WORKERS // workers), log=print_to_csv)
+    Finalize(browser_session, browser_session.close, exitpriority=10)
+    Finalize(None, flush_all, exitpriority=5)
+
+def _run_combination_in_worker(genre: str, sort_type: str) -> Dict:
+    global OUTPUT_LOG_NAME, LOG_PREFIX
+    OUTPUT_LOG_NAME = combination_log_name(genre, sort_type)
+    LOG_PREFIX = f"[{genre} {sort_type}] "
+    return run_genre_combination(browser_session, genre, sort_type)
+
+def run_combinations_in_processes(combinations: List[Tuple[str, str]], workers: int) -> List[Dict]:
+    """Fan combinations out to a process pool; each process has its own browsers and log file."""
+    print_to_csv(f"🚀 Running {len(combinations)} genre/sort combinations across {workers} worker processes")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_combination_worker, initargs=(workers,)) as executor:
+        futures = {executor.submit(_run_combination_in_worker, genre, sort_type): (genre, sort_type)
+                   for genre, sort_type in combinations}
+        for future in as_completed(futures):
+            genre, sort_type = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'genre': genre, 'sort_type': sort_type, 'status': 'failed', 'attempts': 0,
+                          'accepted': 0, 'seconds': 0.0, 'error': f"worker crashed: {str(e)}"}
+            icon = "✅" if result['status'] == 'ok' else "❌"
+            print_to_csv(f"{icon} {genre} {sort_type} finished in {format_time(result['seconds'])} "
+                         f"({len(results) + 1}/{len(combinations)})")
+            results.append(result)
+    merge_combination_logs(combinations)
+    return results
+
+def merge_combination_logs(combinations: List[Tuple[str, str]]):
+    """Append each worker log to All_Outputs.csv in combination order, then remove it."""
+    flush_output_logs()
+    with open(os.path.join(BASE_DIR, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as merged:
+        for genre, sort_type in combinations:
+            part_path = os.path.join(BASE_DIR, combination_log_name(genre, sort_type))
+            if not os.path.exists(part_path):
+                continue
+            with open(part_path, mode='r', newline='', encoding='utf-8') as part:
+                merged.write(part.read())
+            os.remove(part_path)
+
+def print_run_summary(results: List[Dict], run_start: float):
+    """Print per-combination timings for the whole run and write them to genre_run_summary.csv."""
+    order = {(genre, sort_type): i for i, (genre, sort_type) in enumerate((g, s) for g in GENRES for s in SORT_TYPES)}
+    results = sorted(results, key=lambda r: order.get((r['genre'], r['sort_type']), -1))
+    wall_time = time.time() - run_start
+    busy_time = sum(r['seconds'] for r in results)
+
+    print_to_csv(f"\n{'Run Summary':=^100}")
+    print_to_csv(f"{'Genre':<18}{'Sort':<10}{'Status':<9}{'Attempts':>9}{'Films':>8}{'Time':>14}")
+    for r in results:
+        print_to_csv(f"{r['genre']:<18}{r['sort_type']:<10}{r['status']:<9}{r['attempts']:>9}{r['accepted']:>8}{format_time(r['seconds']):>14}")
+    failed = [r for r in results if r['status'] == 'failed']
+    print_to_csv(f"{len(results) - len(failed)}/{len(results)} combinations succeeded")
+    for r in failed:
+        print_to_csv(f"❌ {r['genre']} {r['sort_type']}: {r['error']}")
+    print_to_csv(f"Total execution time: {format_time(wall_time)} (combination time {format_time(busy_time)}, "
+                 f"{busy_time / wall_time if wall_time else 0:.1f}x parallelism)")
+
+    pd.DataFrame(results, columns=['genre', 'sort_type', 'status', 'attempts', 'accepted', 'seconds', 'error']).to_csv(
+        RUN_SUMMARY_PATH, index=False, encoding='utf-8'
+    )
+
+def main(workers: int = 1):
+    """
+    Process every genre/sort combination: the shared crawl first (when enabled), then each
+    remaining combination on its own, either one after another or across `workers` processes.
+    """
+    global current_scraper, browser_session
+    run_start = time.time()
+    results = []
+    # One main browser plus the film-page workers serve every combination run in this process
+    browser_session = BrowserSessionManager(setup_webdriver, pool_size=FILM_WORKERS, log=print_to_csv)
+
+    # Genre/sort combinations already written by the shared crawl
+    completed = set()
+    if SHARED_CRAWL:
+        for sort_type in SORT_TYPES:
+            scraper = None
+            shared_start = time.time()
+            saved = {}
+            try:
+                print_to_csv(f"\n{f' Shared {sort_type} crawl for all genres ':=^100}")
+                scraper = LetterboxdScraper(browser_session)
+                current_scraper = scraper
+                saved = scraper.scrape_shared(GENRES, sort_type)
+                completed.update((genre, sort_type) for genre in saved)
+            except Exception as e:
+                print_to_csv(f"❌ Shared {sort_type} crawl failed ({str(e)}); falling back to per-genre crawls.")
+            finally:
+                if scraper is not None:
+                    scraper.processor.flush_pending_writes()
+                    current_scraper = None
+            results.append({'genre': f'shared ({len(saved)} genres)', 'sort_type': sort_type, 'status': 'ok' if saved else 'failed',
+                            'attempts': 1, 'accepted': sum(saved.values()), 'seconds': time.time() - shared_start, 'error': ''})
+
+    pending = [(genre, sort_type) for genre in GENRES for sort_type in SORT_TYPES if (genre, sort_type) not in completed]
+    if workers > 1 and len(pending) > 1:
+        # The worker processes bring their own browsers
+        print_to_csv(browser_session.summary())
+        browser_session.close()
+        browser_session = None
+        results.extend(run_combinations_in_processes(pending, min(workers, len(pending))))
+    else:
+        for genre, sort_type in pending:
+            results.append(run_genre_combination(browser_session, genre, sort_type))
+
+    if browser_session is not None:
+        print_to_csv(browser_session.summary())
+        browser_session.close()
+        browser_session = None
+
+    print_run_summary(results, run_start)
+
+    # Write the film store back to whitelist.xlsx once for the whole run instead of per film
+    film_store = FilmStore(WHITELIST_DB_PATH)
+    try:
+        count = film_store.export_to_xlsx(WHITELIST_PATH)
+        print_to_csv(f"📝 Exported {count} whitelist rows to whitelist.xlsx")
+    except Exception as e:
+        print_to_csv(f"Error exporting whitelist: {str(e)}")
+    finally:
+        film_store.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Scrape the Letterboxd top 250 lists for every genre.")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Run genre/sort combinations in this many parallel processes (default 1: one at a time)")
+    main(workers=max(1, parser.parse_args().workers))
\ No newline at end of file
@@ -0,0 +1,483 @@
+"""
+Local stand-in for Letterboxd, the TMDB API, BoxOfficeMojo and the GitHub API, for offline
+end-to-end runs.
+
+Each site gets its own port (Letterboxd on --port, TMDB on --port + 1, BoxOfficeMojo on
+--port + 2, GitHub on --port + 3) and serves generated pages with the markup the scrapers read: listing pages
+(72 posters per /films/ page, 100 per ranked list page), film pages, TMDB movie JSON and
+lifetime-gross charts. The catalogue is --films synthetic films, generated the same way on
+every run, so repeated runs do the same work. Latency, 429s with Retry-After and
+Cloudflare-style challenge pages can be injected to exercise the rate limiter and the
+browser fallbacks. The GitHub stand-in keeps an in-memory repository and implements the
+Git data API calls github_publisher.py makes (refs, commits, trees); faults are not
+injected there.
+
+Start it, export the printed variables (see site_urls.py), then run 5000 Pop and Top.py,
+Genre 250s.py or Update JSONs.py as usual. Ctrl+C prints request counts and throughput.
+Requests are still paced by the production host's budget in rate_limiter.py.
+
+    python "Mock Site Server.py" --latency 0.2 --jitter 0.1 --rate-limit-ratio 0.02 --challenge-ratio 0.01
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import signal
+import threading
+import time
+import zlib
+from collections import Counter
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import parse_qs, urlparse
+
+from site_urls import BASE_URL_ENV_VARS
+from taxonomy import CONTINENTS_COUNTRIES, GENRE_NAMES
+
+DEFAULT_PORT = 8801
+DEFAULT_FILMS = 20000  # Catalogue size; 5000 Pop and Top needs well over 5000 films that pass its filters
+FILMS_PER_LISTING_PAGE = 72  # Matches EXPECTED_LISTING_POSTERS_PER_PAGE in the scrapers
+FILMS_PER_LIST_PAGE = 100
+CHART_ROWS_PER_PAGE = 200
+
+WORDS = ("silent night river ghost city blue red summer winter last first king queen road house dark "
+         "light dream war love stranger machine garden mirror shadow").split()
+MPAA_LABELS = ('G', 'PG', 'PG-13', 'R', 'NC-17', 'NR')
+COUNTRIES = sorted({country for countries in CONTINENTS_COUNTRIES.values() for country in countries})
+GENRES = sorted(GENRE_NAMES)
+LANGUAGES = ('English', 'French', 'Japanese', 'Korean', 'Spanish', 'German', 'Italian', 'Hindi')
+
+CHALLENGE_PAGE = """<!DOCTYPE html><html><head><title>Just a moment...</title></head>
+<body><div id="challenge-platform"><script>window._cf_chl_opt={cvId: '3'};</script></div>
+<p>Checking your browser before accessing the site.</p></body></html>"""
+
+
+def slugify(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def make_film(index: int) -> dict:
+    """Film number index of the catalogue; lower numbers are more popular."""
+    rng = random.Random(index)
+    title = ' '.join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(1, 4)))
+    year = rng.randint(1920, 2024)
+    return {
+        'index': index,
+        'title': title,
+        'year': year,
+        'slug': f"{slugify(title)}-{year}-{index}",
+        'film_id': 100000 + index,
+        'tmdb_id': 500000 + index,
+        'runtime': rng.randint(40, 220),
+        'rating_count': max(0, int(2_000_000 / (1 + index / 50)) + rng.randint(-500, 500)),
+        'rating': round(rng.uniform(1.5, 4.6), 2),
+        'mpaa': rng.choice(MPAA_LABELS),
+        'countries': rng.sample(COUNTRIES, rng.randint(1, 2)),
+        'languages': rng.sample(LANGUAGES, rng.randint(1, 3)),
+        'genres': rng.sample(GENRES, rng.randint(1, 3)),
+        'directors': [f"Director {rng.randint(1, 2000)}"],
+        'actors': [f"Actor {rng.randint(1, 20000)}" for _ in range(rng.randint(5, 25))],
+        'studios': [f"Studio {rng.randint(1, 300)}"],
+    }
+
+
+class Catalogue:
+    def __init__(self, size: int):
+        self.films = [make_film(i) for i in range(size)]
+        self.by_slug = {film['slug']: film for film in self.films}
+        self.by_tmdb_id = {film['tmdb_id']: film for film in self.films}
+        self._genre_cache = {}
+
+    def listing(self, path: str):
+        """Films behind a listing path: a /films/genre/<genre>/ page filters by genre, anything else lists all."""
+        match = re.search(r'/genre/([^/]+)/', path)
+        if not match:
+            return self.films
+        genre = match.group(1).replace('-', ' ')
+        if genre not in self._genre_cache:
+            self._genre_cache[genre] = [f for f in self.films if genre in (g.lower() for g in f['genres'])]
+        return self._genre_cache[genre]
+
+
+def page_shell(title: str, body: str, head: str = '') -> str:
+    return (f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{escape(title)} • Letterboxd</title>'
+            f'{head}</head><body><div id="content" class="site-body">{body}</div></body></html>')
+
+
+def sluglist(kind: str, names, prefix: str = '/films/') -> str:
+    links = ' '.join(f'<a href="{prefix}{kind}/{slugify(name)}/" class="text-slug">{escape(name)}</a>' for name in names)
+    return f'<div class="text-sluglist"><p>{links}</p></div>'
+
+
+def poster_item(film: dict, rank=None) -> str:
+    name = f"{film['title']} ({film['year']})"
+    link = f"/film/{film['slug']}/"
+    number = f'<p class="list-number">{rank}</p>' if rank is not None else ''
+    return (f'<li class="posteritem" data-film-id="{film["film_id"]}" data-item-name="{escape(film["title"])}" '
+            f'data-item-full-display-name="{escape(name)}">'
+            f'<div class="react-component" data-film-id="{film["film_id"]}" data-item-name="{escape(film["title"])}" '
+            f'data-item-slug="{film["slug"]}" data-item-link="{link}" data-target-link="{link}" '
+            f'data-item-full-display-name="{escape(name)}">'
+            f'<a href="{link}" class="frame" title="{escape(name)}"><img src="/static/empty-poster.png" alt="{escape(film["title"])}" width="150" height="225"></a>'
+            f'</div>{number}</li>')
+
+
+def listing_page(films, path: str, page: int, ranked: bool) -> str:
+    per_page = FILMS_PER_LIST_PAGE if ranked else FILMS_PER_LISTING_PAGE
+    start = (page - 1) * per_page
+    items = ''.join(poster_item(film, start + i + 1 if ranked else None) for i, film in enumerate(films[start:start + per_page]))
+    next_link = f'<a class="next" href="{path}page/{page + 1}/">Older</a>' if start + per_page < len(films) else ''
+    return page_shell(path, f'<ul class="poster-list -p150 -grid">{items}</ul><div class="pagination">{next_link}</div>')
+
+
+def film_page(film: dict) -> str:
+    name = f"{film['title']} ({film['year']})"
+    json_ld = {
+        '@context': 'http://schema.org', '@type': 'Movie', 'name': film['title'],
+        'aggregateRating': {'@type': 'aggregateRating', 'ratingValue': film['rating'], 'ratingCount': film['rating_count']},
+    }
+    head = (f'<meta property="og:title" content="{escape(name)}">'
+            f'<script type="application/ld+json">/* <![CDATA[ */{json.dumps(json_ld)}/* ]]> */</script>')
+    directors = ' '.join(f'<a class="contributor" href="/director/{slugify(d)}/"><span class="prettify">{escape(d)}</span></a>'
+                         for d in film['directors'])
+    cast = ' '.join(f'<a href="/actor/{slugify(a)}/" class="text-slug tooltip">{escape(a)}</a>' for a in film['actors'])
+    releases = ''.join(
+        f'<div class="release-country"><span class="name">{escape(country)}</span>'
+        f'<span class="release-certification-badge"><span class="label">{label}</span></span></div>'
+        for country, label in [('USA', film['mpaa'])] + [(c, '12') for c in film['countries'] if c != 'USA']
+    )
+    body = f"""<div class="film-poster" data-film-id="{film['film_id']}"></div>
+<div id="film-page-wrapper" data-tmdb-id="{film['tmdb_id']}" data-tmdb-type="movie">
+<section class="production-masthead"><h1 class="headline-1 primaryname"><span class="name">{escape(film['title'])}</span></h1>
+<span class="creatorlist">{directors}</span></section>
+<div id="tab-cast"><div class="cast-list text-sluglist">{cast}</div></div>
+<div id="tab-crew"><h3><span class="crewrole -full">Director</span><span class="crewrole -short">Director</span></h3>{sluglist('director', film['directors'], prefix='/')}</div>
+<div id="tab-details"><h3><span>Studio</span></h3>{sluglist('studio', film['studios'], prefix='/')}
+<h3><span>Countries</span></h3>{sluglist('country', film['countries'])}
+<h3><span>Languages</span></h3>{sluglist('language', film['languages'])}</div>
+<div id="tab-genres"><h3><span>Genres</span></h3>{sluglist('genre', film['genres'])}</div>
+<div id="tab-releases"><div class="release-country-list">{releases}</div></div>
+<p class="text-link text-footer">{film['runtime']}&nbsp;mins &nbsp; More at <a href="https://www.themoviedb.org/movie/{film['tmdb_id']}/">TMDB</a></p>
+</div>"""
+    return page_shell(name, body, head)
+
+
+def tmdb_movie(film: dict) -> dict:
+    return {
+        'id': film['tmdb_id'],
+        'title': film['title'],
+        'release_date': f"{film['year']}-01-01",
+        'runtime': film['runtime'],
+        'genres': [{'id': i, 'name': g} for i, g in enumerate(film['genres'])],
+        'keywords': {'keywords': [{'id': zlib.crc32(w.encode()), 'name': w} for w in film['title'].lower().split()]},
+    }
+
+
+def boxofficemojo_chart(films, offset: int) -> str:
+    rows = ''.join(
+        f'<tr><td class="mojo-field-type-rank">{offset + i + 1}</td>'
+        f'<td class="mojo-field-type-title"><a href="/title/tt{film["tmdb_id"]}/">{escape(film["title"])}</a></td>'
+        f'<td class="mojo-field-type-money">${(len(films) - offset - i) * 1_000_000:,}</td>'
+        f'<td class="mojo-field-type-year"><a href="/year/world/{film["year"]}/">{film["year"]}</a></td></tr>'
+        for i, film in enumerate(films[offset:offset + CHART_ROWS_PER_PAGE])
+    )
+    return (f'<!DOCTYPE html><html><head><title>Top Lifetime Grosses - Box Office Mojo</title></head><body>'
+            f'<table class="a-bordered mojo-body-table"><tr><th>Rank</th><th>Title</th><th>Gross</th><th>Year</th></tr>'
+            f'{rows}</table></body></html>')
+
+
+def git_blob_sha(data: bytes) -> str:
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+class MockGitHub:
+    """
+    In-memory repositories behind the GitHub API routes GitHubPublisher uses. Repositories
+    are created on first use with one empty commit on main. Paths are kept flat (a tree
+    maps each full path to a blob), which is enough for files at the repository root.
+    """
+
+    def __init__(self, base: str):
+        self.base = base
+        self.blobs: Dict[str, bytes] = {}
+        self.trees: Dict[str, Dict[str, str]] = {}
+        self.commits: Dict[str, dict] = {}
+        self.refs: Dict[str, Dict[str, str]] = {}  # repo -> {'heads/main': commit sha}
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def _store(self, table: dict, obj) -> str:
+        sha = hashlib.sha1(json.dumps(obj, sort_keys=True).encode('utf-8')).hexdigest()
+        table[sha] = obj
+        return sha
+
+    def _repo(self, name: str) -> Dict[str, str]:
+        if name not in self.refs:
+            tree = self._store(self.trees, {})
+            root = self._store(self.commits, {'tree': tree, 'parents': [], 'message': 'Initial commit'})
+            self.refs[name] = {'heads/main': root}
+        return self.refs[name]
+
+    def _tree_json(self, repo_url: str, sha: str) -> dict:
+        entries = [
+            {'path': path, 'mode': '100644', 'type': 'blob', 'sha': blob, 'size': len(self.blobs[blob]),
+             'url': f"{repo_url}/git/blobs/{blob}"}
+            for path, blob in sorted(self.trees[sha].items())
+        ]
+        return {'sha': sha, 'url': f"{repo_url}/git/trees/{sha}", 'tree': entries, 'truncated': False}
+
+    def _commit_json(self, repo_url: str, sha: str) -> dict:
+        commit = self.commits[sha]
+        person = {'name': 'Mock', 'email': 'mock@localhost', 'date': '2000-01-01T00:00:00Z'}
+        return {
+            'sha': sha, 'url': f"{repo_url}/git/commits/{sha}", 'message': commit['message'],
+            'author': person, 'committer': person,
+            'tree': {'sha': commit['tree'], 'url': f"{repo_url}/git/trees/{commit['tree']}"},
+            'parents': [{'sha': p, 'url': f"{repo_url}/git/commits/{p}"} for p in commit['parents']],
+        }
+
+    def _ref_json(self, repo_url: str, ref: str, sha: str) -> dict:
+        return {'ref': f"refs/{ref}", 'url': f"{repo_url}/git/refs/{ref}",
+                'object': {'sha': sha, 'type': 'commit', 'url': f"{repo_url}/git/commits/{sha}"}}
+
+    def handle(self, method: str, path: str, payload: bytes):
+        """(status, content type, body) for one API request."""
+        match = re.match(r'^/repos/([^/]+/[^/]+)(/.*)?$', path)
+        if not match:
+            return 404, 'application/json', json.dumps({'message': 'Not Found'})
+        name, rest = match.group(1), match.group(2) or ''
+        repo_url = f"{self.base}/repos/{name}"
+        body = json.loads(payload) if payload else {}
+        route = re.sub(r'/[0-9a-f]{40}$', '/{sha}', re.sub(r'^/git/refs?/.*', '/git/ref', rest)) or '/'
+        with self._lock:
+            self.calls[f"{method} {route}"] += 1
+            refs = self._repo(name)
+            status, result = self._dispatch(method, rest, body, refs, repo_url, name)
+        return status, 'application/json', json.dumps(result)
+
+    def _dispatch(self, method, rest, body, refs, repo_url, name):
+        if method == 'GET' and rest == '':
+            owner, repo = name.split('/')
+            return 200, {'id': 1, 'name': repo, 'full_name': name, 'owner': {'login': owner},
+                         'default_branch': 'main', 'url': repo_url, 'private': False}
+
+        match = re.match(r'^/git/refs?/(.+)$', rest)
+        if match:
+            ref = match.group(1)
+            if ref not in refs:
+                return 404, {'message': 'Not Found'}
+            if method == 'PATCH':
+                new = body.get('sha')
+                if new not in self.commits:
+                    return 422, {'message': 'Object does not exist'}
+                if not body.get('force') and refs[ref] not in self.commits[new]['parents']:
+                    return 422, {'message': 'Update is not a fast forward'}
+                refs[ref] = new
+            return 200, self._ref_json(repo_url, ref, refs[ref])
+
+        match = re.match(r'^/git/commits/([0-9a-f]{40})$', rest)
+        if match and method == 'GET':
+            return (200, self._commit_json(repo_url, match.group(1))) if match.group(1) in self.commits else (404, {'message': 'Not Found'})
+        if rest == '/git/commits' and method == 'POST':
+            if body.get('tree') not in self.trees or any(p not in self.commits for p in body.get('parents', [])):
+                return 422, {'message': 'Tree or parent does not exist'}
+            sha = self._store(self.commits, {'tree': body['tree'], 'parents': body.get('parents', []),
+                                             'message': body.get('message', ''), 'time': time.time()})
+            return 201, self._commit_json(repo_url, sha)
+
+        match = re.match(r'^/git/trees/([0-9a-f]{40})$', rest)
+        if match and method == 'GET':
+            return (200, self._tree_json(repo_url, match.group(1))) if match.group(1) in self.trees else (404, {'message': 'Not Found'})
+        if rest == '/git/trees' and method == 'POST':
+            entries = dict(self.trees.get(body.get('base_tree'), {}))
+            for item in body.get('tree', []):
+                if item.get('sha') is None and 'content' not in item:
+                    entries.pop(item['path'], None)  # sha: null deletes the path
+                    continue
+                if 'content' in item:
+                    data = item['content'].encode('utf-8')
+                    blob = git_blob_sha(data)
+                    self.blobs[blob] = data
+                else:
+                    blob = item['sha']
+                entries[item['path']] = blob
+            return 201, self._tree_json(repo_url, self._store(self.trees, entries))
+
+        return 404, {'message': 'Not Found'}
+
+
+class MockSites:
+    """The stand-in servers plus their shared catalogue, fault settings and request counts."""
+
+    def __init__(self, host: str, port: int, films: int, latency: float = 0.0, jitter: float = 0.0,
+                 rate_limit_ratio: float = 0.0, retry_after: int = 2, challenge_ratio: float = 0.0):
+        self.host = host
+        self.ports = {'letterboxd': port, 'tmdb': port + 1, 'boxofficemojo': port + 2, 'github': port + 3}
+        self.catalogue = Catalogue(films)
+        self.github = MockGitHub(self.base_urls()['github'])
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.challenge_ratio = challenge_ratio
+        self.counts = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._servers = []
+        self.started_at = time.time()
+
+    def base_urls(self):
+        return {site: f"http://{self.host}:{port}" for site, port in self.ports.items()}
+
+    def start(self) -> None:
+        for site, port in self.ports.items():
+            server = ThreadingHTTPServer((self.host, port), make_handler(self, site))
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name=f"mock-{site}", daemon=True).start()
+            self._servers.append(server)
+        self.started_at = time.time()
+
+    def stop(self) -> None:
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers.clear()
+
+    def record(self, site: str, status: int, size: int) -> None:
+        with self._lock:
+            self.counts[(site, status)] += 1
+            self.bytes_sent += size
+
+    def injected_fault(self):
+        """(status, headers, body) for an injected 429 or challenge page, or None to serve normally."""
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        roll = random.random()
+        if roll < self.rate_limit_ratio:
+            return 429, {'Retry-After': str(self.retry_after), 'Content-Type': 'text/plain'}, b'Too Many Requests'
+        if roll < self.rate_limit_ratio + self.challenge_ratio:
+            return 503, {'Content-Type': 'text/html; charset=utf-8', 'Server': 'cloudflare'}, CHALLENGE_PAGE.encode('utf-8')
+        return None
+
+    def route(self, site: str, path: str, query):
+        """(status, content type, body) for a request that was not faulted."""
+        if site == 'tmdb':
+            match = re.match(r'^/3/movie/(\d+)$', path)
+            film = self.catalogue.by_tmdb_id.get(int(match.group(1))) if match else None
+            if not film:
+                return 404, 'application/json', json.dumps({'status_code': 34, 'status_message': 'Not found'})
+            return 200, 'application/json', json.dumps(tmdb_movie(film))
+
+        if site == 'boxofficemojo':
+            if not path.startswith('/chart/'):
+                return 404, 'text/html', 'Not found'
+            offset = int(query.get('offset', ['0'])[0] or 0)
+            return 200, 'text/html; charset=utf-8', boxofficemojo_chart(self.catalogue.films, offset)
+
+        match = re.match(r'^/film/([^/]+)/', path)
+        if match:
+            film = self.catalogue.by_slug.get(match.group(1))
+            return (200, 'text/html; charset=utf-8', film_page(film)) if film else (404, 'text/html', 'Not found')
+
+        if not path.endswith('/'):
+            path += '/'
+        page_match = re.match(r'^(.*/)page/(\d+)/$', path)
+        listing_path, page = (page_match.group(1), int(page_match.group(2))) if page_match else (path, 1)
+        ranked = '/list/' in listing_path
+        if not (listing_path.startswith('/films/') or ranked):
+            return 404, 'text/html', 'Not found'
+        return 200, 'text/html; charset=utf-8', listing_page(self.catalogue.listing(listing_path), listing_path, page, ranked)
+
+    def summary_lines(self):
+        elapsed = max(time.time() - self.started_at, 1e-9)
+        total = sum(self.counts.values())
+        lines = [f"{total} requests in {elapsed:.1f}s ({total / elapsed:.1f}/s, {self.bytes_sent / 1024 / 1024:.1f} MiB served)"]
+        for (site, status), count in sorted(self.counts.items()):
+            lines.append(f"  {site:<14} HTTP {status}: {count}")
+        for call, count in sorted(self.github.calls.items()):
+            lines.append(f"  github API     {call}: {count}")
+        return lines
+
+
+def make_handler(sites: MockSites, site: str):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            self.respond('GET')
+
+        def do_POST(self):
+            self.respond('POST')
+
+        def do_PATCH(self):
+            self.respond('PATCH')
+
+        def respond(self, method: str):
+            parsed = urlparse(self.path)
+            payload = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            fault = sites.injected_fault() if site != 'github' else None
+            if fault:
+                status, headers, body = fault
+            else:
+                if site == 'github':
+                    status, content_type, text = sites.github.handle(method, parsed.path, payload)
+                elif method == 'GET':
+                    status, content_type, text = sites.route(site, parsed.path, parse_qs(parsed.query))
+                else:
+                    status, content_type, text = 405, 'text/plain', 'Method Not Allowed'
+                headers, body = {'Content-Type': content_type}, text.encode('utf-8')
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            sites.record(site, status, len(body))
+
+        def log_message(self, format, *args):
+            pass  # One line per request would swamp the terminal; counts are printed on exit
+
+    return Handler
+
+
+def stop_on_sigterm(signum, frame):
+    raise KeyboardInterrupt  # Print the summary when the server is killed too, not just on Ctrl+C
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve stand-in Letterboxd, TMDB and BoxOfficeMojo sites locally.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Letterboxd port; TMDB and BoxOfficeMojo use the next two")
+    parser.add_argument('--films', type=int, default=DEFAULT_FILMS, help="catalogue size")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="extra random delay of up to this many seconds")
+    parser.add_argument('--rate-limit-ratio', type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument('--retry-after', type=int, default=2, help="Retry-After seconds sent with each 429")
+    parser.add_argument('--challenge-ratio', type=float, default=0.0, help="fraction of requests answered with a challenge page")
+    args = parser.parse_args()
+
+    sites = MockSites(args.host, args.port, args.films, latency=args.latency, jitter=args.jitter,
+                      rate_limit_ratio=args.rate_limit_ratio, retry_after=args.retry_after,
+                      challenge_ratio=args.challenge_ratio)
+    sites.start()
+    signal.signal(signal.SIGTERM, stop_on_sigterm)
+    print(f"🎬 Serving {args.films} mock films. Point the scrapers at it with:")
+    for site, url in sites.base_urls().items():
+        print(f"  export {BASE_URL_ENV_VARS[site]}={url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        summary = sites.summary_lines()
+        sites.stop()
+        print("\n".join(summary))
+
+
+if __name__ == "__main__":
+    main()
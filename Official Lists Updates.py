@@ -16,7 +16,6 @@ import io
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
-from time import sleep
 from typing import List, Optional, Sequence, Tuple
 
 # title, rank, film path (/film/slug/)
@@ -28,6 +27,10 @@ from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from rate_limiter import RateLimitedSession
+from page_parsers import parse_poster_list
+from adaptive_concurrency import AimdController
+
 # (list url, csv filename, stats .txt, comment .txt, stats template key, max films)
 LISTS: Sequence[Tuple[str, str, str, str, str, int]] = (
     (
@@ -56,7 +59,8 @@ LISTS: Sequence[Tuple[str, str, str, str, str, int]] = (
     ),
 )
 
-FETCH_WORKERS = 8
+# Film-page fetch concurrency adapts to how Letterboxd responds (starts at the old fixed 8 workers)
+FETCH_CONCURRENCY = AimdController(initial=8, maximum=24, name="Film fetch")
 
 
 def ordinal_day(n: int) -> str:
@@ -102,13 +106,19 @@ def read_csv_file_text(path: str) -> str:
 
 
 def create_session() -> requests.Session:
-    session = requests.Session()
+    # Paced per host by the shared rate limiter (honours 429 / Retry-After); in-flight requests are
+    # capped by FETCH_CONCURRENCY, so thread pools and the connection pool are sized to its maximum.
+    # 5xx responses are not retried inside urllib3: each one has to reach FETCH_CONCURRENCY to halve it.
+    session = RateLimitedSession(concurrency=FETCH_CONCURRENCY)
     retry_strategy = Retry(
         total=3,
         backoff_factor=0.5,
-        status_forcelist=[500, 502, 503, 504],
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=10)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=FETCH_CONCURRENCY.maximum,
+        pool_maxsize=FETCH_CONCURRENCY.maximum,
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     session.headers.update(
@@ -155,36 +165,21 @@ def collect_ordered_paths(session: requests.Session, base_url: str, max_films: i
         url = f"{base}page/{page}/"
         response = session.get(url, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
-        film_list = soup.find("ul", class_="poster-list")
-        if not film_list:
+        items, has_next = parse_poster_list(response.content)
+        if items is None:
             break
-        for li in film_list.find_all("li", class_="posteritem"):
+        for item in items:
             if len(paths) >= max_films:
                 break
-            film_url = None
-            inner_div = li.find("div", class_="react-component")
-            if inner_div:
-                film_url = inner_div.get("data-target-link") or inner_div.get("data-item-link")
-            if not film_url:
-                anchor = li.find("a", href=True)
-                if anchor:
-                    film_url = anchor["href"]
-            if not film_url:
-                film_link = li.find("a", href=lambda x: x and "/film/" in x)
-                if film_link:
-                    film_url = film_link["href"]
-            if film_url:
-                paths.append(normalize_film_path(film_url))
-        if not soup.find("a", class_="next"):
+            if item["url"]:
+                paths.append(normalize_film_path(item["url"]))
+        if not has_next:
             break
         page += 1
     return paths[:max_films]
 
 
-def fetch_og_title_year(
-    session: requests.Session, film_path: str, polite_sleep: bool = True
-) -> Tuple[str, str]:
+def fetch_og_title_year(session: requests.Session, film_path: str) -> Tuple[str, str]:
     """Return (display_title, year) from film page og:title."""
     try:
         r = session.get(f"https://letterboxd.com{film_path}", timeout=15)
@@ -200,8 +195,6 @@ def fetch_og_title_year(
             title = title_text[: title_text.rindex("(")].strip()
         else:
             title = title_text.strip()
-        if polite_sleep:
-            sleep(0.05)
         return title, year
     except Exception:
         return film_path, ""
@@ -215,9 +208,9 @@ def fetch_metadata_parallel(paths: Sequence[str]) -> List[Tuple[str, str]]:
 
     def job(idx: int, path: str) -> Tuple[int, Tuple[str, str]]:
         sess = create_session()
-        return idx, fetch_og_title_year(sess, path, polite_sleep=False)
+        return idx, fetch_og_title_year(sess, path)
 
-    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY.maximum) as pool:
         futures = [pool.submit(job, i, p) for i, p in enumerate(paths)]
         for fut in as_completed(futures):
             idx, pair = fut.result()
@@ -526,4 +519,5 @@ def run() -> str:
 
 if __name__ == "__main__":
     run()
-    print("Stats and comment .txt files created.")
\ No newline at end of file
+    print("Stats and comment .txt files created.")
+    print(FETCH_CONCURRENCY.summary())
\ No newline at end of file
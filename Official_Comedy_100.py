@@ -7,7 +7,6 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 import pandas as pd
 import re
-import csv
 import locale
 import os
 import platform
@@ -16,6 +15,10 @@ import unicodedata
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import json
+from whitelist_snapshot import load_snapshot, save_snapshot
+from deferred_workbook import DeferredWorkbook, flush_all
+from browser_profile import apply_fast_profile, enable_resource_blocking
+from output_log import DEBUG, INFO, output_log
 
 # Silence undetected_chromedriver's noisy __del__ that logs WinError 6 on shutdown
 try:
@@ -35,6 +38,8 @@ def signal_handler(signum, frame):
             print_to_csv("Scraper cleaned up successfully")
         except:
             pass
+    # Persist any batched blacklist changes before exiting
+    flush_all()
     print_to_csv("Exiting gracefully...")
     sys.exit(0)
 
@@ -69,14 +74,14 @@ LIST_DIR = paths['base_dir']
 # Leave None to use a fresh profile each run. Close any open Chrome using that profile before running.
 CHROME_USER_DATA_DIR = None  # e.g. r'C:\Users\bigba\AppData\Local\Google\Chrome\User Data'
 CHROME_PROFILE_DIR = None    # e.g. 'Default' or 'Profile 1'
+FAST_BROWSER_PROFILE = True  # Eager page loads with posters, fonts and ad/analytics scripts blocked (browser_profile.py)
 
 # Define a custom print function
-def print_to_csv(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    with open(os.path.join(BASE_DIR, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+LOG_LEVEL = 'INFO'  # 'DEBUG' also logs the per-film debug and skip lines
+
+def print_to_csv(message: str, level: int = INFO):
+    """Prints a message to the terminal and appends it to All_Outputs.csv (written by a background thread)."""
+    output_log(os.path.join(BASE_DIR, 'All_Outputs.csv'), level=LOG_LEVEL).emit(message, level)
 
 # Configure locale and constants
 locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
@@ -201,6 +206,8 @@ class MovieProcessor:
         for idx, row in self.blacklist.iterrows():
             if row['Link']:  # Only store entries with URLs
                 self.blacklist_lookup[row['Link']] = True
+        # Additions are buffered and written to Comedy_Blacklist.xlsx in batches
+        self.blacklist = DeferredWorkbook(BLACKLIST_PATH, self.blacklist, log=print_to_csv)
         
         self.rejected_data: List[List] = []
 
@@ -213,6 +220,12 @@ class MovieProcessor:
                 self.whitelist = pd.DataFrame(columns=_WHITELIST_COLUMNS)
                 self.whitelist.to_excel(WHITELIST_PATH, index=False)
                 return
+
+            # Reuse the parsed snapshot while Comedy_Whitelist.xlsx is unchanged
+            snapshot = load_snapshot(WHITELIST_PATH)
+            if snapshot is not None:
+                self.whitelist, self.whitelist_lookup = snapshot
+                return
             
             # Read the file to see what columns it actually has
             try:
@@ -283,6 +296,8 @@ class MovieProcessor:
                     print_to_csv("Saved Comedy_Whitelist.xlsx without legacy Information column.")
                 except Exception as ex:
                     print_to_csv(f"Could not save whitelist after removing Information column: {ex}")
+
+            save_snapshot(WHITELIST_PATH, (self.whitelist, self.whitelist_lookup))
                 
         except Exception as e:
             print_to_csv(f"Unexpected error loading whitelist: {str(e)}")
@@ -380,12 +395,9 @@ class MovieProcessor:
         if film_url in self.blacklist_lookup:
             return
             
-        # Add new entry
-        new_row = pd.DataFrame([[film_title, release_year, reason, film_url]],
-                               columns=['Title', 'Year', 'Blank', 'Link'])
-        self.blacklist = pd.concat([self.blacklist, new_row], ignore_index=True)
+        # Add new entry (written to disk with the next batched flush)
+        self.blacklist.append({'Title': film_title, 'Year': release_year, 'Blank': reason, 'Link': film_url})
         self.blacklist_lookup[film_url] = True
-        self.blacklist.to_excel(BLACKLIST_PATH, index=False)
         print_to_csv(f"⚫ {film_title} ({release_year}) added to blacklist {reason}")
 
     def is_whitelisted(self, film_title: str, release_year: str, film_url: str = None) -> bool:
@@ -404,7 +416,7 @@ class MovieProcessor:
         # Check if URL exists in blacklist lookup
         return film_url in self.blacklist_lookup
 
-def setup_webdriver():
+def setup_webdriver(fast: bool = FAST_BROWSER_PROFILE):
     """Create Chrome driver using undetected-chromedriver to avoid Cloudflare/captcha detection."""
     def _detect_chrome_major_version() -> Optional[int]:
         """
@@ -461,12 +473,16 @@ def setup_webdriver():
         "safebrowsing.enabled": True,
     }
     options.add_experimental_option("prefs", prefs)
+    if fast:
+        apply_fast_profile(options)
     chrome_major = _detect_chrome_major_version()
     # If Chrome updates faster/slower than uc's cached driver, pin the driver major to the installed browser.
     if chrome_major:
         driver = uc.Chrome(options=options, use_subprocess=True, version_main=chrome_major)
     else:
         driver = uc.Chrome(options=options, use_subprocess=True)
+    if fast:
+        enable_resource_blocking(driver, log=print_to_csv)
     return driver
 
 def is_retryable_error(error):
@@ -616,7 +632,7 @@ class LetterboxdScraper:
                             f"Available data: data-item-full-display-name='{container.get_attribute('data-item-full-display-name')}', "
                             f"data-item-name='{container.get_attribute('data-item-name')}', anchor-title='{anchor.get_attribute('title')}'"
                         )
-                        print_to_csv(f"   Debug: {debug_info}")
+                        print_to_csv(f"   Debug: {debug_info}", DEBUG)
                     except Exception:
                         pass
                     self.processor.rejected_data.append([film_title, None, None, 'Missing title or URL'])
@@ -639,7 +655,7 @@ class LetterboxdScraper:
             self.rejected_movies_count += 1
             return False
         if any(movie['Link'] == film_url for movie in OFFICIAL_COMEDY_FILMS):
-            print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.")
+            print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.", DEBUG)
             return False
         if self.processor.is_whitelisted(None, None, film_url):
             whitelist_info, _ = self.processor.get_whitelist_data(None, None, film_url)
@@ -812,7 +828,7 @@ class LetterboxdScraper:
             
             # Check if URL has already been processed in this scrape session
             if any(movie['Link'] == film_url for movie in OFFICIAL_COMEDY_FILMS):
-                print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.")
+                print_to_csv(f"⚠️ {film_title} was already processed in this session. Skipping.", DEBUG)
                 return False
                         
             # Whitelist membership: URL on Comedy_Whitelist → add directly without opening the film page.
@@ -1075,6 +1091,8 @@ def main():
                         print_to_csv(f"❌ Failed to save emergency results: {save_error}")
         finally:
             if scraper is not None:
+                # Flush batched blacklist writes so a retry reads the up-to-date workbook
+                scraper.processor.blacklist.close()
                 try:
                     print_to_csv("Cleaning up scraper...")
                     scraper.driver.quit()
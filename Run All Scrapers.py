@@ -5,6 +5,8 @@ import sys
 import io
 import os
 import platform
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Set console output encoding to UTF-8
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8') 
@@ -21,6 +23,19 @@ SCRIPTS = [
     ("Official_Comedy_100.py", "Letterboxd Official Comedy List Scraper"),
 ]
 
+# Scripts that must finish successfully before a script starts. Scripts missing from SCRIPTS are ignored,
+# so commenting one out above doesn't block its dependents.
+DEPENDENCIES = {
+    "Genre 250s.py": ["5000 Pop and Top.py"],  # Both write whitelist.xlsx / blacklist.xlsx
+    "Update Letterboxd Lists.py": ["BoxOfficeMojo 250s.py", "Top 250 Anything.py", "Comedy 100.py",
+                                   "5000 Pop and Top.py", "Genre 250s.py"],
+    "Update JSONs.py": ["Update Letterboxd Lists.py"],
+}
+MAX_PARALLEL = 3  # Scripts running at once (1 = the old one-at-a-time order)
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Run Logs')  # One log file per script per run
+
+print_lock = threading.Lock()
+
 # Detect operating system and set appropriate Python command
 def get_python_command():
     """Return the appropriate Python command for the current OS."""
@@ -47,10 +62,13 @@ def format_time(seconds):
     else:
         return f"{seconds}s"
 
-def run_script(script_name, description, *args):
-    """Run a Python script and track its execution"""
-    print(f"\n{f' Running {description} ':=^100}")
+def run_script(script_name, description, *args, tag=None, log_path=None):
+    """Run a Python script and track its execution. Returns True if it exited with code 0."""
+    with print_lock:
+        print(f"\n{f' Running {description} ':=^100}")
     start_time = time.time()
+    prefix = f"[{tag}] " if tag else ""
+    log_file = open(log_path, 'w', encoding='utf-8') if log_path else None
     
     try:
         # Get the directory where this script is located
@@ -79,30 +97,155 @@ def run_script(script_name, description, *args):
             if output == '' and process.poll() is not None:
                 break
             if output:
-                # Don't add extra newlines for progress bars
-                if '\r' in output:
-                    print(output.strip(), end='\r', flush=True)
-                else:
-                    print(output.strip(), flush=True)
+                if log_file:
+                    log_file.write(output.rstrip('\r\n') + '\n')
+                    log_file.flush()
+                with print_lock:
+                    # Don't add extra newlines for progress bars
+                    if '\r' in output:
+                        print(prefix + output.strip(), end='\r', flush=True)
+                    else:
+                        print(prefix + output.strip(), flush=True)
 
         # Wait for the process to complete
-        process.poll()
+        process.wait()
 
         # Calculate execution time
         execution_time = time.time() - start_time
 
-        if process.returncode == 0:
-            print(f"\n[+] {description} completed successfully")
-        else:
-            print(f"\n[-] {description} failed with return code {process.returncode}")
-
-        print(f"⏱️ Execution time: {format_time(execution_time)}")
-        return True
+        with print_lock:
+            if process.returncode == 0:
+                print(f"\n[+] {description} completed successfully")
+            else:
+                print(f"\n[-] {description} failed with return code {process.returncode}")
+            print(f"⏱️ Execution time: {format_time(execution_time)}")
+        return process.returncode == 0
 
     except Exception as e:
-        print(f"\n[-] Error running {description}: {str(e)}")
+        with print_lock:
+            print(f"\n[-] Error running {description}: {str(e)}")
         return False
-        
+    finally:
+        if log_file:
+            log_file.close()
+
+def build_dependency_graph(scripts):
+    """Return {script: [dependencies that are also in scripts]}, raising ValueError on a cycle."""
+    names = [script_file for script_file, *_ in scripts]
+    graph = {name: [dep for dep in DEPENDENCIES.get(name, []) if dep in names] for name in names}
+
+    visiting, done = set(), set()
+    def visit(name, path):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+        visiting.add(name)
+        for dep in graph[name]:
+            visit(dep, path + [name])
+        visiting.discard(name)
+        done.add(name)
+    for name in names:
+        visit(name, [])
+    return graph
+
+def downstream_chain_lengths(graph):
+    """{script: number of scripts on the longest chain that starts at it}, e.g. 4 for 5000 Pop and Top."""
+    dependents = {name: [other for other, deps in graph.items() if name in deps] for name in graph}
+    lengths = {}
+    def length(name):
+        if name not in lengths:
+            lengths[name] = 1 + max((length(dependent) for dependent in dependents[name]), default=0)
+        return lengths[name]
+    for name in graph:
+        length(name)
+    return lengths
+
+def run_pipeline(scripts, max_parallel=MAX_PARALLEL):
+    """
+    Run scripts as soon as their dependencies have succeeded, at most max_parallel at a time.
+    A failed script skips everything downstream of it; independent branches keep going.
+    Returns {script: {'status', 'start', 'end'}} with times relative to the pipeline start.
+    """
+    graph = build_dependency_graph(scripts)
+    details = {script_file: (description, args) for script_file, description, *args in scripts}
+    # Longest downstream chain first (the critical path), then SCRIPTS order
+    chain_lengths = downstream_chain_lengths(graph)
+    order = sorted(details, key=lambda name: -chain_lengths[name])
+    max_parallel = max(1, max_parallel)
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    pipeline_start = time.time()
+    results = {}
+    running = {}
+
+    def timed_run(script_file):
+        description, args = details[script_file]
+        start = time.time() - pipeline_start
+        log_path = os.path.join(LOG_DIR, os.path.splitext(script_file)[0] + '.log')
+        ok = run_script(script_file, description, *args, tag=os.path.splitext(script_file)[0], log_path=log_path)
+        return ok, start, time.time() - pipeline_start
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        while len(results) < len(order):
+            # Skip anything downstream of a failure, then start whatever is ready, critical path first
+            for name in order:
+                if name in results or name in running.values():
+                    continue
+                failed_deps = [dep for dep in graph[name] if results.get(dep, {}).get('status') in ('failed', 'skipped')]
+                if failed_deps:
+                    now = time.time() - pipeline_start
+                    results[name] = {'status': 'skipped', 'start': now, 'end': now}
+                    with print_lock:
+                        print(f"\n⚠️ Skipping {details[name][0]} because {', '.join(failed_deps)} did not succeed")
+                    continue
+                ready = all(results.get(dep, {}).get('status') == 'ok' for dep in graph[name])
+                if ready and len(running) < max_parallel:
+                    with print_lock:
+                        print(f"\nProgress: starting {name} ({len(results) + len(running) + 1}/{len(order)} scripts)")
+                    running[executor.submit(timed_run, name)] = name
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                ok, start, end = future.result()
+                results[name] = {'status': 'ok' if ok else 'failed', 'start': start, 'end': end}
+    return results
+
+def print_timing_report(scripts, results, total_time):
+    """Per-script timings plus the critical path: the chain of dependencies that set the wall-clock time."""
+    graph = build_dependency_graph(scripts)
+    # Longest finish time along any dependency chain ending at each script
+    chain_time, chain_prev = {}, {}
+    def chain(name):
+        if name not in chain_time:
+            duration = results[name]['end'] - results[name]['start']
+            prev = max(graph[name], key=chain, default=None)
+            chain_prev[name] = prev
+            chain_time[name] = duration + (chain(prev) if prev else 0)
+        return chain_time[name]
+
+    print(f"\n{' Timing Report ':=^100}")
+    print(f"{'Script':<32}{'Status':<10}{'Start':>12}{'Duration':>14}")
+    for name, result in sorted(results.items(), key=lambda item: item[1]['start']):
+        print(f"{name:<32}{result['status']:<10}{format_time(result['start']):>12}{format_time(result['end'] - result['start']):>14}")
+
+    ran = [name for name, result in results.items() if result['status'] != 'skipped']
+    if ran:
+        tail = max(ran, key=chain)
+        path = []
+        while tail:
+            path.append(tail)
+            tail = chain_prev[tail]
+        path.reverse()
+        serial_time = sum(results[name]['end'] - results[name]['start'] for name in ran)
+        print(f"\nCritical path ({format_time(chain(path[-1]))}): {' -> '.join(path)}")
+        print(f"Sequential run time would have been about {format_time(serial_time)}; "
+              f"wall-clock time was {format_time(total_time)}")
+    print(f"Logs for each script are in {LOG_DIR}")
+
 def main():
     start_time = time.time()
     current_date = datetime.now().strftime("%B %d, %Y")
@@ -111,20 +254,15 @@ def main():
     print(f"Starting Scraping Pipeline - {current_date}".center(100))
     print(f"{'='*100}")
 
-    # Run all scripts
-    total_scripts = len(SCRIPTS)
-    completed_scripts = 0
-
-    for script_file, description, *args in SCRIPTS:
-        completed_scripts += 1
-        print(f"\nProgress: {completed_scripts}/{total_scripts} scripts")
-        
-        if not run_script(script_file, description, *args):
-            print(f"\n⚠️ Stopping execution due to error in {description}")
-            return
+    # Run all scripts, independent ones side by side
+    results = run_pipeline(SCRIPTS)
 
     # Calculate and display total execution time
     total_time = time.time() - start_time
+    print_timing_report(SCRIPTS, results, total_time)
+    failed = [name for name, result in results.items() if result['status'] != 'ok']
+    if failed:
+        print(f"\n⚠️ Not completed: {', '.join(failed)}")
     print(f"{'='*100}")
     print(f"Total execution time: {format_time(total_time)}".center(100))
     print(f"{'='*100}")
@@ -1,5 +1,4 @@
 import time
-import random
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -9,7 +8,9 @@ import re
 import os
 import platform
 from tqdm import tqdm
-import csv
+from rate_limiter import get_rate_limiter
+from browser_profile import apply_fast_profile, enable_resource_blocking
+from output_log import INFO, output_log
 
 # Silence undetected_chromedriver's noisy __del__ that logs WinError 6 on shutdown
 try:
@@ -48,14 +49,15 @@ output_dir = paths['output_dir']
 # Leave None to use a fresh profile each run. Close any open Chrome using that profile before running.
 CHROME_USER_DATA_DIR = None  # e.g. r'C:\Users\bigba\AppData\Local\Google\Chrome\User Data'
 CHROME_PROFILE_DIR = None    # e.g. 'Default' or 'Profile 1'
+FAST_BROWSER_PROFILE = True  # Eager page loads with posters, fonts and ad/analytics scripts blocked (browser_profile.py)
 
 # Define a custom print function
-def print_to_csv(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+def print_to_csv(message: str, level: int = INFO):
+    """Prints a message to the terminal and appends it to All_Outputs.csv (written by a background thread)."""
+    output_log(os.path.join(output_dir, 'All_Outputs.csv')).emit(message, level)
+
+# Per-host request pacing shared with the other scrapers (limits in rate_limiter.DEFAULT_LIMITS)
+RATE_LIMITER = get_rate_limiter(log=print_to_csv)
 
 class MovieCache:
     def __init__(self):
@@ -115,7 +117,7 @@ class MovieCache:
         self.cache.to_excel(EXCEL_PATH, index=False)
     
     
-def setup_webdriver():
+def setup_webdriver(fast: bool = FAST_BROWSER_PROFILE):
     """
     Create Chrome driver using undetected-chromedriver, mirroring Genre 250s Chrome setup.
     """
@@ -162,11 +164,15 @@ def setup_webdriver():
         "safebrowsing.enabled": True,
     }
     options.add_experimental_option("prefs", prefs)
+    if fast:
+        apply_fast_profile(options)
     chrome_major = _detect_chrome_major_version()
     if chrome_major:
         driver = uc.Chrome(options=options, use_subprocess=True, version_main=chrome_major)
     else:
         driver = uc.Chrome(options=options, use_subprocess=True)
+    if fast:
+        enable_resource_blocking(driver, log=print_to_csv)
     return driver
 
 
@@ -238,12 +244,12 @@ while len(film_urls) < max_movies:
     page_retries = 20
     for retry in range(page_retries):
         try:
+            RATE_LIMITER.acquire(url)
             driver.get(url)
             # Wait for the page to load
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, 'li.posteritem'))
             )
-            time.sleep(random.uniform(1.0, 1.5))
             break
         except Exception as e:
             if retry == page_retries - 1:
@@ -289,7 +295,6 @@ while len(film_urls) < max_movies:
             continue
     
     current_page += 1
-    time.sleep(random.uniform(1.0, 1.5))
 
 print_to_csv(f"Collected {len(film_urls)} film URLs")
 
@@ -327,11 +332,11 @@ with tqdm(total=max_movies, desc="Total Progress", unit=" films") as overall_pba
         
         for retry in range(max_retries):
             try:
+                RATE_LIMITER.acquire(film_url)
                 driver.get(film_url)
                 WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'meta[property="og:title"]'))
                 )
-                time.sleep(random.uniform(1.0, 1.5))
                 
                 # Get title and year in one go from the meta title
                 meta_title = driver.find_element(By.CSS_SELECTOR, 'meta[property="og:title"]')
@@ -8,11 +8,11 @@ from urllib3.util.retry import Retry
 import threading
 from tqdm import tqdm
 import time
-from github import Github, Auth
 import os
 from datetime import datetime
 import platform
 from credentials_loader import load_credentials
+from github_publisher import GitHubPublisher
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -253,41 +253,14 @@ def format_time(seconds):
 
 def update_github_file(filename, file_content):
     """
-    Updates or creates a file in the GitHub repository.
+    Updates or creates a file in the GitHub repository; skipped if GitHub already has this exact content.
     """
+    base_filename = os.path.basename(filename)
     try:
-        # Load credentials
-        credentials = load_credentials()
-        
-        # Initialize Github with your access token
-        g = Github(auth=Auth.Token(credentials['GITHUB_API_KEY']))
-        
-        # Get the repository
-        repo = g.get_repo("bigbadraj/Letterboxd-List-JSONs")
-        
-        # Get just the filename without path
-        base_filename = os.path.basename(filename)
-        
-        try:
-            # Try to get existing file
-            contents = repo.get_contents(base_filename)
-            # If file exists, update it
-            repo.update_file(
-                contents.path,
-                f"Updated {base_filename} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                file_content,
-                contents.sha
-            )
-            print(f"✅ Successfully updated {base_filename} on GitHub")
-        except Exception:
-            # If file doesn't exist, create it
-            repo.create_file(
-                base_filename,
-                f"Added {base_filename} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                file_content
-            )
-            print(f"✅ Successfully created {base_filename} on GitHub")
-            
+        publisher = GitHubPublisher("bigbadraj/Letterboxd-List-JSONs", load_credentials()['GITHUB_API_KEY'])
+        publisher.stage(base_filename, file_content)
+        publisher.publish(f"Updated {base_filename} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(publisher.summary())
     except Exception as e:
         print(f"❌ Error updating GitHub: {str(e)}")
 
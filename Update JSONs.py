@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 import json
 from time import sleep
@@ -8,12 +7,15 @@ from urllib3.util.retry import Retry
 import threading
 from tqdm import tqdm
 import time
-from github import Github
 import os
 from datetime import datetime
-import csv
 import platform
 from credentials_loader import load_credentials
+from rate_limiter import RateLimitedSession
+from adaptive_concurrency import AimdController
+from output_log import INFO, output_log
+from page_parsers import parse_og_title, parse_poster_list, split_display_name
+from github_publisher import GitHubPublisher
 
 # Detect operating system and set appropriate paths
 def get_os_specific_paths():
@@ -43,12 +45,14 @@ jsons_dir = paths['jsons_dir']
 output_dir = paths['output_dir']
 
 # Define a custom print function
-def print_to_csv(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+def print_to_csv(message: str, level: int = INFO):
+    """Prints a message to the terminal and appends it to All_Outputs.csv (written by a background thread)."""
+    output_log(os.path.join(output_dir, 'All_Outputs.csv')).emit(message, level)
+
+JSONS_REPO = "bigbadraj/Letterboxd-List-JSONs"  # Every list's JSON is published here in one commit per run
+
+# Film-page fetch concurrency adapts to how Letterboxd responds (starts at the old fixed 5 workers)
+FETCH_CONCURRENCY = AimdController(initial=5, maximum=16, name='Film fetch', log=print_to_csv)
 
 # Thread-safe list for storing movie data
 class ThreadSafeList:
@@ -64,14 +68,18 @@ class ThreadSafeList:
         return len(self.items)
 
 def create_session():
-    session = requests.Session()
+    # Paced per host by the shared rate limiter (honours 429 / Retry-After); in-flight requests are
+    # capped by FETCH_CONCURRENCY, so thread pools and the connection pool are sized to its maximum.
+    # 5xx responses are not retried inside urllib3: each one has to reach FETCH_CONCURRENCY to halve it.
+    session = RateLimitedSession(concurrency=FETCH_CONCURRENCY)
     retry_strategy = Retry(
         total=3,
-        backoff_factor=0.5,
-        status_forcelist=[500, 502, 503, 504]
+        backoff_factor=0.5
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=10)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=FETCH_CONCURRENCY.maximum,
+                          pool_maxsize=FETCH_CONCURRENCY.maximum)
     session.mount("http://", adapter)
+    session.mount("https://", adapter)
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     })
@@ -83,22 +91,11 @@ def process_film(session, film_url, progress_tracker, list_number=None):
         try:
             film_response = session.get(f"https://letterboxd.com{film_url}", timeout=10)
             film_response.raise_for_status()
-            film_soup = BeautifulSoup(film_response.content, 'html.parser')
-            
-            og_title = film_soup.find('meta', property='og:title')
-            if og_title:
-                title_text = og_title['content']
-                
-                # Extract year and title
-                year = ''
-                if '(' in title_text and ')' in title_text:
-                    year = title_text[title_text.rindex('(')+1:title_text.rindex(')')]
-                    title = title_text[:title_text.rindex('(')].strip()
-                else:
-                    title = title_text
-                
-                film_poster_div = film_soup.find('div', class_='film-poster')
-                film_id = film_poster_div.get('data-film-id') if film_poster_div else None
+            page = parse_og_title(film_response.content)
+            if page:
+                title_text = page['display_name']
+                title, year = page['title'], page['year']
+                film_id = page['film_id']
                 
                 # If we couldn't get the film ID from the poster, extract it from the URL
                 if not film_id and film_url and '/film/' in film_url:
@@ -125,60 +122,28 @@ def process_page(session, url, max_films, progress_tracker):
         response = session.get(url, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Updated selector for new Letterboxd HTML structure
-        film_list = soup.find('ul', class_='poster-list')
+        film_items, has_next = parse_poster_list(response.content)
 
-        if not film_list:
+        if film_items is None:
             print_to_csv("Film list not found on page.")
             return False, []
         
         temp_data = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY.maximum) as executor:
             futures = []
-            # Look for the new posteritem structure
-            film_items = film_list.find_all('li', class_='posteritem')
-            
-            for li in film_items:
-                # Extract movie information from the inner div with data attributes
-                # The data attributes are on the inner div, not the li element
-                inner_div = li.find('div', class_='react-component')
-                if inner_div:
-                    film_url = inner_div.get('data-target-link') or inner_div.get('data-item-link')
-                else:
-                    film_url = None
-                
-                if not film_url:
-                    # Fallback: look for anchor tag
-                    anchor = li.find('a', href=True)
-                    if anchor:
-                        film_url = anchor['href']
-                
-                # Additional fallback: look for any link with /film/ in it
-                if not film_url:
-                    film_link = li.find('a', href=lambda x: x and '/film/' in x)
-                    if film_link:
-                        film_url = film_link['href']
+            for item in film_items:
+                film_url = item['url']
                 
                 if not film_url:
                     print_to_csv("Film URL not found for one item; skipping.")
                     continue
                 
-                # Get list number from the p.list-number element
-                list_number_tag = li.find('p', class_='list-number')
-                list_number = int(list_number_tag.text.strip()) if list_number_tag else None
+                list_number = item['list_number']
                 
-                # Extract title and year from data attributes if available
-                # The data attributes are on the inner div, not the li element
-                if inner_div:
-                    film_title = inner_div.get('data-item-full-display-name') or inner_div.get('data-item-name')
-                else:
-                    film_title = None
+                # Title and year come from the list item's data attributes when available
+                film_title = item['display_name']
                 if film_title and '(' in film_title and ')' in film_title:
-                    # Extract year and title from the full display name
-                    year = film_title[film_title.rindex('(')+1:film_title.rindex(')')]
-                    title = film_title[:film_title.rindex('(')].strip()
+                    title, year = split_display_name(film_title)
                     
                     # Extract film ID from the URL
                     film_id = "Unknown"
@@ -203,7 +168,6 @@ def process_page(session, url, max_films, progress_tracker):
                     temp_data.append(result)
                     # uncomment for more details print_to_csv(f"Processed film: {result}")
         
-        has_next = bool(soup.find('a', class_='next'))
         return has_next, temp_data
     except Exception as e:
         print_to_csv(f"Error processing page {url}: {e}")
@@ -263,46 +227,6 @@ def format_time(seconds):
     else:
         return f"{seconds}s"
 
-def update_github_file(filename, file_content):
-    """
-    Updates or creates a file in the GitHub repository.
-    """
-    try:
-        # Load credentials
-        credentials = load_credentials()
-        
-        # Initialize Github with your access token
-        g = Github(credentials['GITHUB_API_KEY'])
-        
-        # Get the repository
-        repo = g.get_repo("bigbadraj/Letterboxd-List-JSONs")
-        
-        # Get just the filename without path
-        base_filename = os.path.basename(filename)
-        
-        try:
-            # Try to get existing file
-            contents = repo.get_contents(base_filename)
-            # If file exists, update it
-            repo.update_file(
-                contents.path,
-                f"Updated {base_filename} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                file_content,
-                contents.sha
-            )
-            print_to_csv(f"✅ Successfully updated {base_filename} on GitHub")
-        except Exception:
-            # If file doesn't exist, create it
-            repo.create_file(
-                base_filename,
-                f"Added {base_filename} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                file_content
-            )
-            print_to_csv(f"✅ Successfully created {base_filename} on GitHub")
-            
-    except Exception as e:
-        print_to_csv(f"❌ Error updating GitHub: {str(e)}")
-
 def main():
     print_to_csv("Updating All Lists")
 
@@ -491,7 +415,16 @@ def main():
     session = create_session()
     total_films = sum(get_list_size(session, list_info['url']) for list_info in lists_to_process)
     progress_tracker = ProgressTracker(total_films)
+    publisher = GitHubPublisher(JSONS_REPO, load_credentials()['GITHUB_API_KEY'], log=print_to_csv)
         
+    try:
+        process_all_lists(lists_to_process, progress_tracker, publisher)
+    finally:
+        # Publish whatever was finished, even if a later list failed
+        publisher.publish(f"Updated {len(publisher)} lists - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print_to_csv(publisher.summary())
+
+def process_all_lists(lists_to_process, progress_tracker, publisher):
     with tqdm(
         total=len(lists_to_process),
         desc="Processing lists",
@@ -505,11 +438,12 @@ def main():
             list_name = base_url.rstrip('/').split('/')[-1]
             output_json = os.path.join(jsons_dir, f"film_titles_{list_name}.json")
             print_to_csv(f"URL: {base_url}")
-            process_single_list(base_url, output_json, progress_tracker=progress_tracker, update_github=True)
+            process_single_list(base_url, output_json, progress_tracker=progress_tracker, publisher=publisher)
             print_to_csv(f"Completed list {i}/{len(lists_to_process)}")
+            print_to_csv(FETCH_CONCURRENCY.summary())
             main_pbar.update(1)
 
-def process_single_list(base_url, output_json, progress_tracker, max_films=None, update_github=True):
+def process_single_list(base_url, output_json, progress_tracker, max_films=None, publisher=None):
     session = create_session()
     all_data = ThreadSafeList()
     current_page = 1
@@ -552,19 +486,18 @@ def process_single_list(base_url, output_json, progress_tracker, max_films=None,
                 break
                 
             current_page += 1
-            sleep(1)
 
     # Before saving to JSON, sort the data if it contains ListNumber
     final_data = all_data.items
     if any('ListNumber' in item for item in final_data):
         final_data = sorted(final_data, key=lambda x: x.get('ListNumber', float('inf')))
 
-    # Save to GitHub repository only (do not write to local file)
+    # Staged for the run's single GitHub commit only (do not write to local file)
     json_content = json.dumps(final_data, ensure_ascii=False, indent=4)
-    if update_github:
-        update_github_file(output_json, json_content)
+    if publisher is not None:
+        publisher.stage(os.path.basename(output_json), json_content)
     
-    print_to_csv(f"\nSaved {len(all_data)} films to GitHub: {output_json}")
+    print_to_csv(f"\nStaged {len(all_data)} films for GitHub: {output_json}")
     print_to_csv(f"Total time elapsed: {format_time(total_time)}")
     print_to_csv(f"Processing speed: {current_movies_per_second:.2f} movies/second")
 
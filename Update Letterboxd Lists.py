@@ -11,11 +11,12 @@ import platform
 import glob
 import pyautogui
 from tqdm import tqdm
-import csv
 from datetime import datetime
 import logging
 import traceback
 from credentials_loader import load_credentials
+from browser_profile import enable_resource_blocking
+from output_log import INFO, output_log
 
 # Silence undetected_chromedriver's noisy __del__ that logs WinError 6 on shutdown
 try:
@@ -54,18 +55,14 @@ base_dir = paths['base_dir']
 # Leave None to use a fresh profile each run. Close any open Chrome using that profile before running.
 CHROME_USER_DATA_DIR = None  # e.g. r'C:\Users\bigba\AppData\Local\Google\Chrome\User Data'
 CHROME_PROFILE_DIR = None    # e.g. 'Default' or 'Profile 1'
+FAST_BROWSER_PROFILE = True  # Block posters, fonts and ad/analytics scripts (browser_profile.py)
 
 # Define a custom print function
-def log_and_print(message: str):
-    """Prints a message to the terminal and appends it to All_Outputs.csv."""
-    print(message)  # Print to terminal
-    
+def log_and_print(message: str, level: int = INFO):
+    """Prints a message to the terminal and appends it to All_Outputs.csv (written by a background thread)."""
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
-    
-    with open(os.path.join(output_dir, 'All_Outputs.csv'), mode='a', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow([message])  # Write the message as a new row
+    output_log(os.path.join(output_dir, 'All_Outputs.csv')).emit(message, level)
 
 def safe_click_import_button(driver, log_and_print_func):
     """
@@ -262,6 +259,10 @@ def update_letterboxd_lists():
         driver = uc.Chrome(options=options, use_subprocess=True, version_main=chrome_major)
     else:
         driver = uc.Chrome(options=options, use_subprocess=True)
+    if FAST_BROWSER_PROFILE:
+        # Blocking only: the edit pages are driven with fixed sleeps rather than DOM waits, so the
+        # normal page-load strategy stays
+        enable_resource_blocking(driver, log=log_and_print)
     time.sleep(1)  # let Chrome finish starting before navigation
 
     try:
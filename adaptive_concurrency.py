@@ -0,0 +1,105 @@
+"""
+AIMD (additive-increase / multiplicative-decrease) concurrency controller for HTTP fetchers.
+
+Thread-pool fetchers used fixed worker counts (max_workers=5, FETCH_WORKERS = 8) no matter
+how the server was coping. AimdController gates requests instead: a pool can be sized to
+`maximum`, but only `limit` requests are in flight at once. After every `limit` fast,
+successful requests the limit grows by one. A 429, a 5xx or any requests exception (timeout,
+connection error, retries exhausted) halves it, once per congestion event. RateLimitedSession accepts a controller, so a shared
+session is all a fetcher needs.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import requests
+
+DEFAULT_LATENCY_TARGET = 3.0  # seconds; slower responses stop the limit from growing
+
+
+class RequestSlot:
+    """Handed to the code inside AimdController.slot(); report the response through it."""
+
+    def __init__(self):
+        self.failed = False
+
+    def response(self, response: requests.Response) -> None:
+        if response.status_code == 429 or response.status_code >= 500:
+            self.failed = True
+
+    def fail(self) -> None:
+        self.failed = True
+
+
+class AimdController:
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16,
+                 latency_target: float = DEFAULT_LATENCY_TARGET, backoff: float = 0.5,
+                 name: str = 'fetch', log: Callable[[str], None] = print):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.name = name
+        self.log = log
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._cond = threading.Condition()
+        self._healthy = 0  # fast successes since the last change
+        self._epoch = 0  # bumped on every decrease; requests started before it cannot halve again
+        self.in_flight = 0
+        self.peak = self.limit
+        self.increases = 0
+        self.decreases = 0
+        self.avg_latency: Optional[float] = None  # EWMA of request latency
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency level."""
+        return max(self.minimum, int(self._limit))
+
+    @contextmanager
+    def slot(self) -> Iterator[RequestSlot]:
+        """Wait for a free slot, run the request, and feed its outcome back into the limit."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            epoch = self._epoch
+        request_slot = RequestSlot()
+        start = time.monotonic()
+        try:
+            yield request_slot
+        except requests.RequestException:
+            request_slot.fail()
+            raise
+        finally:
+            self._complete(epoch, time.monotonic() - start, request_slot.failed)
+
+    def _complete(self, epoch: int, latency: float, failed: bool) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self.avg_latency = latency if self.avg_latency is None else 0.8 * self.avg_latency + 0.2 * latency
+            if failed:
+                if epoch == self._epoch:
+                    previous = self.limit
+                    self._limit = max(float(self.minimum), self._limit * self.backoff)
+                    self._epoch += 1
+                    self._healthy = 0
+                    self.decreases += 1
+                    if self.limit != previous:
+                        self.log(f"🔻 {self.name} concurrency {previous} -> {self.limit} (server pushed back)")
+            elif latency <= self.latency_target:
+                self._healthy += 1
+                if self._healthy >= self.limit and self._limit < self.maximum:
+                    self._limit += 1
+                    self._healthy = 0
+                    self.increases += 1
+                    self.peak = max(self.peak, self.limit)
+            else:
+                self._healthy = 0
+            self._cond.notify_all()
+
+    def summary(self) -> str:
+        latency = f", avg latency {self.avg_latency:.2f}s" if self.avg_latency is not None else ""
+        return (f"{self.name} concurrency: now {self.limit} (peak {self.peak}, max {self.maximum}), "
+                f"{self.increases} increases, {self.decreases} decreases{latency}")
@@ -0,0 +1,142 @@
+"""
+Pool of parallel browser workers for film-page extraction.
+
+Each worker thread owns its own undetected-Chrome driver (started lazily, so tasks that never
+need a browser never spawn one) and pulls tasks from a shared queue. Results complete out of
+order but are handed back through a reorder buffer: the scraper asks for tickets in listing
+order, so everything it commits (caps, category limits, output order) is exactly as
+deterministic as a single driver processing the films one by one.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+_STOP = object()
+
+
+class BrowserWorker:
+    """Per-thread handle passed to tasks; .driver creates the browser on first use."""
+
+    def __init__(self, index: int, driver_factory: Callable[[], Any]):
+        self.index = index
+        self._driver_factory = driver_factory
+        self._driver = None
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self._driver = self._driver_factory()
+        return self._driver
+
+    @property
+    def started(self) -> bool:
+        return self._driver is not None
+
+    def is_responsive(self) -> bool:
+        if self._driver is None:
+            return True
+        try:
+            self._driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def reset_driver(self) -> None:
+        """Quit the current browser; the next task starts a fresh one."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+
+
+class BrowserPool:
+    def __init__(self, size: int, driver_factory: Callable[[], Any], log: Callable[[str], None] = print):
+        self.size = size
+        self.log = log
+        self._tasks = queue.Queue()
+        self._lock = threading.Condition()
+        self._results: Dict[int, Tuple[bool, Any]] = {}  # reorder buffer: ticket -> (ok, value)
+        self._cancelled = set()
+        self._next_ticket = 0
+        self._workers = [BrowserWorker(i, driver_factory) for i in range(size)]
+        self._threads = [
+            threading.Thread(target=self._run, args=(worker,), daemon=True, name=f"browser-worker-{worker.index}")
+            for worker in self._workers
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self, worker: BrowserWorker):
+        while True:
+            item = self._tasks.get()
+            if item is _STOP:
+                return
+            ticket, task = item
+            with self._lock:
+                if ticket in self._cancelled:
+                    self._cancelled.discard(ticket)
+                    continue
+            try:
+                outcome = (True, task(worker))
+            except Exception as e:
+                outcome = (False, e)
+                if not worker.is_responsive():
+                    self.log(f"🔄 Browser worker {worker.index} crashed; restarting it for the next film.")
+                    worker.reset_driver()
+            with self._lock:
+                if ticket in self._cancelled:
+                    self._cancelled.discard(ticket)
+                else:
+                    self._results[ticket] = outcome
+                    self._lock.notify_all()
+
+    def submit(self, task: Callable[[BrowserWorker], Any]) -> int:
+        """Queue task(worker) and return a ticket for collecting its result."""
+        with self._lock:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+        self._tasks.put((ticket, task))
+        return ticket
+
+    def result(self, ticket: int, timeout: Optional[float] = None) -> Any:
+        """Block until ticket's task finishes; re-raise its exception if it failed."""
+        with self._lock:
+            if not self._lock.wait_for(lambda: ticket in self._results, timeout=timeout):
+                raise TimeoutError(f"Browser pool task {ticket} did not finish in {timeout}s")
+            ok, value = self._results.pop(ticket)
+        if ok:
+            return value
+        raise value
+
+    def cancel(self, tickets: Iterable[int]) -> None:
+        """Drop results for tickets the caller no longer needs (e.g. a cap was reached)."""
+        with self._lock:
+            for ticket in tickets:
+                if self._results.pop(ticket, None) is None:
+                    self._cancelled.add(ticket)
+
+    def map_ordered(self, items: Iterable[Any], task: Callable[[BrowserWorker, Any], Any]) -> Iterator[Tuple[Any, bool, Any]]:
+        """Run task over items in parallel and yield (item, ok, result_or_exception) in input order."""
+        submitted = [(item, self.submit(lambda worker, item=item: task(worker, item))) for item in items]
+        for item, ticket in submitted:
+            try:
+                yield item, True, self.result(ticket)
+            except Exception as e:
+                yield item, False, e
+
+    def close(self) -> None:
+        """Stop the workers (dropping tasks not yet started) and quit their browsers."""
+        try:
+            while True:
+                self._tasks.get_nowait()
+        except queue.Empty:
+            pass
+        for _ in self._threads:
+            self._tasks.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout=60)
+        for worker in self._workers:
+            worker.reset_driver()
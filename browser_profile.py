@@ -0,0 +1,73 @@
+"""
+Fast browser profile for the Selenium scrapers.
+
+A film or listing page pulls in dozens of posters, backdrops, web fonts and ad/analytics
+scripts that no extractor reads, and Chrome's default "normal" page-load strategy makes
+driver.get() wait for all of them. apply_fast_profile() switches the options to the "eager"
+strategy (driver.get() returns at DOMContentLoaded) and enable_resource_blocking() tells
+Chrome over CDP to drop those URLs. Blocking is per browser session, so a real Chrome
+profile passed with --user-data-dir is left untouched. Extractors then wait only for the
+DOM markers they read (FILM_PAGE_MARKERS, LISTING_PAGE_MARKERS) via wait_for_markers().
+"""
+
+from typing import Callable, Iterable, Sequence
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Chrome URL patterns ('*' wildcard) that no extractor needs
+BLOCKED_URL_PATTERNS = [
+    # Posters, backdrops, avatars and icons
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*',
+    # Web fonts
+    '*.woff*', '*.woff2*', '*.ttf*', '*.otf*',
+    # Ads and analytics
+    '*googletagmanager.com*', '*google-analytics.com*', '*googlesyndication.com*',
+    '*doubleclick.net*', '*adservice.google.*', '*amazon-adsystem.com*', '*adnxs.com*',
+    '*pubmatic.com*', '*rubiconproject.com*', '*casalemedia.com*', '*criteo.com*',
+    '*criteo.net*', '*openx.net*', '*moatads.com*', '*adsafeprotected.com*',
+    '*scorecardresearch.com*', '*quantserve.com*', '*quantcount.com*', '*btloader.com*',
+    '*facebook.net*', '*hotjar.com*',
+]
+
+# DOM markers each extractor reads; with the eager strategy these are what to wait for
+FILM_PAGE_MARKERS = ('meta[property="og:title"]',)  # JSON-LD, data-tmdb-id and the footer are server-rendered with it
+LISTING_PAGE_MARKERS = ('li.posteritem',)
+
+
+def apply_fast_profile(options, eager: bool = True) -> None:
+    """Use the eager page-load strategy on ChromeOptions (driver.get() returns at DOMContentLoaded)."""
+    if eager:
+        options.page_load_strategy = 'eager'
+
+
+def enable_resource_blocking(driver, patterns: Sequence[str] = BLOCKED_URL_PATTERNS,
+                             log: Callable[[str], None] = print) -> bool:
+    """Drop requests matching patterns for the rest of this driver's session. Returns False if CDP refused."""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        return True
+    except Exception as e:
+        log(f"⚠️ Could not enable resource blocking; pages will load in full: {str(e)}")
+        return False
+
+
+def disable_resource_blocking(driver) -> None:
+    try:
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+    except Exception:
+        pass
+
+
+def wait_for_markers(driver, markers: Iterable[str], timeout: float = 10) -> bool:
+    """Wait until every CSS selector in markers is present. Returns False on timeout instead of raising."""
+    try:
+        wait = WebDriverWait(driver, timeout)
+        for selector in markers:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+        return True
+    except TimeoutException:
+        return False
@@ -0,0 +1,60 @@
+"""
+Warm browser sessions that outlive a single scraper.
+
+Genre 250s used to build a new LetterboxdScraper, and so a new undetected Chrome (version
+detection, profile, CDP setup) plus its film-page pool, for each of its 34 genre/sort
+combinations and again on every retry. BrowserSessionManager keeps the main driver and the
+pool alive for the whole run. Each combination still gets a fresh scraper, but checkout()
+hands it the warm driver after a health check, and the driver is replaced only when that
+check fails.
+"""
+
+from typing import Any, Callable, Optional
+
+from browser_pool import BrowserPool, BrowserWorker
+
+
+def driver_is_healthy(driver) -> bool:
+    """True if the driver still answers commands and has an open window."""
+    try:
+        if not driver.window_handles:
+            return False
+        driver.current_url
+        driver.execute_script('return document.readyState')
+        return True
+    except Exception:
+        return False
+
+
+class BrowserSessionManager:
+    def __init__(self, driver_factory: Callable[[], Any], pool_size: int = 0, log: Callable[[str], None] = print):
+        self.log = log
+        self._main = BrowserWorker(0, driver_factory)
+        # Film-page workers; BrowserPool already restarts a worker whose browser crashes
+        self.pool: Optional[BrowserPool] = BrowserPool(pool_size, driver_factory, log=log) if pool_size > 1 else None
+        self.checkouts = 0
+        self.replacements = 0
+
+    def checkout(self):
+        """Return the warm main driver, starting it on first use or replacing it if unhealthy."""
+        self.checkouts += 1
+        if self._main.started and not driver_is_healthy(self._main.driver):
+            self.log("🔄 Browser failed its health check; starting a new one.")
+            self.replace()
+        return self._main.driver
+
+    def replace(self) -> None:
+        """Quit the main driver; the next checkout() starts a fresh one."""
+        if self._main.started:
+            self.replacements += 1
+        self._main.reset_driver()
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+        self._main.reset_driver()
+
+    def summary(self) -> str:
+        return (f"Browser sessions: {self.checkouts} checkouts served by "
+                f"{self.replacements + 1 if self.checkouts else 0} main browser(s), {self.replacements} replaced")
@@ -0,0 +1,170 @@
+"""
+Write-behind buffer for keyed Excel workbooks (blacklist.xlsx, Zero_Reviews.xlsx).
+
+Adding or removing a single film used to pd.concat/drop and rewrite the whole workbook on
+every call. DeferredWorkbook keeps the mutations in memory and writes them out every
+FLUSH_EVERY changes or FLUSH_INTERVAL seconds, and again at shutdown (flush_all is
+registered with atexit and is meant to be called from signal handlers too). Each flush
+writes a temp file and atomically renames it over the workbook. With shared=True several
+processes can buffer changes to the same workbook: a flush takes a FileLock, re-reads the
+file and applies only this process's changes on top of it.
+"""
+
+import atexit
+import os
+import tempfile
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from file_lock import FileLock
+
+FLUSH_EVERY = 25  # pending changes before a flush
+FLUSH_INTERVAL = 60.0  # seconds before pending changes are flushed regardless
+
+_open_workbooks = weakref.WeakSet()
+
+
+def write_excel_atomic(df: pd.DataFrame, path: str) -> None:
+    """Write df to a sibling temp file and rename it over path."""
+    # A temp file per writer: unlocked writers of the same workbook must not write into each other's file
+    root, ext = os.path.splitext(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(root), prefix=os.path.basename(root) + '.', suffix='.tmp' + ext)
+    os.close(fd)
+    try:
+        df.to_excel(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class DeferredWorkbook:
+    def __init__(
+        self,
+        path: str,
+        df: pd.DataFrame,
+        key_column: str = 'Link',
+        flush_every: int = FLUSH_EVERY,
+        flush_interval: Optional[float] = FLUSH_INTERVAL,
+        log: Callable[[str], None] = print,
+        shared: bool = False,
+    ):
+        self.path = path
+        self.shared = shared
+        self.key_column = key_column
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.log = log
+        self._df = df
+        self._pending_rows: List[Dict] = []
+        self._pending_keys: Dict[str, int] = {}
+        self._removed_keys = set()
+        self._changes = 0
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._timer = None
+        if flush_interval:
+            self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._timer.start()
+        _open_workbooks.add(self)
+
+    @property
+    def pending(self) -> int:
+        """Number of changes not yet written to disk."""
+        return self._changes
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """The workbook contents including changes that have not been flushed yet."""
+        with self._lock:
+            return self._merged()
+
+    def _merged(self, base: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Apply pending changes to base (default: the in-memory copy)."""
+        df = self._df if base is None else base
+        if self._removed_keys:
+            df = df[~df[self.key_column].isin(self._removed_keys)]
+        rows = self._pending_rows
+        if base is not None:
+            # Another process may already have written the same key
+            existing = set(df[self.key_column])
+            rows = [r for r in rows if r.get(self.key_column) not in existing]
+        if rows:
+            df = pd.concat([df, pd.DataFrame(rows, columns=df.columns)], ignore_index=True)
+        return df
+
+    def _write_shared(self) -> pd.DataFrame:
+        with FileLock(self.path):
+            on_disk = pd.read_excel(self.path, header=0) if os.path.exists(self.path) else self._df.iloc[0:0]
+            if self.key_column in on_disk.columns:
+                on_disk[self.key_column] = on_disk[self.key_column].fillna('')
+            merged = self._merged(on_disk)
+            write_excel_atomic(merged, self.path)
+        return merged
+
+    def append(self, row: Dict) -> None:
+        """Queue a new row."""
+        with self._lock:
+            key = row.get(self.key_column)
+            self._pending_keys[key] = len(self._pending_rows)
+            self._pending_rows.append(row)
+            self._changes += 1
+            self._maybe_flush()
+
+    def remove(self, key: str) -> None:
+        """Queue removal of every row whose key column equals key."""
+        with self._lock:
+            if key in self._pending_keys:
+                self._pending_rows = [r for r in self._pending_rows if r.get(self.key_column) != key]
+                self._pending_keys = {r.get(self.key_column): i for i, r in enumerate(self._pending_rows)}
+            self._removed_keys.add(key)
+            self._changes += 1
+            self._maybe_flush()
+
+    def _maybe_flush(self):
+        if self.flush_every and self._changes >= self.flush_every:
+            self.flush()
+
+    def _flush_periodically(self):
+        while not self._stop.wait(self.flush_interval):
+            if self._changes:
+                self.flush()
+
+    def flush(self) -> bool:
+        """Write pending changes to disk. Returns False if the write failed (changes stay queued)."""
+        with self._lock:
+            if not self._changes:
+                return True
+            try:
+                if self.shared:
+                    merged = self._write_shared()
+                else:
+                    merged = self._merged()
+                    write_excel_atomic(merged, self.path)
+            except Exception as e:
+                self.log(f"❌ Error writing {os.path.basename(self.path)}: {str(e)}")
+                return False
+            self._df = merged.reset_index(drop=True)
+            self._pending_rows = []
+            self._pending_keys = {}
+            self._removed_keys = set()
+            self._changes = 0
+            return True
+
+    def close(self) -> None:
+        """Stop the periodic flusher and write anything still pending."""
+        self._stop.set()
+        self.flush()
+        _open_workbooks.discard(self)
+
+
+def flush_all() -> None:
+    """Flush every open DeferredWorkbook (used at shutdown and from signal handlers)."""
+    for workbook in list(_open_workbooks):
+        workbook.flush()
+
+
+atexit.register(flush_all)
@@ -0,0 +1,60 @@
+"""
+Cross-process lock files.
+
+Scrapers running as several processes share workbooks and CSVs in the same folders.
+FileLock serialises their writers with a sidecar lock file created with O_CREAT | O_EXCL,
+which works the same way on Windows and macOS. A lock left behind by a crashed process is
+broken once it is older than `stale_after`.
+"""
+
+import os
+import time
+from typing import Optional
+
+
+class FileLock:
+    def __init__(self, path: str, timeout: float = 120.0, stale_after: float = 600.0, poll: float = 0.05):
+        self.lock_path = path + '.lock'
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll = poll
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return
+            except FileExistsError:
+                self._break_if_stale()
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.lock_path}")
+                time.sleep(self.poll)
+
+    def _break_if_stale(self) -> None:
+        try:
+            if time.time() - os.path.getmtime(self.lock_path) > self.stale_after:
+                os.remove(self.lock_path)
+        except OSError:
+            pass
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            os.close(self._fd)
+        finally:
+            self._fd = None
+            try:
+                os.remove(self.lock_path)
+            except OSError:
+                pass
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
@@ -0,0 +1,73 @@
+"""
+Short-lived cache of parsed Letterboxd film pages.
+
+The popular and rating passes of 5000 Pop and Top see many of the same films, and when
+they run side by side in separate processes each one used to load and parse every film
+page itself. FilmPageCache keeps the result of a film page load (the load_film_page dict:
+status, movie_data, masthead_title, rating_count) per film URL in SQLite, so a page one
+pass loaded is a hit for the other. The lists are ranked on the cached rating counts and
+runtimes, so the cache must only share pages within a run: the scraper clear()s it when a
+new run starts (a --resume keeps it), and the TTL is only a backstop.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_TTL_DAYS = 2
+CACHED_FIELDS = ('status', 'movie_data', 'masthead_title', 'rating_count')
+
+
+class FilmPageCache:
+    def __init__(self, db_path: str, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.ttl = ttl_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS film_pages (
+                    link TEXT PRIMARY KEY,
+                    page TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+
+    def get(self, link: str) -> Optional[Dict]:
+        """Return a copy of the cached page dict, or None when missing or expired."""
+        with self._lock:
+            row = self.conn.execute('SELECT page, fetched_at FROM film_pages WHERE link = ?', (link,)).fetchone()
+            if row is not None and time.time() - row[1] < self.ttl:
+                self.hits += 1
+                return json.loads(row[0])
+            self.misses += 1
+            return None
+
+    def put(self, link: str, page: Dict) -> None:
+        entry = {field: page.get(field) for field in CACHED_FIELDS}
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO film_pages (link, page, fetched_at) VALUES (?, ?, ?)',
+                (link, json.dumps(entry, default=str), time.time()),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self.conn:
+            self.conn.execute('DELETE FROM film_pages')
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return f"Film page cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate)"
+
+    def close(self):
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,240 @@
+"""
+HTTP-first Letterboxd film page fetcher.
+
+Everything extract_all_movie_data reads from a film page (og:title, data-tmdb-id, JSON-LD
+ratingCount, runtime footer, crew/cast/genres/details/releases tabs) is in the server-rendered
+HTML, so most films can be parsed from a plain requests fetch instead of a full browser load.
+FilmPageFetcher returns None whenever the response looks like a Cloudflare challenge or is
+missing the expected markers, and the caller falls back to Selenium. Every film is recorded
+with the path ('http' or 'selenium') that served it.
+"""
+
+import csv
+import json
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from rate_limiter import RateLimitedSession
+from taxonomy import first_mpaa_rating
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+CHALLENGE_MARKERS = (
+    'cf-browser-verification',
+    'cf_chl_opt',
+    'challenge-platform',
+    '<title>Just a moment...</title>',
+    'Attention Required! | Cloudflare',
+)
+
+
+def is_challenge_page(status_code: int, html: str) -> bool:
+    """True if the response is a Cloudflare interstitial rather than a film page."""
+    if status_code in (403, 503) and 'cloudflare' in html.lower():
+        return True
+    return any(marker in html for marker in CHALLENGE_MARKERS)
+
+
+def _texts(soup: BeautifulSoup, selector: str) -> List[str]:
+    return [t for t in (el.get_text().strip() for el in soup.select(selector)) if t]
+
+
+def _unique(names: List[str]) -> List[str]:
+    seen = set()
+    out = []
+    for name in names:
+        if name and name not in seen:
+            seen.add(name)
+            out.append(name)
+    return out
+
+
+def _directors(soup: BeautifulSoup) -> List[str]:
+    names = _unique(_texts(soup, '#tab-crew a.text-slug[href*="/director/"]'))
+    if names:
+        return names
+    for h3 in soup.select('#tab-crew h3'):
+        full_role = h3.select_one('.crewrole.-full')
+        short_role = h3.select_one('.crewrole.-short')
+        roles = {el.get_text().strip() for el in (full_role, short_role) if el is not None}
+        if 'Director' in roles:
+            slug_container = h3.find_next_sibling()
+            if slug_container is not None:
+                names.extend(_texts(slug_container, 'a.text-slug'))
+    names = _unique(names)
+    if names:
+        return names
+    return _texts(soup, 'span.creatorlist a.contributor, span.creatorlist a.contributor span.prettify')
+
+
+def _mpaa(soup: BeautifulSoup) -> Optional[str]:
+    usa_ratings = []
+    for country in soup.select('.release-country'):
+        name_el = country.select_one('.name')
+        rating_el = country.select_one('.release-certification-badge .label')
+        name = name_el.get_text().strip() if name_el else ''
+        rating = rating_el.get_text().strip() if rating_el else ''
+        if name == 'USA' and rating:
+            usa_ratings.append(rating)
+    return first_mpaa_rating(usa_ratings)
+
+
+def _rating_count(soup: BeautifulSoup, html: str) -> int:
+    json_ld = soup.find('script', type='application/ld+json')
+    if json_ld and json_ld.string:
+        try:
+            json_text = json_ld.string.replace('/* <![CDATA[ */', '').replace('/* ]]> */', '').strip()
+            count = json.loads(json_text).get('aggregateRating', {}).get('ratingCount')
+            if count:
+                return int(count)
+        except (ValueError, AttributeError):
+            pass
+    match = re.search(r'ratingCount":(\d+)', html)
+    return int(match.group(1)) if match else 0
+
+
+def masthead_title_from_soup(soup: BeautifulSoup) -> Optional[str]:
+    """Canonical film title from the masthead (h1.primaryname), as masthead_title_from_driver reads it."""
+    h1 = soup.select_one('section.production-masthead h1.headline-1.primaryname')
+    if h1 is None:
+        return None
+    name = h1.select_one('span.name')
+    raw = (name or h1).get_text().strip()
+    if not raw:
+        return None
+    return unicodedata.normalize('NFKC', raw.replace('\xa0', ' ')).strip()
+
+
+def has_film_markers(soup: BeautifulSoup) -> bool:
+    """The fields the scraper cannot do without must be present in the served HTML."""
+    return (
+        soup.find('meta', property='og:title') is not None
+        and soup.find('script', type='application/ld+json') is not None
+        and soup.select_one('p.text-link.text-footer') is not None
+    )
+
+
+def parse_film_page(html: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Parse a film page into the same dict extract_all_movie_data builds (Title/Link left as None
+    for the caller) plus the masthead title. Returns (None, None) if markers are missing.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    if not has_film_markers(soup):
+        return None, None
+
+    meta_title = soup.find('meta', property='og:title').get('content', '')
+    release_year = None
+    if '(' in meta_title and ')' in meta_title:
+        release_year = meta_title.split('(')[-1].strip(')')
+
+    tmdb_el = soup.find(attrs={'data-tmdb-id': True})
+    runtime = None
+    runtime_match = re.search(r'(\d+)\s*min(?:s)?', soup.select_one('p.text-link.text-footer').get_text())
+    if runtime_match:
+        runtime = int(runtime_match.group(1))
+
+    genres = [
+        g for g in _texts(soup, '#tab-genres .text-sluglist a.text-slug[href*="/films/genre/"]')
+        if '…' not in g and g != 'Show All'
+    ]
+
+    movie_data = {
+        'Title': None,  # Will be set by caller
+        'Year': release_year,
+        'tmdbID': (tmdb_el.get('data-tmdb-id') if tmdb_el else None) or None,
+        'MPAA': _mpaa(soup),
+        'Runtime': runtime,
+        'RatingCount': _rating_count(soup, html),
+        'Languages': _texts(soup, '#tab-details .text-sluglist a.text-slug[href*="/films/language/"]'),
+        'Countries': _texts(soup, '#tab-details .text-sluglist a.text-slug[href*="/films/country/"]'),
+        'Decade': (int(release_year) // 10) * 10 if release_year and release_year.isdigit() else None,
+        'Directors': _directors(soup),
+        'Genres': genres,
+        'Studios': _texts(soup, '#tab-details .text-sluglist a.text-slug[href*="/studio/"]'),
+        'Actors': _texts(soup, '#tab-cast .text-sluglist a.text-slug.tooltip'),
+        'Link': None  # Will be set by caller
+    }
+    return movie_data, masthead_title_from_soup(soup)
+
+
+def create_session() -> requests.Session:
+    session = RateLimitedSession()
+    session.headers.update({'User-Agent': USER_AGENT})
+    # Keep retries short: a blocked or slow request should fall back to the browser quickly
+    retry_strategy = Retry(total=2, backoff_factor=0.5, status_forcelist=[500, 502, 504])
+    adapter = HTTPAdapter(max_retries=retry_strategy)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class FilmPageFetcher:
+    def __init__(self, session: Optional[requests.Session] = None, timeout: float = 15, log: Callable[[str], None] = print):
+        self.session = session or create_session()
+        self.timeout = timeout
+        self.log = log
+        self.served_by: Dict[str, str] = {}
+        self.counts = Counter()
+        self.fallback_reasons = Counter()
+        self._lock = threading.Lock()  # fetch() may run on several pool workers at once
+
+    def fetch(self, film_url: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Fetch and parse a film page over HTTP. Returns (movie_data, masthead_title), or
+        (None, None) when the caller should load the page in the browser instead.
+        """
+        try:
+            response = self.session.get(film_url, timeout=self.timeout)
+        except requests.RequestException as e:
+            return self._fallback(film_url, f"request error: {type(e).__name__}")
+
+        html = response.text
+        if is_challenge_page(response.status_code, html):
+            return self._fallback(film_url, "Cloudflare challenge")
+        if response.status_code != 200:
+            return self._fallback(film_url, f"HTTP {response.status_code}")
+
+        movie_data, masthead_title = parse_film_page(html)
+        if movie_data is None:
+            return self._fallback(film_url, "missing page markers")
+        self.record(film_url, 'http')
+        return movie_data, masthead_title
+
+    def _fallback(self, film_url: str, reason: str) -> Tuple[None, None]:
+        with self._lock:
+            self.fallback_reasons[reason] += 1
+        self.log(f"🔄 HTTP fetch fell back to browser for {film_url} ({reason})")
+        return None, None
+
+    def record(self, film_url: str, path: str) -> None:
+        """Remember which path ('http', 'selenium' or 'cache') served a film."""
+        with self._lock:
+            self.served_by[film_url] = path
+            self.counts[path] += 1
+
+    def summary(self) -> str:
+        total = sum(self.counts.values())
+        http = self.counts.get('http', 0)
+        rate = http / total * 100 if total else 0.0
+        reasons = ', '.join(f"{reason}: {count}" for reason, count in self.fallback_reasons.most_common())
+        text = f"Film pages: {http} via HTTP, {self.counts.get('selenium', 0)} via browser ({rate:.1f}% HTTP)"
+        if self.counts.get('cache'):
+            text += f", {self.counts['cache']} from the film page cache"
+        return f"{text} [fallbacks - {reasons}]" if reasons else text
+
+    def save_served_by(self, path: str) -> None:
+        """Write the per-film path record to a CSV (Link, Served By)."""
+        with open(path, mode='w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['Link', 'Served By'])
+            for film_url, served in self.served_by.items():
+                writer.writerow([film_url, served])
@@ -0,0 +1,98 @@
+"""
+Columnar top-10 statistics for the 5000 Pop and Top lists.
+
+Every list the scraper writes (each MPAA rating, runtime band and continent, plus the 5000
+list itself) used to carry eight defaultdict(int) counters, bumped film by film and then
+rebuilt from the whitelist for the capped list at save time. FilmStatsTable instead keeps
+one long-form table with a row per (film, attribute, value) - directors, actors, decade,
+genres, studios, languages and countries - recorded once per film. At save time the final
+list memberships are joined onto it and every list's top values come out of a single
+grouped count.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+# (attribute, movie-data key, display name) in the order the stats files list them; decade is derived from Year
+STAT_ATTRIBUTES = (
+    ('director', 'Directors', 'directors'),
+    ('actor', 'Actors', 'actors'),
+    ('decade', None, 'decades'),
+    ('genre', 'Genres', 'genres'),
+    ('studio', 'Studios', 'studios'),
+    ('language', 'Languages', 'languages'),
+    ('country', 'Countries', 'countries'),
+)
+
+TopValues = Dict[str, List[Tuple[str, int]]]
+
+
+def film_decade(info: Dict) -> Optional[str]:
+    """'1990' for a 1994 film, from Year (or the precomputed Decade when Year is unusable)."""
+    try:
+        return str(int(info.get('Year')) // 10 * 10)
+    except (TypeError, ValueError):
+        decade = info.get('Decade')
+        return str(decade) if decade else None
+
+
+class FilmStatsTable:
+    def __init__(self):
+        self._rows: List[Tuple[str, str, str]] = []
+        self._links: Set[str] = set()
+        self._frame: Optional[pd.DataFrame] = None
+
+    def __contains__(self, link: str) -> bool:
+        return link in self._links
+
+    def add_film(self, link: str, info: Dict) -> None:
+        """Record a film's attribute values once; later calls for the same link are ignored."""
+        if not link or link in self._links or not info:
+            return
+        self._links.add(link)
+        for attribute, key, _ in STAT_ATTRIBUTES:
+            values = [film_decade(info)] if key is None else (info.get(key) or [])
+            self._rows.extend((link, attribute, str(value)) for value in values if value)
+        self._frame = None
+
+    def frame(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = pd.DataFrame(self._rows, columns=['link', 'attribute', 'value'])
+        return self._frame
+
+    def top_values(self, memberships: Dict[str, Iterable[str]], n: int = 10) -> Dict[str, TopValues]:
+        """
+        For each list name -> film links, the n most common values of every attribute over those films.
+        Ties keep first-appearance order in the list, as the old per-film counters did.
+        """
+        result = {name: {attribute: [] for attribute, _, _ in STAT_ATTRIBUTES} for name in memberships}
+        membership = pd.DataFrame(
+            [(name, link) for name, links in memberships.items() for link in dict.fromkeys(links)],
+            columns=['list', 'link'],
+        )
+        joined = membership.merge(self.frame(), on='link', how='inner')
+        if joined.empty:
+            return result
+
+        counts = joined.groupby(['list', 'attribute', 'value'], sort=False).size().reset_index(name='count')
+        counts = counts.sort_values('count', ascending=False, kind='stable')
+        top = counts.groupby(['list', 'attribute'], sort=False).head(n)
+        for name, attribute, value, count in top.itertuples(index=False):
+            result[name][attribute].append((value, int(count)))
+        return result
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._links.clear()
+        self._frame = None
+
+
+def write_top_values(file, top: TopValues, decade_suffix: str = 's') -> None:
+    """Write the 'ten most appearing' sections of a stats file."""
+    for attribute, _, display_name in STAT_ATTRIBUTES:
+        file.write(f"<strong>The ten most appearing {display_name}:</strong>\n")
+        suffix = decade_suffix if attribute == 'decade' else ''
+        for value, count in top.get(attribute, []):
+            file.write(f"{value}{suffix}: {count}\n")
+        file.write("\n")
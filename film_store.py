@@ -0,0 +1,251 @@
+"""
+Indexed SQLite store for whitelist film metadata.
+
+The scrapers used to rewrite (and then re-read) the whole whitelist.xlsx every time a
+single film's Information changed. FilmStore keeps the same Title/Year/Information/Link
+rows in a SQLite table keyed on the Letterboxd URL so a refresh is a single-row upsert.
+whitelist.xlsx stays the hand-editable copy: it is imported whenever it changes on disk
+and exported back once at the end of a run. The parsed lookup is also kept in a pickled
+sidecar snapshot keyed on the store's revision and re-saved by every export, so the next
+start-up loads it without re-parsing every row.
+"""
+
+import json
+import os
+import sqlite3
+import unicodedata
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from deferred_workbook import write_excel_atomic
+from whitelist_snapshot import load_snapshot, save_snapshot
+
+WHITELIST_COLUMNS = ['Title', 'Year', 'Information', 'Link']
+
+
+def _normalize_text(text) -> str:
+    return unicodedata.normalize('NFKC', str(text)).strip()
+
+
+def _parse_information(raw) -> Dict:
+    """Parse an Information cell, treating empty or malformed values as an empty dict."""
+    if raw is None:
+        return {}
+    if isinstance(raw, dict):
+        return raw
+    try:
+        if pd.isna(raw) or raw == '':
+            return {}
+        info = json.loads(raw)
+        return info if isinstance(info, dict) else {}
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return {}
+
+
+def store_path_for(xlsx_path: str) -> str:
+    """Return the SQLite path that sits next to a whitelist workbook."""
+    return os.path.splitext(xlsx_path)[0] + '.sqlite3'
+
+
+class FilmStore:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.snapshot_path = os.path.splitext(db_path)[0] + '.snapshot.pkl'
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._in_transaction = False
+        self._create_schema()
+
+    def _create_schema(self):
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS films (
+                    link TEXT PRIMARY KEY,
+                    title TEXT NOT NULL DEFAULT '',
+                    year TEXT NOT NULL DEFAULT '',
+                    information TEXT NOT NULL DEFAULT '{}'
+                )
+                """
+            )
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_films_title_year ON films (title, year)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            # store_id distinguishes a recreated database from an old one with the same revision
+            self.conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('store_id', ?)", (uuid.uuid4().hex,))
+            self.conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', '0')")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several writes into one commit. Nested use joins the outer transaction."""
+        if self._in_transaction:
+            yield self.conn
+            return
+        self._in_transaction = True
+        try:
+            with self.conn:
+                yield self.conn
+        finally:
+            self._in_transaction = False
+
+    def _commit(self):
+        if not self._in_transaction:
+            self.conn.commit()
+
+    def _bump_revision(self):
+        self.conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision'")
+
+    def revision(self) -> Tuple[str, int]:
+        """Return (store_id, revision); it changes whenever film rows change."""
+        return self._get_meta('store_id'), int(self._get_meta('revision') or 0)
+
+    def upsert(self, link: str, title: str, year: str, info: Dict) -> int:
+        """Insert or update one film by URL and return its row id."""
+        self.conn.execute(
+            """
+            INSERT INTO films (link, title, year, information) VALUES (?, ?, ?, ?)
+            ON CONFLICT(link) DO UPDATE SET
+                title = excluded.title,
+                year = excluded.year,
+                information = excluded.information
+            """,
+            (link, _normalize_text(title), str(year).strip(), json.dumps(info or {})),
+        )
+        row = self.conn.execute('SELECT rowid FROM films WHERE link = ?', (link,)).fetchone()
+        self._bump_revision()
+        self._commit()
+        return row[0]
+
+    def update_information(self, link: str, info: Dict) -> bool:
+        """Replace only the Information of an existing film. Returns False if the URL is unknown."""
+        cursor = self.conn.execute(
+            'UPDATE films SET information = ? WHERE link = ?', (json.dumps(info or {}), link)
+        )
+        if cursor.rowcount:
+            self._bump_revision()
+        self._commit()
+        return cursor.rowcount > 0
+
+    def get(self, link: str) -> Optional[Dict]:
+        """Return the parsed Information for a URL, or None if it is not stored."""
+        row = self.conn.execute('SELECT information FROM films WHERE link = ?', (link,)).fetchone()
+        if row is None:
+            return None
+        return _parse_information(row[0])
+
+    def delete(self, link: str) -> bool:
+        cursor = self.conn.execute('DELETE FROM films WHERE link = ?', (link,))
+        if cursor.rowcount:
+            self._bump_revision()
+        self._commit()
+        return cursor.rowcount > 0
+
+    def __contains__(self, link: str) -> bool:
+        return self.conn.execute('SELECT 1 FROM films WHERE link = ?', (link,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM films').fetchone()[0]
+
+    def lookup(self) -> Dict[str, Tuple[Dict, int, str]]:
+        """Build the scrapers' whitelist_lookup shape: {link: (info, row_id, link)}."""
+        lookup = load_snapshot(None, self.snapshot_path, version=self.revision())
+        if lookup is not None:
+            return lookup
+        return self.save_lookup_snapshot()
+
+    def save_lookup_snapshot(self) -> Dict[str, Tuple[Dict, int, str]]:
+        """Parse every row into the lookup and snapshot it under the current revision."""
+        lookup = {}
+        for rowid, link, information in self.conn.execute('SELECT rowid, link, information FROM films'):
+            lookup[link] = (_parse_information(information), rowid, link)
+        save_snapshot(None, lookup, self.snapshot_path, version=self.revision())
+        return lookup
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    @staticmethod
+    def _file_signature(path: str) -> str:
+        stat = os.stat(path)
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def import_from_xlsx(self, xlsx_path: str) -> int:
+        """
+        Make the store mirror a whitelist workbook: upsert every row and delete films whose
+        Link is no longer in the sheet. Rows without a Link are skipped.
+        """
+        df = pd.read_excel(xlsx_path, header=0)
+        if 'Link' not in df.columns or 'Title' not in df.columns:
+            raise ValueError(f"{os.path.basename(xlsx_path)} has wrong structure (expected {WHITELIST_COLUMNS})")
+        if 'Year' not in df.columns:
+            df['Year'] = ''
+        if 'Information' not in df.columns:
+            df['Information'] = ''
+        df['Link'] = df['Link'].fillna('')
+
+        rows = []
+        for title, year, information, link in df[WHITELIST_COLUMNS].itertuples(index=False, name=None):
+            if not link:
+                continue
+            rows.append((
+                link,
+                _normalize_text(title),
+                str(year).strip(),
+                json.dumps(_parse_information(information)),
+            ))
+
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO films (link, title, year, information) VALUES (?, ?, ?, ?)
+                ON CONFLICT(link) DO UPDATE SET
+                    title = excluded.title,
+                    year = excluded.year,
+                    information = excluded.information
+                """,
+                rows,
+            )
+            # Rows removed from the workbook by hand must not come back on the next export
+            conn.execute('CREATE TEMP TABLE IF NOT EXISTS import_links (link TEXT PRIMARY KEY)')
+            conn.execute('DELETE FROM import_links')
+            conn.executemany('INSERT OR IGNORE INTO import_links (link) VALUES (?)', ((row[0],) for row in rows))
+            conn.execute('DELETE FROM films WHERE link NOT IN (SELECT link FROM import_links)')
+            conn.execute('DELETE FROM import_links')
+            self._bump_revision()
+            self._set_meta('xlsx_signature', self._file_signature(xlsx_path))
+        return len(rows)
+
+    def sync_from_xlsx(self, xlsx_path: str) -> Optional[int]:
+        """Import the workbook only if it changed since the last import/export. Returns rows imported or None."""
+        if not os.path.exists(xlsx_path):
+            return None
+        if self._get_meta('xlsx_signature') == self._file_signature(xlsx_path):
+            return None
+        return self.import_from_xlsx(xlsx_path)
+
+    def export_to_xlsx(self, xlsx_path: str) -> int:
+        """
+        Write all films back to a workbook in insertion order and remember its signature. The
+        lookup snapshot is re-saved too: the run's upserts moved the revision on, and the next
+        start-up (which finds the workbook unchanged) should hit the snapshot, not rebuild it.
+        """
+        rows = self.conn.execute('SELECT title, year, information, link FROM films ORDER BY rowid').fetchall()
+        df = pd.DataFrame(rows, columns=WHITELIST_COLUMNS)
+        write_excel_atomic(df, xlsx_path)
+        with self.transaction():
+            self._set_meta('xlsx_signature', self._file_signature(xlsx_path))
+        self.save_lookup_snapshot()
+        return len(rows)
+
+    def close(self):
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
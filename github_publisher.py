@@ -0,0 +1,114 @@
+"""
+Publish many files to a GitHub repository as a single commit.
+
+Update JSONs used to push each list's JSON on its own: a new Github client, get_repo,
+get_contents and update_file per list, so 100+ lists cost several hundred API calls and
+left 100+ commits behind. GitHubPublisher collects the files in memory with stage() and
+publish() writes them all through the Git data API: read the branch head, create one tree
+(file contents inline, so no per-file blob calls) on top of the head's tree, create one
+commit and move the branch to it. That is about six API calls however many files there
+are. If someone else pushes in between, the branch update is refused and publish() starts
+again from the new head.
+
+Most lists come out identical from one run to the next. publish() reads the head's tree
+(one more call) and compares each remote file's blob SHA with git_blob_sha() of the staged
+content, so unchanged files are left out of the tree, and a run where nothing changed makes
+no commit at all. uploaded/skipped keep count across publishes for the run summary.
+
+The API base URL comes from site_urls (GITHUB_API_URL), so runs can be pointed at the
+GitHub stand-in in "Mock Site Server.py".
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from github import Auth, Github, GithubException, InputGitTreeElement
+
+from site_urls import base_url
+
+FILE_MODE = '100644'  # Regular, non-executable file
+MAX_PUBLISH_ATTEMPTS = 3  # Branch moved under us this many times -> give up
+
+
+def git_blob_sha(content: str) -> str:
+    """The SHA git (and GitHub) gives a file with this content."""
+    data = content.encode('utf-8')
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+class GitHubPublisher:
+    def __init__(self, repo_name: str, token: str, branch: Optional[str] = None, log: Callable[[str], None] = print):
+        self.repo_name = repo_name
+        self.token = token
+        self.branch = branch
+        self.log = log
+        self.staged: Dict[str, str] = {}
+        self.uploaded = 0
+        self.skipped = 0
+        self._repo = None
+
+    def stage(self, path: str, content: str) -> None:
+        """Queue a file for the next publish(); staging the same path again replaces its content."""
+        self.staged[path] = content
+
+    def __len__(self) -> int:
+        return len(self.staged)
+
+    def _get_repo(self):
+        if self._repo is None:
+            client = Github(auth=Auth.Token(self.token), base_url=base_url('github'))
+            self._repo = client.get_repo(self.repo_name)
+            self.branch = self.branch or self._repo.default_branch
+        return self._repo
+
+    def _commit_staged(self, repo, message: str) -> Tuple[Optional[str], int]:
+        """(new commit SHA or None if every file was unchanged, number of files uploaded)."""
+        ref = repo.get_git_ref(f"heads/{self.branch}")
+        head = repo.get_git_commit(ref.object.sha)
+        remote = {entry.path: entry.sha for entry in repo.get_git_tree(head.tree.sha, recursive=True).tree}
+        changed = {path: content for path, content in self.staged.items() if remote.get(path) != git_blob_sha(content)}
+        if not changed:
+            return None, 0
+        elements = [InputGitTreeElement(path, FILE_MODE, 'blob', content=content) for path, content in changed.items()]
+        tree = repo.create_git_tree(elements, base_tree=head.tree)
+        commit = repo.create_git_commit(message, tree, [head])
+        ref.edit(commit.sha)  # Not forced: refused if the branch moved since we read it
+        return commit.sha, len(changed)
+
+    def publish(self, message: Optional[str] = None) -> Optional[str]:
+        """
+        Commit every staged file that differs from the branch in one commit. Returns its SHA, or
+        None if nothing was staged, nothing changed or publishing failed.
+        """
+        if not self.staged:
+            self.log("ℹ️ Nothing staged for GitHub; no commit made.")
+            return None
+        message = message or f"Updated {len(self.staged)} files - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        for attempt in range(1, MAX_PUBLISH_ATTEMPTS + 1):
+            try:
+                sha, uploaded = self._commit_staged(self._get_repo(), message)
+            except GithubException as e:
+                # 409/422: the branch head changed between reading it and updating it
+                if e.status in (409, 422) and attempt < MAX_PUBLISH_ATTEMPTS:
+                    self.log(f"⚠️ {self.branch} moved during publish, retrying ({attempt}/{MAX_PUBLISH_ATTEMPTS})...")
+                    continue
+                self.log(f"❌ Error publishing {len(self.staged)} files to GitHub: {str(e)}")
+                return None
+            except Exception as e:
+                self.log(f"❌ Error publishing {len(self.staged)} files to GitHub: {str(e)}")
+                return None
+            skipped = len(self.staged) - uploaded
+            self.uploaded += uploaded
+            self.skipped += skipped
+            if sha is None:
+                self.log(f"ℹ️ All {skipped} files match {self.repo_name}@{self.branch}; no commit made.")
+            else:
+                self.log(f"✅ Published {uploaded} changed files to {self.repo_name}@{self.branch} in commit {sha[:7]} "
+                         f"({skipped} unchanged, skipped)")
+            self.staged.clear()
+            return sha
+        return None
+
+    def summary(self) -> str:
+        return f"GitHub publish: {self.uploaded} uploaded, {self.skipped} unchanged (skipped)"
@@ -0,0 +1,126 @@
+"""
+Listing-page prefetch pipeline.
+
+The scrapers used to load /films/by/.../page/N+1/ only after every film on page N had been
+processed. ListingPrefetcher runs the page loader on a producer thread, keeping up to
+`lookahead` parsed pages in a bounded queue, so the per-film consumer rarely waits on a
+listing load. Pages the consumer has taken stay in a small snapshot cache, which the
+boundary-heal logic reads for the previous page's rows. With lookahead 0 nothing runs in
+the background and get() loads each page inline.
+"""
+
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+DEFAULT_LOOKAHEAD = 2
+DEFAULT_SNAPSHOT_CACHE = 4  # pages kept for boundary-heal comparisons
+
+ListingResult = Tuple[Optional[List[dict]], bool]  # (entries or None to skip the page, abort_scrape)
+
+
+class ListingPrefetcher:
+    def __init__(
+        self,
+        load_page: Callable[[int], ListingResult],
+        lookahead: int = DEFAULT_LOOKAHEAD,
+        cache_size: int = DEFAULT_SNAPSHOT_CACHE,
+        log: Callable[[str], None] = print,
+    ):
+        self.load_page = load_page
+        self.lookahead = max(0, lookahead)
+        self.cache_size = cache_size
+        self.log = log
+        self._snapshots: "OrderedDict[int, List[dict]]" = OrderedDict()
+        self._queue = queue.Queue(maxsize=self.lookahead or 1)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._generation = 0
+        self._next_page = None
+        self._expected_page = None
+        self._thread = None
+        self.waits = 0  # times the consumer found the queue empty
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                generation, page_num = self._generation, self._next_page
+                self._next_page += 1
+            try:
+                entries, abort = self.load_page(page_num)
+            except Exception as e:
+                self.log(f"❌ Listing prefetch failed for page {page_num}: {str(e)}")
+                entries, abort = None, False
+            delivered = False
+            while not self._stop.is_set():
+                with self._lock:
+                    if generation != self._generation:
+                        break  # consumer moved elsewhere; drop this page
+                try:
+                    self._queue.put((generation, page_num, entries, abort), timeout=0.5)
+                    delivered = True
+                    break
+                except queue.Full:
+                    continue
+            if abort and delivered:
+                # Nothing further is loaded after an abort unless the consumer restarts elsewhere
+                while not self._stop.is_set() and generation == self._generation:
+                    self._stop.wait(0.5)
+
+    def _restart(self, page_num: int):
+        """Point the producer at page_num, discarding anything it queued for other pages."""
+        with self._lock:
+            self._generation += 1
+            self._next_page = page_num
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True, name="listing-prefetch")
+            self._thread.start()
+
+    def get(self, page_num: int) -> ListingResult:
+        """Return (entries, abort) for page_num, loading it inline when prefetching is off."""
+        if self.lookahead == 0:
+            entries, abort = self.load_page(page_num)
+        else:
+            if page_num != self._expected_page:
+                if self._expected_page is not None:
+                    self.log(f"🔄 Listing prefetch jumping from page {self._expected_page} to {page_num}")
+                self._restart(page_num)
+            while True:
+                if self._queue.empty():
+                    self.waits += 1
+                generation, queued_page, entries, abort = self._queue.get()
+                with self._lock:
+                    current = generation == self._generation
+                if current and queued_page == page_num:
+                    break
+        self._expected_page = page_num + 1
+        if entries is not None:
+            self.remember(page_num, entries)
+        return entries, abort
+
+    def remember(self, page_num: int, entries: List[dict]) -> None:
+        """Store the rows the consumer actually used for page_num (e.g. after a boundary heal)."""
+        self._snapshots[page_num] = entries
+        self._snapshots.move_to_end(page_num)
+        while len(self._snapshots) > self.cache_size:
+            self._snapshots.popitem(last=False)
+
+    def snapshot(self, page_num: int) -> Optional[List[dict]]:
+        return self._snapshots.get(page_num)
+
+    def close(self):
+        """Stop the producer; a page load already in flight is abandoned."""
+        self._stop.set()
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=30)
@@ -0,0 +1,132 @@
+"""
+Buffered All_Outputs.csv logging for the scrapers.
+
+Every script's print_to_csv used to open All_Outputs.csv, build a csv.writer, write one
+row and close the file again for each message, and a 5000 Pop and Top run logs tens of
+thousands of them. OutputLog keeps the file open and hands rows to a background writer
+thread through a bounded queue (a caller only blocks if the writer falls that far
+behind), flushing to disk every second or so and whenever the queue runs dry. Messages
+carry a level, so the per-film DEBUG lines can be left out of normal runs.
+
+Each process gets its own OutputLog per file; they are flushed and closed when the
+process exits, worker processes included.
+"""
+
+import csv
+import os
+import queue
+import threading
+import time
+from multiprocessing.util import Finalize
+from typing import Dict, Set, Tuple, Union
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVELS = {'DEBUG': DEBUG, 'INFO': INFO, 'WARNING': WARNING, 'ERROR': ERROR}
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_FLUSH_INTERVAL = 1.0  # seconds
+
+_STOP = object()
+
+
+def parse_level(level: Union[int, str]) -> int:
+    """'DEBUG' / 'INFO' / ... or a number -> numeric level."""
+    if isinstance(level, int):
+        return level
+    return LEVELS[str(level).strip().upper()]
+
+
+class OutputLog:
+    def __init__(self, path: str, level: Union[int, str] = INFO, max_queue: int = DEFAULT_QUEUE_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.path = path
+        self.level = parse_level(level)
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._file = open(path, mode='a', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"output-log:{os.path.basename(path)}", daemon=True)
+        self._thread.start()
+
+    def emit(self, message: str, level: int = INFO, prefix: str = '') -> None:
+        """Print message (with an optional terminal-only prefix) and queue it for the file."""
+        if level < self.level:
+            return
+        print(prefix + message)
+        if self._closed:
+            return
+        self._queue.put(message)
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            try:
+                if item is _STOP:
+                    self._file.flush()
+                    return
+                if item is not None:
+                    self._writer.writerow([item])
+                if self._queue.empty() or time.monotonic() - last_flush >= self.flush_interval:
+                    self._file.flush()
+                    last_flush = time.monotonic()
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Could not write to {self.path}: {str(e)}")
+            finally:
+                if item is not None:
+                    self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued message is on disk."""
+        if not self._closed:
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+
+
+_logs: Dict[Tuple[int, str], OutputLog] = {}
+_logs_lock = threading.Lock()
+_finalized_pids: Set[int] = set()
+
+
+def output_log(path: str, level: Union[int, str] = INFO) -> OutputLog:
+    """This process's OutputLog for path, opened on first use."""
+    key = (os.getpid(), os.path.abspath(path))
+    log = _logs.get(key)
+    if log is None:
+        with _logs_lock:
+            log = _logs.get(key)
+            if log is None:
+                log = _logs[key] = OutputLog(path, level=level)
+                if key[0] not in _finalized_pids:
+                    # Runs at interpreter exit, and at the end of multiprocessing workers, where atexit does not
+                    Finalize(None, close_output_logs, exitpriority=0)
+                    _finalized_pids.add(key[0])
+    return log
+
+
+def flush_output_logs() -> None:
+    """Write out everything queued so far, e.g. before another writer appends to the same file."""
+    for (pid, _), log in list(_logs.items()):
+        if pid == os.getpid():
+            log.flush()
+
+
+def close_output_logs() -> None:
+    for (pid, path), log in list(_logs.items()):
+        if pid == os.getpid():
+            log.close()
+            _logs.pop((pid, path), None)
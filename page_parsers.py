@@ -0,0 +1,127 @@
+"""
+HTML parsers for the requests-based scrapers.
+
+Update JSONs, Official Lists Updates, Comedy 100 and BoxOfficeMojo 250s each parsed the
+pages they fetch inline, in the same function as the HTTP request, so the parsing could
+not be run or timed on its own. These functions take the page HTML and return plain data;
+the scripts call them after fetching, and "Benchmark Parsers.py" runs them over the saved
+pages in benchmark_fixtures/ to measure them offline.
+"""
+
+import json
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+
+def split_display_name(name: str) -> Tuple[str, str]:
+    """'Citizen Kane (1941)' -> ('Citizen Kane', '1941'); names without a year come back with ''."""
+    if '(' in name and ')' in name:
+        return name[:name.rindex('(')].strip(), name[name.rindex('(') + 1:name.rindex(')')]
+    return name, ''
+
+
+def poster_item_link(li) -> Optional[str]:
+    """Film path of an li.posteritem: the react-component data attributes, else its first /film/ link."""
+    inner_div = li.find('div', class_='react-component')
+    film_url = (inner_div.get('data-target-link') or inner_div.get('data-item-link')) if inner_div else None
+    if not film_url:
+        anchor = li.find('a', href=True)
+        if anchor:
+            film_url = anchor['href']
+    if not film_url:
+        film_link = li.find('a', href=lambda x: x and '/film/' in x)
+        if film_link:
+            film_url = film_link['href']
+    return film_url
+
+
+def _list_number(tag) -> Optional[int]:
+    """A ranked list's p.list-number as an int; None when it is missing or not a number."""
+    if not tag:
+        return None
+    try:
+        return int(tag.text.strip().replace(',', ''))
+    except ValueError:
+        return None
+
+
+def parse_poster_list(html) -> Tuple[Optional[List[Dict]], bool]:
+    """
+    A Letterboxd list or films page -> (items, has_next). Each item has url, display_name
+    ('Title (Year)' when the page provides it), film_id and list_number (ranked lists only).
+    items is None when the page has no ul.poster-list at all.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    has_next = soup.find('a', class_='next') is not None
+    film_list = soup.find('ul', class_='poster-list')
+    if not film_list:
+        return None, has_next
+
+    items = []
+    for li in film_list.find_all('li', class_='posteritem'):
+        inner_div = li.find('div', class_='react-component')
+        list_number_tag = li.find('p', class_='list-number')
+        items.append({
+            'url': poster_item_link(li),
+            'display_name': (inner_div.get('data-item-full-display-name') or inner_div.get('data-item-name')) if inner_div else None,
+            'film_id': (inner_div.get('data-film-id') if inner_div else None) or li.get('data-film-id'),
+            'list_number': _list_number(list_number_tag),
+        })
+    return items, has_next
+
+
+def parse_og_title(html) -> Optional[Dict]:
+    """A film page -> {'display_name', 'title', 'year', 'film_id'} from og:title and the poster; None without og:title."""
+    soup = BeautifulSoup(html, 'html.parser')
+    og_title = soup.find('meta', property='og:title')
+    if not og_title:
+        return None
+    display_name = og_title['content']
+    title, year = split_display_name(display_name)
+    film_poster_div = soup.find('div', class_='film-poster')
+    return {
+        'display_name': display_name,
+        'title': title,
+        'year': year,
+        'film_id': film_poster_div.get('data-film-id') if film_poster_div else None,
+    }
+
+
+def json_ld_rating_count(html) -> int:
+    """aggregateRating.ratingCount from a film page's JSON-LD block; 0 if it is missing or unreadable."""
+    soup = BeautifulSoup(html, 'html.parser')
+    json_ld = soup.find('script', type='application/ld+json')
+    if not json_ld or not json_ld.string:
+        return 0
+    try:
+        json_text = json_ld.string.strip()
+        if '/* <![CDATA[ */' in json_text:
+            json_text = json_text.replace('/* <![CDATA[ */', '').replace('/* ]]> */', '')
+        return json.loads(json_text).get('aggregateRating', {}).get('ratingCount', 0)
+    except (json.JSONDecodeError, KeyError):
+        return 0
+
+
+def parse_boxofficemojo_chart(html) -> List[Tuple[int, str, str]]:
+    """A BoxOfficeMojo chart page -> [(rank, title, year), ...] in page order; incomplete rows are skipped."""
+    soup = BeautifulSoup(html, 'html.parser')
+    movies = []
+    for row in soup.select('table.mojo-body-table tr:has(td.mojo-field-type-rank)'):
+        try:
+            rank_element = row.select_one('td.mojo-field-type-rank')
+            title_element = row.select_one('td.mojo-field-type-title a')
+            year_cell = row.select_one('td.mojo-field-type-year')
+
+            # Try to get year from link first, if not found get direct text
+            year = None
+            if year_cell:
+                year_link = year_cell.select_one('a')
+                year = year_link.text.strip() if year_link else year_cell.text.strip()
+
+            if not all([rank_element, title_element, year]):
+                continue
+            movies.append((int(rank_element.text.strip()), title_element.text.strip(), year))
+        except (ValueError, IndexError, AttributeError):
+            continue
+    return movies
@@ -0,0 +1,219 @@
+"""
+Shared per-host token-bucket rate limiter.
+
+Request pacing used to be a mix of fixed sleeps (HUMAN_DELAY_* constants, random 1.0-1.5 s
+waits, sleep(1) between pages, polite_sleep). RateLimiter replaces them with one token bucket
+per host: requests go out as fast as `rate` per second allows, with up to `burst` back to
+back. A 429 (or a 503 carrying Retry-After) blocks the whole host for the time the server
+asked for. Bucket state lives in a small SQLite file, so scrapers running in parallel threads
+or processes share the same budget for letterboxd.com.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from site_urls import site_url
+
+# host -> (requests per second, burst)
+DEFAULT_LIMITS: Dict[str, Tuple[float, int]] = {
+    'letterboxd.com': (5.0, 10),
+    'api.themoviedb.org': (20.0, 40),  # TMDB allows roughly 50/s
+    'boxofficemojo.com': (2.0, 4),
+}
+FALLBACK_LIMIT = (5.0, 10)
+DEFAULT_BACKOFF = 30.0  # seconds to block a host on a 429 without a usable Retry-After
+MAX_BACKOFF = 600.0
+
+# Shared across processes unless RATE_LIMIT_DB points somewhere else ('' keeps state in-process)
+DEFAULT_DB_PATH = os.environ.get('RATE_LIMIT_DB', os.path.join(tempfile.gettempdir(), 'letterboxd_rate_limits.sqlite3'))
+
+
+def host_of(url_or_host: str) -> str:
+    host = urlparse(url_or_host).hostname if '://' in url_or_host else url_or_host
+    host = (host or url_or_host).lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delay-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    def __init__(self, db_path: Optional[str] = DEFAULT_DB_PATH, limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 log: Callable[[str], None] = print):
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.log = log
+        self.waited = Counter()  # host -> seconds spent waiting
+        self.throttled = Counter()  # host -> 429s seen
+        self._lock = threading.Lock()
+        self._local: Dict[str, Tuple[float, float, float]] = {}  # host -> (tokens, updated_at, blocked_until)
+        self.conn = None
+        if db_path:
+            self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS buckets (
+                    host TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    blocked_until REAL NOT NULL
+                )
+                """
+            )
+
+    def configure(self, host: str, rate: float, burst: int) -> None:
+        self.limits[host_of(host)] = (rate, burst)
+
+    def limit_for(self, host: str) -> Tuple[float, int]:
+        return self.limits.get(host, FALLBACK_LIMIT)
+
+    def _update(self, host: str, change: Callable[[float, float, float, float], Tuple[float, float, float]]) -> float:
+        """Refill the bucket, then apply change(tokens, blocked_until, now, rate) -> (tokens, blocked_until, wait) atomically."""
+        rate, burst = self.limit_for(host)
+        with self._lock:
+            now = time.time()
+            if self.conn is None:
+                tokens, updated_at, blocked_until = self._local.get(host, (burst, now, 0.0))
+                tokens = min(burst, tokens + (now - updated_at) * rate)
+                tokens, blocked_until, wait = change(tokens, blocked_until, now, rate)
+                self._local[host] = (tokens, now, blocked_until)
+                return wait
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self.conn.execute(
+                    'SELECT tokens, updated_at, blocked_until FROM buckets WHERE host = ?', (host,)
+                ).fetchone()
+                tokens, updated_at, blocked_until = row if row else (burst, now, 0.0)
+                tokens = min(burst, tokens + max(0.0, now - updated_at) * rate)
+                tokens, blocked_until, wait = change(tokens, blocked_until, now, rate)
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO buckets (host, tokens, updated_at, blocked_until) VALUES (?, ?, ?, ?)',
+                    (host, tokens, now, blocked_until),
+                )
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+            return wait
+
+    def acquire(self, url_or_host: str) -> float:
+        """Block until a request to this host is allowed. Returns the seconds waited."""
+        host = host_of(url_or_host)
+
+        def take(tokens, blocked_until, now, rate):
+            if now < blocked_until:
+                return tokens, blocked_until, blocked_until - now
+            if tokens >= 1:
+                return tokens - 1, blocked_until, 0.0
+            return tokens, blocked_until, (1 - tokens) / rate
+
+        waited = 0.0
+        while True:
+            wait = self._update(host, take)
+            if wait <= 0:
+                break
+            time.sleep(wait)
+            waited += wait
+        if waited:
+            with self._lock:
+                self.waited[host] += waited
+        return waited
+
+    def block(self, url_or_host: str, seconds: float) -> None:
+        """Stop all requests to the host (in every process sharing the state) for `seconds`."""
+        host = host_of(url_or_host)
+        seconds = min(seconds, MAX_BACKOFF)
+        self._update(host, lambda tokens, blocked_until, now, rate: (0.0, max(blocked_until, now + seconds), 0.0))
+        self.log(f"⏳ Rate limited by {host}; pausing requests to it for {seconds:.0f}s")
+
+    def observe(self, url: str, response: requests.Response) -> bool:
+        """Honour 429 / Retry-After on a response. Returns True if the request should be retried."""
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if response.status_code == 429 or (response.status_code == 503 and retry_after is not None):
+            host = host_of(url)
+            with self._lock:
+                self.throttled[host] += 1
+                strikes = self.throttled[host]
+            self.block(host, retry_after if retry_after is not None else DEFAULT_BACKOFF * min(strikes, 8))
+            return True
+        return False
+
+    def summary(self) -> str:
+        hosts = sorted(set(self.waited) | set(self.throttled))
+        if not hosts:
+            return "Rate limiter: no waits"
+        parts = [f"{host}: waited {self.waited[host]:.1f}s, {self.throttled[host]} x 429" for host in hosts]
+        return "Rate limiter: " + "; ".join(parts)
+
+    def close(self):
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except sqlite3.Error:
+                pass
+
+
+class RateLimitedSession(requests.Session):
+    """
+    requests.Session that paces every request through a RateLimiter and retries on 429.
+    With a concurrency controller (adaptive_concurrency.AimdController) each request also
+    holds one of its slots and reports how it went.
+    """
+
+    def __init__(self, limiter: Optional[RateLimiter] = None, max_rate_limit_retries: int = 5, concurrency=None):
+        super().__init__()
+        self.limiter = limiter or get_rate_limiter()
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.concurrency = concurrency
+
+    def _send_once(self, method, url, *args, **kwargs):
+        if self.concurrency is None:
+            return super().request(method, url, *args, **kwargs)
+        with self.concurrency.slot() as slot:
+            response = super().request(method, url, *args, **kwargs)
+            slot.response(response)
+            return response
+
+    def request(self, method, url, *args, **kwargs):
+        # Paced by the production host even when site_urls redirects the request to a stand-in
+        target = site_url(url)
+        for attempt in range(self.max_rate_limit_retries + 1):
+            self.limiter.acquire(url)
+            response = self._send_once(method, target, *args, **kwargs)
+            if attempt == self.max_rate_limit_retries or not self.limiter.observe(url, response):
+                return response
+        return response
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter(log: Optional[Callable[[str], None]] = None) -> RateLimiter:
+    """Process-wide limiter backed by the shared state file."""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter(DEFAULT_DB_PATH or None, log=log or print)
+        elif log is not None:
+            _default_limiter.log = log
+        return _default_limiter
@@ -0,0 +1,110 @@
+"""
+Per-run film lists for 5000 Pop and Top, indexed for constant-time lookups.
+
+Each category list (the 5000 list, every MPAA rating, runtime band and continent) is a
+list of {'Title', 'Year', 'tmdbID', 'Link'} dicts in the order films were accepted. The
+scraper asks "has this URL been seen this session?" for every film on every listing page,
+and that used to be an any() scan over the 5000 list, so a full pass did O(n^2) work.
+FilmList keeps the entries in insertion order alongside a hash index on Link;
+RunState holds all of a pass's lists and the unmapped countries, and turns them into and
+out of the plain dicts stored in checkpoints.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+
+class FilmList:
+    def __init__(self, entries: Iterable[Dict] = ()):
+        self._entries: List[Dict] = []
+        self._links: Set[str] = set()
+        self.load(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self._entries)
+
+    def __getitem__(self, index):
+        return self._entries[index]
+
+    def contains_link(self, link: Optional[str]) -> bool:
+        return link in self._links
+
+    def has_room(self, limit: Optional[int]) -> bool:
+        return limit is None or len(self._entries) < limit
+
+    def add(self, title, year, tmdb_id, link: str, limit: Optional[int] = None) -> bool:
+        """Append a film unless its Link is already listed or the list has reached limit; True if added."""
+        if not link or link in self._links or not self.has_room(limit):
+            return False
+        self._append({'Title': title, 'Year': year, 'tmdbID': tmdb_id, 'Link': link})
+        return True
+
+    def _append(self, entry: Dict) -> None:
+        self._entries.append(entry)
+        if entry.get('Link'):
+            self._links.add(entry['Link'])
+
+    def truncate(self, limit: int) -> None:
+        """Keep only the first limit films."""
+        if len(self._entries) > limit:
+            self.load(self._entries[:limit])
+
+    def load(self, entries: Iterable[Dict]) -> None:
+        """Replace the contents, e.g. with the film_data list of a checkpoint."""
+        entries = list(entries)
+        self.clear()
+        for entry in entries:
+            self._append(dict(entry))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._links.clear()
+
+    def to_list(self) -> List[Dict]:
+        return list(self._entries)
+
+
+class RunState:
+    """Every category list of one pass, as {name: {'film_data': FilmList}} dicts per kind."""
+
+    def __init__(self, mpaa_ratings: Iterable[str], runtime_categories: Iterable[str], continents: Iterable[str]):
+        self.max_movies_5000 = {'film_data': FilmList()}
+        self.mpaa = {rating: {'film_data': FilmList()} for rating in mpaa_ratings}
+        self.runtime = {category: {'film_data': FilmList()} for category in runtime_categories}
+        self.continent = {continent: {'film_data': FilmList()} for continent in continents}
+        self.unmapped_countries: Set[str] = set()
+
+    def _groups(self) -> Dict[str, Dict[str, Dict]]:
+        return {'mpaa_stats': self.mpaa, 'runtime_stats': self.runtime, 'continent_stats': self.continent}
+
+    def seen(self, link: Optional[str]) -> bool:
+        """Whether a film URL is already on this session's 5000 list."""
+        return self.max_movies_5000['film_data'].contains_link(link)
+
+    def clear(self) -> None:
+        self.max_movies_5000['film_data'].clear()
+        for group in self._groups().values():
+            for stats in group.values():
+                stats['film_data'].clear()
+        self.unmapped_countries.clear()
+
+    def checkpoint_state(self) -> Dict:
+        state = {
+            key: {name: {'film_data': stats['film_data'].to_list()} for name, stats in group.items()}
+            for key, group in self._groups().items()
+        }
+        state['max_movies_5000_stats'] = {'film_data': self.max_movies_5000['film_data'].to_list()}
+        state['unmapped_countries'] = sorted(self.unmapped_countries)
+        return state
+
+    def restore(self, state: Dict) -> None:
+        """Load a checkpoint_state() dict back in place; categories the scraper no longer has are ignored."""
+        for key, group in self._groups().items():
+            for name, saved in state.get(key, {}).items():
+                if name in group:
+                    group[name]['film_data'].load(saved.get('film_data', []))
+        self.max_movies_5000['film_data'].load(state['max_movies_5000_stats'].get('film_data', []))
+        self.unmapped_countries.clear()
+        self.unmapped_countries.update(state.get('unmapped_countries', []))
@@ -0,0 +1,76 @@
+"""
+Crash-safe checkpoints for long scrapes.
+
+5000 Pop and Top keeps hours of progress in memory: the per-category film lists and
+counters, the page it has reached, and the processor's approved/rejected rows. A crash
+or a closed terminal used to lose all of it. ScrapeCheckpoint writes that state to a
+JSON file after each listing page (temp file + atomic rename, so a crash mid-write keeps
+the previous checkpoint), and the scraper can load it on the next run to continue from
+that page instead of from page 1.
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Dict, Optional
+
+CHECKPOINT_VERSION = 1
+
+
+def _encode(value):
+    """json.dump fallback: sets become lists, numpy/pandas scalars become Python values."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class ScrapeCheckpoint:
+    def __init__(self, path: str, log: Callable[[str], None] = print):
+        self.path = path
+        self.log = log
+        self.saves = 0
+
+    def save(self, state: Dict) -> bool:
+        """Atomically replace the checkpoint file with state. Returns False (and logs) on failure."""
+        payload = dict(state, version=CHECKPOINT_VERSION, saved_at=time.time())
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.checkpoint-', suffix='.json', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(payload, file, default=_encode)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.path)
+            self.saves += 1
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            self.log(f"⚠️ Could not write checkpoint {self.path}: {str(e)}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def load(self) -> Optional[Dict]:
+        """Return the saved state, or None if there is no usable checkpoint."""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError) as e:
+            self.log(f"⚠️ Ignoring unreadable checkpoint {self.path}: {str(e)}")
+            return None
+        if state.get('version') != CHECKPOINT_VERSION:
+            self.log(f"⚠️ Ignoring checkpoint {self.path} from an older version of the scraper")
+            return None
+        return state
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
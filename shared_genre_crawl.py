@@ -0,0 +1,116 @@
+"""
+Helpers for building every genre's top list from one ranked crawl.
+
+Genre 250s used to walk /films/genre/{genre}/by/{sort}/ once per genre, so a Drama/Crime/
+Thriller film was loaded and checked three times per sort. A genre page is the same ranking
+as /films/by/{sort}/ filtered to that genre, so one walk of the full ranking can feed every
+genre: GenreTopLists takes films in rank order with their Letterboxd genres and appends each
+one to every target genre that is not full yet. Genres come from the whitelist's cached
+Information; films outside the whitelist are checked once and their verdict (with the
+parsed page) is kept in FilmVerdictCache until it goes stale.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_VERDICT_TTL_DAYS = 14  # rating counts move, so re-check non-whitelisted films every couple of weeks
+
+
+def genre_slug(name: str) -> str:
+    """Letterboxd genre name -> URL slug ('Science Fiction' -> 'science-fiction')."""
+    return name.strip().lower().replace(' ', '-')
+
+
+class GenreTopLists:
+    def __init__(self, genres: Iterable[str], limit: int):
+        self.limit = limit
+        self.lists: "OrderedDict[str, List[Dict]]" = OrderedDict((genre, []) for genre in genres)
+        # Films that were denied for reasons outside our criteria, per genre that was still open
+        self.denied: Dict[str, List[Dict]] = {genre: [] for genre in self.lists}
+
+    def open_genres(self, genre_names: Iterable[str]) -> List[str]:
+        """Target genres among genre_names whose list still has room."""
+        slugs = {genre_slug(name) for name in genre_names}
+        return [genre for genre, films in self.lists.items() if genre in slugs and len(films) < self.limit]
+
+    def offer(self, entry: Dict, genre_names: Iterable[str]) -> List[str]:
+        """Append an accepted film to every open target genre it belongs to; returns those genres."""
+        added = self.open_genres(genre_names)
+        for genre in added:
+            self.lists[genre].append(entry)
+        return added
+
+    def deny(self, entry: Dict, genre_names: Iterable[str]) -> None:
+        for genre in self.open_genres(genre_names):
+            self.denied[genre].append(entry)
+
+    def is_full(self, genre: str) -> bool:
+        return len(self.lists[genre]) >= self.limit
+
+    @property
+    def complete(self) -> bool:
+        return all(len(films) >= self.limit for films in self.lists.values())
+
+    def unfilled(self) -> List[str]:
+        return [genre for genre, films in self.lists.items() if len(films) < self.limit]
+
+    def progress(self) -> str:
+        return ', '.join(f"{genre} {len(films)}" for genre, films in self.lists.items())
+
+
+class FilmVerdictCache:
+    """Per-film verdicts for films outside the whitelist, keyed on the Letterboxd URL, with a TTL."""
+
+    def __init__(self, db_path: str, ttl_days: float = DEFAULT_VERDICT_TTL_DAYS):
+        self.ttl = ttl_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS film_verdicts (
+                    link TEXT PRIMARY KEY,
+                    verdict TEXT NOT NULL,
+                    reason TEXT,
+                    data TEXT,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+
+    def get(self, link: str) -> Optional[Tuple[str, Optional[str], Dict]]:
+        """Return (verdict, reason, page data) for a fresh entry, or None when missing or stale."""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT verdict, reason, data, fetched_at FROM film_verdicts WHERE link = ?', (link,)
+            ).fetchone()
+            if row is not None and time.time() - row[3] < self.ttl:
+                self.hits += 1
+                return row[0], row[1], json.loads(row[2] or '{}')
+            self.misses += 1
+            return None
+
+    def put(self, link: str, verdict: str, reason: Optional[str], data: Optional[Dict]) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO film_verdicts (link, verdict, reason, data, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                (link, verdict, reason, json.dumps(data or {}), time.time()),
+            )
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return f"Film verdict cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate)"
+
+    def close(self):
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,65 @@
+"""
+Configurable base URLs for the sites the scrapers talk to.
+
+The scrapers build URLs against https://letterboxd.com, https://api.themoviedb.org and
+https://www.boxofficemojo.com, and publish through https://api.github.com, so they could
+only ever run against the real sites. Setting LETTERBOXD_BASE_URL, TMDB_BASE_URL,
+BOXOFFICEMOJO_BASE_URL or GITHUB_API_URL (e.g. to the ports printed by "Mock Site
+Server.py") sends the traffic elsewhere. The scripts keep working with the
+production URLs - those are what they store, compare and write out - and site_url() swaps
+in the configured base just before a request or driver.get(); canonical_url() maps URLs
+read back from a served page (hrefs, current_url) to their production form.
+"""
+
+import os
+from typing import Dict, Optional
+
+PRODUCTION_BASE_URLS: Dict[str, str] = {
+    'letterboxd': 'https://letterboxd.com',
+    'tmdb': 'https://api.themoviedb.org',
+    'boxofficemojo': 'https://www.boxofficemojo.com',
+    'github': 'https://api.github.com',
+}
+BASE_URL_ENV_VARS: Dict[str, str] = {
+    'letterboxd': 'LETTERBOXD_BASE_URL',
+    'tmdb': 'TMDB_BASE_URL',
+    'boxofficemojo': 'BOXOFFICEMOJO_BASE_URL',
+    'github': 'GITHUB_API_URL',
+}
+
+
+def base_url(site: str) -> str:
+    """Configured base URL of a site ('letterboxd', 'tmdb' or 'boxofficemojo'), without a trailing slash."""
+    return (os.environ.get(BASE_URL_ENV_VARS[site]) or PRODUCTION_BASE_URLS[site]).rstrip('/')
+
+
+def _overrides() -> Dict[str, str]:
+    """production base -> configured base, for the sites that are redirected."""
+    return {
+        production: base_url(site)
+        for site, production in PRODUCTION_BASE_URLS.items()
+        if base_url(site) != production
+    }
+
+
+def _swap_prefix(url: Optional[str], mapping: Dict[str, str]) -> Optional[str]:
+    if not url or not mapping:
+        return url
+    for old, new in mapping.items():
+        # Also accept http:// and the www./bare variants the scripts use interchangeably
+        bare_old = old.split('://', 1)[1]
+        for variant in (old, 'http://' + bare_old, 'https://www.' + bare_old, 'https://' + bare_old.replace('www.', '', 1)):
+            if url == variant or url.startswith(variant + '/') or url.startswith(variant + '?'):
+                return new + url[len(variant):]
+    return url
+
+
+def site_url(url: Optional[str]) -> Optional[str]:
+    """The URL to actually request: production URLs are moved onto their configured base."""
+    return _swap_prefix(url, _overrides())
+
+
+def canonical_url(url: Optional[str]) -> Optional[str]:
+    """The production form of a URL read from a served page; production URLs pass through unchanged."""
+    return _swap_prefix(url, {configured: production for production, configured in _overrides().items()})
+
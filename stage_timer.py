@@ -0,0 +1,110 @@
+"""
+Wall-clock timing of the stages of a scrape.
+
+A 5000 Pop and Top pass runs for hours. Without measurements it is guesswork whether the
+time goes on page loads, element waits, in-page extraction, TMDB calls, workbook writes
+or retry sleeps. StageTimer records one duration per stage execution, via the stage()
+context manager, the timed() decorator or sleep(), and summarises each stage as count,
+total, p50, p95 and max. The summary can be written as a text report and as JSON.
+Recording takes a lock, so browser pool threads can share one timer.
+"""
+
+import json
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from typing import Dict, List, Optional
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StageTimer:
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[name].append(seconds)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name: Optional[str] = None):
+        """Decorator recording every call of a function under name (default: the function's name)."""
+        def decorator(func):
+            stage_name = name or func.__name__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(stage_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def sleep(self, seconds: float, name: str = 'retry_sleep') -> None:
+        """time.sleep, counted as a stage so backoff waits show up in the report."""
+        with self.stage(name):
+            time.sleep(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """{stage: {count, total, p50, p95, max}}, stages ordered by total time, largest first."""
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+        stats = {
+            name: {
+                'count': len(values),
+                'total': sum(values),
+                'p50': _percentile(values, 0.50),
+                'p95': _percentile(values, 0.95),
+                'max': values[-1],
+            }
+            for name, values in samples.items() if values
+        }
+        return dict(sorted(stats.items(), key=lambda item: item[1]['total'], reverse=True))
+
+    def report_lines(self, title: str) -> List[str]:
+        stats = self.summary()
+        elapsed = time.time() - self.started_at
+        lines = [
+            f"{title} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Wall time: {elapsed:.1f}s (stages can overlap when browser workers run in parallel)",
+            '',
+            f"{'Stage':<32}{'Count':>9}{'Total (s)':>13}{'p50 (s)':>11}{'p95 (s)':>11}{'Max (s)':>11}",
+        ]
+        for name, s in stats.items():
+            lines.append(f"{name:<32}{s['count']:>9}{s['total']:>13.1f}{s['p50']:>11.3f}{s['p95']:>11.3f}{s['max']:>11.3f}")
+        return lines
+
+    def write_report(self, text_path: str, json_path: str, title: str) -> None:
+        """Overwrite text_path with the readable report and json_path with the same numbers."""
+        with open(text_path, mode='w', encoding='utf-8') as file:
+            file.write('\n'.join(self.report_lines(title)) + '\n')
+        with open(json_path, mode='w', encoding='utf-8') as file:
+            json.dump({
+                'title': title,
+                'started_at': self.started_at,
+                'written_at': time.time(),
+                'stages': self.summary(),
+            }, file, indent=2)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+        self.started_at = time.time()
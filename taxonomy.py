@@ -0,0 +1,149 @@
+"""
+Film taxonomy shared by the scrapers: MPAA ratings, runtime bands and continents.
+
+The MPAA alias table, the runtime thresholds and the country -> continent table used to
+be repeated in 5000 Pop and Top, Genre 250s and film_page_fetcher, and continents were
+found by scanning every continent's country list with a case-insensitive any() for each
+country of each film. The lookup indexes here are built once at import with normalised
+keys, so each one is a dict lookup, and film_categories() returns every list a film
+belongs to in one call.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+# Letterboxd certificates for USA releases -> the rating list they count towards
+MPAA_RATINGS = ('G', 'PG', 'PG-13', 'R', 'NC-17')
+MPAA_ALIASES = {
+    'G': 'G',
+    'PG': 'PG',
+    'PG-13': 'PG-13',
+    'R': 'R',
+    'NC-17': 'NC-17',
+    'X': 'NC-17',  # Historical rating
+    'M': 'PG',     # Historical rating
+    'GP': 'PG',    # Historical rating
+}
+UNRATED = frozenset({'NR', 'NOT RATED', 'UNRATED'})
+
+# Runtime lists in the order they are saved; the official ones only exist for the rating pass
+RUNTIME_CATEGORIES = (
+    '90_Minutes_or_Less',
+    '2_Hours_or_Less',
+    '3_Hours_or_Greater',
+    '4_Hours_or_Greater',
+    '100_Minutes_or_Less',
+    '150_Minutes_or_More',
+)
+OFFICIAL_RUNTIME_CATEGORIES = frozenset({'100_Minutes_or_Less', '150_Minutes_or_More'})
+
+# Letterboxd genre names, used to spot a genre that ended up in a film's country list
+GENRE_NAMES = frozenset({
+    'Action', 'Adventure', 'Animation', 'Comedy', 'Crime', 'Documentary', 'Drama', 'Family', 'Fantasy',
+    'History', 'Horror', 'Music', 'Mystery', 'Romance', 'Science Fiction', 'Thriller', 'TV Movie', 'War', 'Western',
+})
+
+# Countries are matched case-insensitively. A few (Armenia, Russia, Turkey...) are listed under both Asia and
+# Europe; the first continent listed wins, as it always has.
+CONTINENTS_COUNTRIES = {
+    'Africa': ['Ivory Coast', 'Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi', 'Cabo Verde', 'Cameroon', 'Central African Republic', 'Chad', 'Comoros', 'Congo, Democratic Republic of the', 'Congo, Republic of the', 'Djibouti', 'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia', 'Gabon', 'Gambia', 'Ghana', 'Guinea', 'Guinea-Bissau', 'Kenya', 'Lesotho', 'Liberia', 'Libya', 'Madagascar', 'Malawi', 'Mali', 'Mauritania', 'Mauritius', 'Morocco', 'Mozambique', 'Namibia', 'Niger', 'Nigeria', 'Rwanda', 'Sao Tome and Principe', 'Senegal', 'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan', 'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe', 'Congo'],
+    'Asia': ['State of Palestine', 'Hong Kong', 'Afghanistan', 'Armenia', 'Azerbaijan', 'Bahrain', 'Bangladesh', 'Bhutan', 'Brunei', 'Cambodia', 'China', 'Cyprus', 'Georgia', 'India', 'Indonesia', 'Iran', 'Iraq', 'Israel', 'Japan', 'Jordan', 'Kazakhstan', 'Kuwait', 'Kyrgyzstan', 'Laos', 'Lebanon', 'Malaysia', 'Maldives', 'Mongolia', 'Myanmar', 'Nepal', 'North Korea', 'Oman', 'Pakistan', 'Palestine', 'Philippines', 'Qatar', 'Russia', 'Saudi Arabia', 'Singapore', 'South Korea', 'Sri Lanka', 'Syrian Arab Republic', 'Taiwan', 'Tajikistan', 'Thailand', 'Timor-Leste', 'Turkey', 'Turkmenistan', 'United Arab Emirates', 'Uzbekistan', 'Vietnam', 'Yemen', 'Syria'],
+    'Europe': ['East Germany', 'North Macedonia', 'Yugoslavia', 'Serbia and Montenegro', 'Czechoslovakia', 'Czechia', 'USSR', 'Albania', 'Latvia', 'Andorra', 'Liechtenstein', 'Armenia', 'Lithuania', 'Austria', 'Luxembourg', 'Azerbaijan', 'Malta', 'Belarus', 'Moldova', 'Belgium', 'Monaco', 'Bosnia and Herzegovina', 'Montenegro', 'Bulgaria', 'Netherlands', 'Croatia', 'Norway', 'Cyprus', 'Poland', 'Czech Republic', 'Portugal', 'Denmark', 'Romania', 'Estonia', 'Russia', 'Finland', 'San Marino', 'Former Yugoslav Republic of Macedonia', 'Serbia', 'France', 'Slovakia', 'Georgia', 'Slovenia', 'Germany', 'Spain', 'Greece', 'Sweden', 'Hungary', 'Switzerland', 'Iceland', 'Ireland', 'Turkey', 'Italy', 'Ukraine', 'Kosovo', 'UK'],
+    'North America': ['Bahamas', 'Guadeloupe', 'Cuba', 'The Bahamas', 'Bermuda', 'Canada', 'The Caribbean', 'Clipperton Island', 'Greenland', 'Mexico', 'Saint Pierre and Miquelon', 'Turks and Caicos Islands', 'USA', 'United States', 'Belize', 'Costa Rica', 'El Salvador', 'Guatemala', 'Honduras', 'Nicaragua', 'Panama', 'Dominican Republic', 'Haiti', 'Jamaica', 'Martinique', 'Netherlands Antilles', 'Puerto Rico'],
+    'Oceania': ['Australia', 'Fiji', 'Kiribati', 'Marshall Islands', 'Micronesia', 'Nauru', 'New Zealand', 'Palau', 'Papua New Guinea', 'Samoa', 'Solomon Islands', 'Tonga', 'Tuvalu', 'Vanuatu', 'French Polynesia'],
+    'South America': ['Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana', 'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Bolivarian Republic of Venezuela', 'The Falkland Islands', 'South Georgia and the South Sandwich Islands', 'French Guiana', 'Venezuela'],
+}
+
+
+def _normalize(name: str) -> str:
+    return ' '.join(str(name).split()).lower()
+
+
+COUNTRY_TO_CONTINENT: Dict[str, str] = {}
+for _continent, _countries in CONTINENTS_COUNTRIES.items():
+    for _country in _countries:
+        COUNTRY_TO_CONTINENT.setdefault(_normalize(_country), _continent)
+del _continent, _countries, _country
+
+_MPAA_LOOKUP = {rating.upper(): target for rating, target in MPAA_ALIASES.items()}
+_GENRE_LOOKUP = frozenset(_normalize(genre) for genre in GENRE_NAMES)
+
+
+def normalize_mpaa(rating: Optional[str]) -> Optional[str]:
+    """Letterboxd USA certificate -> one of MPAA_RATINGS ('X' -> 'NC-17', 'GP' -> 'PG'); None if unrated or unknown."""
+    if not rating:
+        return None
+    key = rating.strip().upper()
+    if key in UNRATED:
+        return None
+    return _MPAA_LOOKUP.get(key)
+
+
+def first_mpaa_rating(ratings: Iterable[str]) -> Optional[str]:
+    """The first rated certificate among a film's USA releases, normalised, or None if they were all unrated."""
+    for rating in ratings:
+        normalized = normalize_mpaa(rating)
+        if normalized:
+            return normalized
+    return None
+
+
+def runtime_categories(runtime, include_official: bool = False) -> List[str]:
+    """Runtime lists a film of `runtime` minutes belongs to; the official bands only when include_official."""
+    if not isinstance(runtime, (int, float)) or not runtime:
+        return []
+    categories = []
+    if runtime < 91:
+        categories.append('90_Minutes_or_Less')
+    if runtime < 121:
+        categories.append('2_Hours_or_Less')
+    if runtime > 179:
+        categories.append('3_Hours_or_Greater')
+    if runtime > 239:
+        categories.append('4_Hours_or_Greater')
+    if include_official:
+        if runtime < 100:
+            categories.append('100_Minutes_or_Less')
+        if runtime > 150:
+            categories.append('150_Minutes_or_More')
+    return categories
+
+
+def continent_for_country(country: Optional[str]) -> Optional[str]:
+    if not country:
+        return None
+    return COUNTRY_TO_CONTINENT.get(_normalize(country))
+
+
+def continents_for_countries(countries: Iterable[str]) -> List[str]:
+    """Continents of a film's countries, each once, in the order the countries list them."""
+    continents = []
+    for country in countries or []:
+        continent = continent_for_country(country)
+        if continent and continent not in continents:
+            continents.append(continent)
+    return continents
+
+
+def looks_like_genre(name: Optional[str]) -> bool:
+    return bool(name) and _normalize(name) in _GENRE_LOOKUP
+
+
+def film_categories(info: Dict, include_official_runtime: bool = False) -> Dict:
+    """
+    Every category list a film's Information belongs to:
+    {'mpaa': rating or None, 'runtime': [...], 'continents': [...], 'unmapped_countries': [...]}.
+    """
+    continents = []
+    unmapped = []
+    for country in info.get('Countries') or []:
+        continent = continent_for_country(country)
+        if continent is None:
+            unmapped.append(country)
+        elif continent not in continents:
+            continents.append(continent)
+    return {
+        'mpaa': normalize_mpaa(info.get('MPAA')),
+        'runtime': runtime_categories(info.get('Runtime'), include_official_runtime),
+        'continents': continents,
+        'unmapped_countries': unmapped,
+    }
@@ -0,0 +1,89 @@
+"""
+Persistent cache of TMDB keyword/genre lookups.
+
+fetch_tmdb_details only needs a film's keywords and genres, which almost never change, yet
+every run asked TMDB again for every approved film. TmdbCache stores the parsed result per
+tmdb_id in SQLite with a TTL, remembers 404s for a shorter TTL, and counts hits/misses.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+DEFAULT_TTL_DAYS = 30  # keywords/genres rarely change
+DEFAULT_NEGATIVE_TTL_DAYS = 7  # re-check films TMDB did not know about
+
+TmdbDetails = Tuple[List[str], List[str]]
+
+
+class TmdbCache:
+    def __init__(self, db_path: str, ttl_days: float = DEFAULT_TTL_DAYS, negative_ttl_days: float = DEFAULT_NEGATIVE_TTL_DAYS):
+        self.db_path = db_path
+        self.ttl = ttl_days * 86400
+        self.negative_ttl = negative_ttl_days * 86400
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tmdb_details (
+                    tmdb_id TEXT PRIMARY KEY,
+                    found INTEGER NOT NULL,
+                    keywords TEXT,
+                    genres TEXT,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+
+    def get(self, tmdb_id: str) -> Tuple[bool, Optional[TmdbDetails]]:
+        """
+        Return (hit, details). details is (keywords, genres) for a cached film, or None
+        when TMDB returned 404 for it. A miss or expired entry returns (False, None).
+        """
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT found, keywords, genres, fetched_at FROM tmdb_details WHERE tmdb_id = ?', (str(tmdb_id),)
+            ).fetchone()
+            if row is not None:
+                found, keywords, genres, fetched_at = row
+                age = time.time() - fetched_at
+                if found and age < self.ttl:
+                    self.hits += 1
+                    return True, (json.loads(keywords), json.loads(genres))
+                if not found and age < self.negative_ttl:
+                    self.negative_hits += 1
+                    return True, None
+            self.misses += 1
+            return False, None
+
+    def put(self, tmdb_id: str, keywords: List[str], genres: List[str]) -> None:
+        self._store(tmdb_id, 1, json.dumps(keywords), json.dumps(genres))
+
+    def put_not_found(self, tmdb_id: str) -> None:
+        """Negatively cache a tmdb_id that TMDB answered with 404."""
+        self._store(tmdb_id, 0, None, None)
+
+    def _store(self, tmdb_id, found, keywords, genres):
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO tmdb_details (tmdb_id, found, keywords, genres, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                (str(tmdb_id), found, keywords, genres, time.time()),
+            )
+
+    def summary(self) -> str:
+        total = self.hits + self.negative_hits + self.misses
+        rate = (self.hits + self.negative_hits) / total * 100 if total else 0.0
+        return f"TMDB cache: {self.hits} hits, {self.negative_hits} cached 404s, {self.misses} misses ({rate:.1f}% hit rate)"
+
+    def close(self):
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,95 @@
+"""
+Pickled sidecar snapshots of already-parsed whitelist data.
+
+Parsing a whitelist (pd.read_excel plus json.loads on every row) dominates scraper start-up.
+A snapshot stores the parsed result next to its source together with the source's
+mtime/size/SHA-1, and is only reused while the source is unchanged.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Optional
+
+SNAPSHOT_FORMAT = 1
+
+
+def snapshot_path_for(source_path: str) -> str:
+    """Return the sidecar path used for a source file (whitelist.xlsx -> whitelist.snapshot.pkl)."""
+    return os.path.splitext(source_path)[0] + '.snapshot.pkl'
+
+
+def _sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_signature(path: str) -> dict:
+    """Return the mtime/size/hash signature of a file."""
+    stat = os.stat(path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha1': _sha1(path)}
+
+
+def _source_unchanged(source_path: str, signature: Optional[dict]) -> bool:
+    if signature is None:
+        return source_path is None
+    if source_path is None or not os.path.exists(source_path):
+        return False
+    stat = os.stat(source_path)
+    if stat.st_size != signature.get('size'):
+        return False
+    if stat.st_mtime_ns == signature.get('mtime_ns'):
+        return True
+    # Touched or re-saved without changes: only then pay for hashing the file
+    return _sha1(source_path) == signature.get('sha1')
+
+
+def load_snapshot(source_path: Optional[str], snapshot_path: Optional[str] = None, version: Any = None) -> Optional[Any]:
+    """
+    Return the payload stored for source_path, or None if there is no snapshot or it is stale.
+    version is an extra key for sources that are not plain files (e.g. a store revision).
+    """
+    snapshot_path = snapshot_path or snapshot_path_for(source_path)
+    if not os.path.exists(snapshot_path):
+        return None
+    try:
+        with open(snapshot_path, 'rb') as file:
+            data = pickle.load(file)
+    except Exception:
+        return None
+    if not isinstance(data, dict) or data.get('format') != SNAPSHOT_FORMAT:
+        return None
+    if data.get('version') != version:
+        return None
+    if not _source_unchanged(source_path, data.get('source')):
+        return None
+    return data.get('payload')
+
+
+def save_snapshot(source_path: Optional[str], payload: Any, snapshot_path: Optional[str] = None, version: Any = None) -> bool:
+    """Atomically write a snapshot of payload for source_path. Returns False if it could not be written."""
+    snapshot_path = snapshot_path or snapshot_path_for(source_path)
+    data = {
+        'format': SNAPSHOT_FORMAT,
+        'version': version,
+        'source': file_signature(source_path) if source_path else None,
+        'payload': payload,
+    }
+    # A temp file per writer: parallel passes saving at once must not write into each other's file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(snapshot_path)),
+                                    prefix=os.path.basename(snapshot_path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+        return True
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False